@@ -19,6 +19,7 @@ import argparse
 import json
 import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -57,6 +58,7 @@ except ImportError:
 
 from AgentQMS.agent_tools.compliance.validate_boundaries import BoundaryValidator  # noqa: E402
 from AgentQMS.agent_tools.utils.paths import ensure_within_project, get_project_root
+from AgentQMS.agent_tools.utils.profiling import RuleProfiler
 
 
 def load_artifact_rules() -> dict[str, Any] | None:
@@ -143,7 +145,15 @@ class ArtifactValidator:
         "deprecated",
     ]
 
-    def __init__(self, artifacts_root: str | Path | None = None, strict_mode: bool = True):
+    def __init__(
+        self,
+        artifacts_root: str | Path | None = None,
+        strict_mode: bool = True,
+        profiler: RuleProfiler | None = None,
+    ):
+        # Optional per-rule timing; None keeps the hot path free of timer calls
+        self.profiler = profiler
+
         # Default to the configured artifacts directory if none is provided
         if artifacts_root is None:
             from AgentQMS.agent_tools.utils.paths import get_artifacts_dir
@@ -547,6 +557,9 @@ class ArtifactValidator:
         except Exception as e:
             return False, f"Error reading file: {e}"
 
+        if self.profiler is not None:
+            self.profiler.add_bytes(len(content.encode("utf-8")))
+
         # Check for frontmatter
         if not content.startswith("---"):
             return False, "Missing frontmatter (file should start with '---')"
@@ -620,6 +633,8 @@ class ArtifactValidator:
         try:
             with open(file_path, encoding="utf-8") as f:
                 content = f.read()
+            if self.profiler is not None:
+                self.profiler.add_bytes(len(content.encode("utf-8")))
 
             if not content.startswith("---"):
                 return {}
@@ -696,6 +711,12 @@ class ArtifactValidator:
 
         return True, "Type consistency validated"
 
+    def _run_rule(self, rule: str, check, file_path: Path) -> tuple[bool, str]:
+        """Run one rule check, timing it when a profiler is attached."""
+        if self.profiler is None:
+            return check(file_path)
+        return self.profiler.time_rule(rule, check, file_path)
+
     def validate_single_file(self, file_path: Path, strict_mode: bool = None) -> dict:
         """Validate a single artifact file.
 
@@ -703,6 +724,16 @@ class ArtifactValidator:
             file_path: Path to the artifact file
             strict_mode: Override instance strict_mode setting. If None, uses self.strict_mode
         """
+        if self.profiler is None:
+            return self._validate_single_file(file_path, strict_mode)
+
+        start = time.perf_counter()
+        try:
+            return self._validate_single_file(file_path, strict_mode)
+        finally:
+            self.profiler.record_file(str(file_path), time.perf_counter() - start)
+
+    def _validate_single_file(self, file_path: Path, strict_mode: bool | None) -> dict:
         # Use instance strict_mode if not explicitly overridden
         if strict_mode is None:
             strict_mode = self.strict_mode
@@ -718,13 +749,13 @@ class ArtifactValidator:
             return result
 
         # Validate artifacts root location (must be in docs/artifacts/)
-        root_valid, root_msg = self.validate_artifacts_root(file_path)
+        root_valid, root_msg = self._run_rule("location", self.validate_artifacts_root, file_path)
         if not root_valid:
             result["valid"] = False
             result["errors"] += [f"Location: {root_msg}"]
 
         # Validate naming convention
-        naming_valid, naming_msg = self.validate_naming_convention(file_path)
+        naming_valid, naming_msg = self._run_rule("naming", self.validate_naming_convention, file_path)
         if not naming_valid:
             if strict_mode:
                 result["valid"] = False
@@ -733,7 +764,7 @@ class ArtifactValidator:
                 result["errors"] += [f"Naming (lenient): {naming_msg}"]
 
         # Validate directory placement
-        dir_valid, dir_msg = self.validate_directory_placement(file_path)
+        dir_valid, dir_msg = self._run_rule("directory", self.validate_directory_placement, file_path)
         if not dir_valid:
             if strict_mode:
                 result["valid"] = False
@@ -742,7 +773,7 @@ class ArtifactValidator:
                 result["errors"] += [f"Directory (lenient): {dir_msg}"]
 
         # Validate frontmatter
-        frontmatter_valid, frontmatter_msg = self.validate_frontmatter(file_path)
+        frontmatter_valid, frontmatter_msg = self._run_rule("frontmatter", self.validate_frontmatter, file_path)
         if not frontmatter_valid:
             if strict_mode:
                 result["valid"] = False
@@ -751,7 +782,7 @@ class ArtifactValidator:
                 result["errors"] += [f"Frontmatter (lenient): {frontmatter_msg}"]
 
         # Phase 2: Cross-validate frontmatter type with filename and directory
-        type_valid, type_msg = self.validate_type_consistency(file_path)
+        type_valid, type_msg = self._run_rule("type_consistency", self.validate_type_consistency, file_path)
         if not type_valid:
             if strict_mode:
                 result["valid"] = False
@@ -1058,6 +1089,11 @@ def main():
         action="store_true",
         help="Bypass strict validation mode for debugging (allows warnings without failures)",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report per-rule timings, slowest files and bytes read (printed to stderr)",
+    )
     parser.add_argument(
         "files",
         nargs="*",
@@ -1068,7 +1104,10 @@ def main():
 
     # Determine strict mode (inverse of lenient)
     strict_mode = not args.lenient_plugins
-    validator = ArtifactValidator(args.artifacts_root, strict_mode=strict_mode)
+    profiler = RuleProfiler() if args.profile else None
+    validator = ArtifactValidator(
+        args.artifacts_root, strict_mode=strict_mode, profiler=profiler
+    )
     artifacts_root = validator.artifacts_root
 
     if args.files:
@@ -1134,6 +1173,9 @@ def main():
     else:
         print(output)
 
+    if profiler is not None:
+        print(profiler.format_report(), file=sys.stderr)
+
     # Exit with error code if violations found
     if any(not r["valid"] for r in results):
         sys.exit(1)
@@ -9,15 +9,18 @@ import csv
 import json
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from .db import (
     DB_PATH,
+    INGEST_BATCH_SIZE,
     add_debug_note,
     add_experiment_run,
     add_plan_task,
     get_experiment_runs_export,
     get_plan_status,
+    ingest_experiment_runs,
     init_db,
     link_experiment_artifact,
     save_summary,
@@ -176,6 +179,25 @@ def cmd_exp_link(ns: argparse.Namespace) -> None:
     _print({"artifact_id": id_})
 
 
+def _read_jsonl(stream) -> Iterator[dict]:
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_no}: invalid JSON ({e.msg})") from None
+
+
+def cmd_exp_ingest(ns: argparse.Namespace) -> None:
+    if ns.file:
+        with open(ns.file, encoding="utf-8") as f:
+            totals = ingest_experiment_runs(_read_jsonl(f), ns.batch_size)
+    else:
+        totals = ingest_experiment_runs(_read_jsonl(sys.stdin), ns.batch_size)
+    _print(totals)
+
+
 def _generate_short_summary_text(points: list[str]) -> str:
     joined = "; ".join(p.strip() for p in points if p.strip())
     return joined[:280]
@@ -348,6 +370,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
     er.set_defaults(func=cmd_exp_run_add)
 
+    ei = esub.add_parser(
+        "ingest", help="Bulk-load runs from JSON lines (stdin or --file)"
+    )
+    ei.add_argument("--file", required=False, help="JSONL file instead of stdin")
+    ei.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE)
+    ei.set_defaults(func=cmd_exp_ingest)
+
     el = esub.add_parser("link", help="Link an artifact to an experiment")
     el.add_argument("key")
     el.add_argument("--type", required=True)
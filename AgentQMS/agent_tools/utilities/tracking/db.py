@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 from AgentQMS.agent_tools.utils.paths import get_project_root
 from AgentQMS.agent_tools.utils.runtime import ensure_project_root_on_sys_path
@@ -13,6 +18,21 @@ ensure_project_root_on_sys_path()
 
 DB_PATH = get_project_root() / "data/ops/tracking.db"
 
+# Connection tuning. WAL lets the dashboard read while a CLI process writes;
+# synchronous=NORMAL is durable under WAL except for the last commits on
+# power loss, which is fine for tracking data.
+BUSY_TIMEOUT_MS = int(os.getenv("TRACKING_DB_BUSY_TIMEOUT_MS", "5000"))
+MMAP_SIZE = int(os.getenv("TRACKING_DB_MMAP_SIZE", str(64 * 1024 * 1024)))
+CACHED_STATEMENTS = int(os.getenv("TRACKING_DB_CACHED_STATEMENTS", "256"))
+# Runs written per transaction by ingest_experiment_runs
+INGEST_BATCH_SIZE = int(os.getenv("TRACKING_INGEST_BATCH_SIZE", "2000"))
+
+# Connections are reused per thread: sqlite3 connections may not be shared
+# across threads, and opening one per call re-parses every statement.
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready: set[str] = set()
+
 
 def _utc_now_iso() -> str:
     return datetime.now(UTC).isoformat(timespec="seconds")
@@ -22,20 +42,70 @@ def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _thread_connections() -> dict[tuple[str, bool], sqlite3.Connection]:
+    # A forked child must not reuse its parent's connections
+    if getattr(_local, "pid", None) != os.getpid():
+        _local.pid = os.getpid()
+        _local.connections = {}
+    return _local.connections
+
+
+def _open(path: Path, readonly: bool) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        str(path), timeout=BUSY_TIMEOUT_MS / 1000, cached_statements=CACHED_STATEMENTS
+    )
+    conn.row_factory = sqlite3.Row
+    if not readonly:
+        # Persistent in the database file; readers pick it up from there
+        conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE};")
+    if readonly:
+        conn.execute("PRAGMA query_only = ON;")
+    return conn
+
+
 def get_connection(readonly: bool = False) -> sqlite3.Connection:
+    """
+    Shared connection to the tracking DB for the calling thread.
+
+    Use ``with conn:`` for a transaction; do not close the connection (see
+    ``close_connections``). The first writable connection to a database in
+    a process also brings its schema and indexes up to date.
+    """
     dsn = DB_PATH
     if readonly and not dsn.exists():
         raise FileNotFoundError(f"Tracking DB not found: {dsn}")
+    connections = _thread_connections()
+    conn = connections.get((str(dsn), readonly))
+    if conn is not None:
+        return conn
     _ensure_parent_dir(dsn)
-    conn = sqlite3.connect(str(dsn))
-    conn.row_factory = sqlite3.Row
+    conn = _open(dsn, readonly)
+    connections[(str(dsn), readonly)] = conn
+    if not readonly and str(dsn) not in _schema_ready:
+        with _schema_lock:
+            if str(dsn) not in _schema_ready:
+                create_schema(conn)
+                _schema_ready.add(str(dsn))
     return conn
 
 
+def close_connections() -> None:
+    """Close the calling thread's connections (they reopen on next use)."""
+    connections = _thread_connections()
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
 def init_db() -> None:
-    conn = get_connection()
+    create_schema(get_connection())
+
+
+def create_schema(conn: sqlite3.Connection) -> None:
+    """Create the tracking tables and indexes on ``conn`` if they are missing."""
     with conn:
-        conn.execute("PRAGMA foreign_keys = ON;")
         status_check = "CHECK(status IN ('pending','in_progress','paused','completed','cancelled'))"
 
         conn.execute(
@@ -167,6 +237,27 @@ def init_db() -> None:
 			"""
         )
 
+        # Listing/status queries filter on status and sort on timestamps;
+        # experiment_runs(experiment_id) is covered by its UNIQUE index
+        indexes = {
+            "idx_feature_plans_status": "feature_plans(status)",
+            "idx_feature_plans_updated_at": "feature_plans(updated_at)",
+            "idx_feature_plans_started_at": "feature_plans(started_at)",
+            "idx_plan_tasks_plan_id": "plan_tasks(plan_id, status)",
+            "idx_refactors_status": "refactors(status)",
+            "idx_refactors_updated_at": "refactors(updated_at)",
+            "idx_refactors_started_at": "refactors(started_at)",
+            "idx_debug_sessions_status": "debug_sessions(status)",
+            "idx_debug_sessions_updated_at": "debug_sessions(updated_at)",
+            "idx_debug_sessions_started_at": "debug_sessions(started_at)",
+            "idx_debug_notes_session_id": "debug_notes(session_id)",
+            "idx_experiments_status": "experiments(status)",
+            "idx_experiments_updated_at": "experiments(updated_at)",
+            "idx_experiment_artifacts_experiment_id": "experiment_artifacts(experiment_id, run_id)",
+        }
+        for name, target in indexes.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target};")
+
 
 # Feature plans
 def upsert_feature_plan(key: str, title: str, owner: str | None = None) -> int:
@@ -404,40 +495,182 @@ def save_summary(entity_type: str, entity_id: int, style: str, text: str) -> int
         return int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
 
 
+# Bulk ingestion
+def _ingest_row(record: Any, number: int) -> dict[str, Any]:
+    if not isinstance(record, dict):
+        raise ValueError(f"Record {number}: expected an object")
+    key = record.get("experiment_key")
+    if not key or not isinstance(key, str):
+        raise ValueError(f"Record {number}: experiment_key is required")
+    try:
+        run_no = int(record["run_no"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Record {number}: run_no must be an integer") from None
+    outcome = record.get("outcome")
+    if outcome not in {"pass", "fail", "inconclusive"}:
+        raise ValueError(f"Record {number}: invalid outcome {outcome!r}")
+    artifacts = record.get("artifacts") or []
+    for artifact in artifacts:
+        if not isinstance(artifact, dict) or not artifact.get("type") or not artifact.get("path"):
+            raise ValueError(f"Record {number}: artifacts need a type and a path")
+    return {
+        "key": key,
+        "title": record.get("title"),
+        "objective": record.get("objective"),
+        "owner": record.get("owner"),
+        "run_no": run_no,
+        "params_json": json.dumps(record.get("params") or {}, ensure_ascii=False),
+        "metrics_json": json.dumps(record.get("metrics") or {}, ensure_ascii=False),
+        "outcome": outcome,
+        "artifacts": artifacts,
+    }
+
+
+def _batches(records: Iterable[Any], size: int) -> Iterator[list[dict[str, Any]]]:
+    batch: list[dict[str, Any]] = []
+    for number, record in enumerate(records, start=1):
+        batch.append(_ingest_row(record, number))
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _ingest_batch(conn: sqlite3.Connection, rows: list[dict[str, Any]]) -> dict[str, int]:
+    now = _utc_now_iso()
+    # Last record wins for an experiment's title/objective/owner
+    experiments: dict[str, tuple[Any, Any, Any]] = {}
+    for row in rows:
+        previous = experiments.get(row["key"], (None, None, None))
+        experiments[row["key"]] = (
+            row["title"] or previous[0],
+            row["objective"] or previous[1],
+            row["owner"] or previous[2],
+        )
+
+    with conn:
+        created = conn.executemany(
+            "INSERT OR IGNORE INTO experiments(key,title,objective,owner,status,created_at,updated_at) VALUES (?,?,?,?,?,?,?)",
+            [
+                (key, title or key, objective or "", owner, "in_progress", now, None)
+                for key, (title, objective, owner) in experiments.items()
+            ],
+        ).rowcount
+        conn.executemany(
+            "UPDATE experiments SET title=COALESCE(?,title), objective=COALESCE(?,objective), owner=COALESCE(?,owner), updated_at=? WHERE key=?",
+            [
+                (title, objective, owner, now, key)
+                for key, (title, objective, owner) in experiments.items()
+            ],
+        )
+        ids: dict[str, int] = {}
+        keys = list(experiments)
+        # Stay under SQLite's default limit on bound parameters
+        for start in range(0, len(keys), 900):
+            chunk = keys[start : start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT key, id FROM experiments WHERE key IN ({placeholders})", chunk
+            ):
+                ids[row[0]] = int(row[1])
+
+        # A re-imported run replaces the old row under a new id; foreign keys
+        # are not enforced, so drop the old run's artifacts explicitly
+        conn.executemany(
+            "DELETE FROM experiment_artifacts WHERE experiment_id=? AND run_id IN"
+            " (SELECT id FROM experiment_runs WHERE experiment_id=? AND run_no=?)",
+            [(ids[row["key"]], ids[row["key"]], row["run_no"]) for row in rows],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO experiment_runs(experiment_id,run_no,params_json,metrics_json,outcome,created_at) VALUES (?,?,?,?,?,?)",
+            [
+                (ids[row["key"]], row["run_no"], row["params_json"], row["metrics_json"], row["outcome"], now)
+                for row in rows
+            ],
+        )
+        artifacts = conn.executemany(
+            "INSERT INTO experiment_artifacts(experiment_id,run_id,type,path,created_at)"
+            " SELECT experiment_id, id, ?, ?, ? FROM experiment_runs WHERE experiment_id=? AND run_no=?",
+            [
+                (artifact["type"], artifact["path"], now, ids[row["key"]], row["run_no"])
+                for row in rows
+                for artifact in row["artifacts"]
+            ],
+        ).rowcount
+    return {"experiments_created": max(created, 0), "artifacts": max(artifacts, 0)}
+
+
+def ingest_experiment_runs(
+    records: Iterable[dict[str, Any]], batch_size: int = INGEST_BATCH_SIZE
+) -> dict[str, int]:
+    """
+    Bulk-load experiment runs, e.g. from a training sweep.
+
+    Each record has ``experiment_key``, ``run_no``, ``outcome`` and optionally
+    ``params``, ``metrics``, ``artifacts`` (``[{"type", "path"}]``) and the
+    experiment's ``title``/``objective``/``owner``. Missing experiments are
+    created; runs replace an existing run with the same number, as in
+    ``add_experiment_run``. Records are written ``batch_size`` at a time, one
+    transaction per batch: an invalid record raises ValueError and leaves the
+    batches before it committed.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    conn = get_connection()
+    totals = {"runs": 0, "experiments_created": 0, "artifacts": 0, "batches": 0}
+    for batch in _batches(records, batch_size):
+        written = _ingest_batch(conn, batch)
+        totals["runs"] += len(batch)
+        totals["experiments_created"] += written["experiments_created"]
+        totals["artifacts"] += written["artifacts"]
+        totals["batches"] += 1
+    return totals
+
+
 # Reads/exports
-def get_plan_status(key: str | None = None) -> list[dict[str, Any]]:
+def get_plan_status(
+    key: str | None = None, conn: sqlite3.Connection | None = None
+) -> list[dict[str, Any]]:
+    if conn is not None:
+        # Caller-provided database (e.g. the dashboard's demo data)
+        return _plan_status_rows(conn, key)
     # Auto-initialize DB if it doesn't exist
     if not DB_PATH.exists():
         init_db()
     try:
         conn = get_connection(True) if DB_PATH.exists() else get_connection()
-        cur = conn.cursor()
-        if key:
-            rows = cur.execute(
-                """
+        return _plan_status_rows(conn, key)
+    except Exception:
+        # If tables don't exist, initialize and return empty list
+        init_db()
+        return []
+
+
+def _plan_status_rows(conn: sqlite3.Connection, key: str | None) -> list[dict[str, Any]]:
+    cur = conn.cursor()
+    if key:
+        rows = cur.execute(
+            """
 				SELECT p.key, p.title, p.status, COALESCE(COUNT(t.id),0) AS open_tasks
 				FROM feature_plans p
 				LEFT JOIN plan_tasks t ON t.plan_id=p.id AND t.status!='completed'
 				WHERE p.key=?
 				GROUP BY p.id
 				""",
-                (key,),
-            ).fetchall()
-        else:
-            rows = cur.execute(
-                """
+            (key,),
+        ).fetchall()
+    else:
+        rows = cur.execute(
+            """
 				SELECT p.key, p.title, p.status, COALESCE(COUNT(t.id),0) AS open_tasks
 				FROM feature_plans p
 				LEFT JOIN plan_tasks t ON t.plan_id=p.id AND t.status!='completed'
 				GROUP BY p.id
 				ORDER BY p.updated_at DESC
 				"""
-            ).fetchall()
-        return [dict(r) for r in rows]
-    except Exception:
-        # If tables don't exist, initialize and return empty list
-        init_db()
-        return []
+        ).fetchall()
+    return [dict(r) for r in rows]
 
 
 def get_experiment_runs_export() -> list[dict[str, Any]]:
@@ -466,10 +699,13 @@ __all__ = [
     "add_debug_note",
     "add_experiment_run",
     "add_plan_task",
+    "close_connections",
     "create_debug_session",
+    "create_schema",
     "get_connection",
     "get_experiment_runs_export",
     "get_plan_status",
+    "ingest_experiment_runs",
     "init_db",
     "link_experiment_artifact",
     "save_summary",
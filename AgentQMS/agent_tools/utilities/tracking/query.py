@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+import sqlite3
+from typing import TYPE_CHECKING, Any
 
 from .db import DB_PATH, get_connection, get_plan_status, init_db
 
@@ -13,14 +15,18 @@ def ultra_concise(points: Iterable[str]) -> str:
     return joined[:280]
 
 
-def get_status(kind: str, key: str | None = None) -> str:
+def get_status(
+    kind: str, key: str | None = None, conn: sqlite3.Connection | None = None
+) -> str:
+    # ``conn`` reads another database (e.g. demo data) instead of DB_PATH
+    own_db = conn is None
     # Auto-initialize DB if it doesn't exist
-    if not DB_PATH.exists():
+    if own_db and not DB_PATH.exists():
         init_db()
 
     kind = kind.lower()
     if kind == "plan":
-        rows = get_plan_status(key)
+        rows = get_plan_status(key, conn)
         if not rows:
             return "No plans found."
         return " | ".join(
@@ -28,7 +34,8 @@ def get_status(kind: str, key: str | None = None) -> str:
         )
 
     try:
-        conn = get_connection()
+        if conn is None:
+            conn = get_connection()
         if kind == "experiment":
             if not key:
                 rows = conn.execute(
@@ -77,17 +84,18 @@ def get_status(kind: str, key: str | None = None) -> str:
         if kind == "all":
             return ultra_concise(
                 [
-                    "plans: " + get_status("plan"),
-                    "experiments: " + get_status("experiment"),
-                    "debug: " + get_status("debug"),
-                    "refactors: " + get_status("refactor"),
+                    "plans: " + get_status("plan", conn=conn),
+                    "experiments: " + get_status("experiment", conn=conn),
+                    "debug: " + get_status("debug", conn=conn),
+                    "refactors: " + get_status("refactor", conn=conn),
                 ]
             )
 
         return f"Unknown kind: {kind}"
     except Exception:
         # If tables don't exist, initialize and return empty status
-        init_db()
+        if own_db:
+            init_db()
         if kind == "plan":
             return "No plans found."
         elif kind == "experiment":
@@ -101,4 +109,189 @@ def get_status(kind: str, key: str | None = None) -> str:
         return f"Unknown kind: {kind}"
 
 
-__all__ = ["get_status", "ultra_concise"]
+# Structured listings (JSON-ready rows) for the dashboard API
+MAX_PAGE_SIZE = 500
+_STATUSES = {"pending", "in_progress", "paused", "completed", "cancelled"}
+
+
+def _read_connection(conn: sqlite3.Connection | None) -> sqlite3.Connection:
+    if conn is not None:
+        return conn
+    if not DB_PATH.exists():
+        init_db()
+    return get_connection(True)
+
+
+def _filters(
+    alias: str,
+    status: str | None,
+    search: str | None,
+    owner: str | None = None,
+) -> tuple[list[str], list[Any]]:
+    where: list[str] = []
+    params: list[Any] = []
+    if status:
+        if status not in _STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+        where.append(f"{alias}.status = ?")
+        params.append(status)
+    if owner:
+        where.append(f"{alias}.owner = ?")
+        params.append(owner)
+    if search:
+        pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where.append(f"({alias}.key LIKE ? ESCAPE '\\' OR {alias}.title LIKE ? ESCAPE '\\')")
+        params += [pattern, pattern]
+    return where, params
+
+
+def _page(
+    conn: sqlite3.Connection,
+    select: str,
+    table: str,
+    filters: tuple[list[str], list[Any]],
+    order: str,
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(offset, 0)
+    where, params = filters
+    clause = f" WHERE {' AND '.join(where)}" if where else ""
+    total = conn.execute(f"SELECT COUNT(*) FROM {table}{clause}", params).fetchone()[0]
+    rows = conn.execute(
+        f"{select} FROM {table}{clause} ORDER BY {order} LIMIT ? OFFSET ?",
+        [*params, limit, offset],
+    ).fetchall()
+    return {
+        "items": [dict(r) for r in rows],
+        "total": int(total),
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+def list_plans(
+    conn: sqlite3.Connection | None = None,
+    *,
+    status: str | None = None,
+    owner: str | None = None,
+    search: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Feature plans with open/total task counts, most recently updated first."""
+    return _page(
+        _read_connection(conn),
+        """
+        SELECT p.key, p.title, p.status, p.owner, p.started_at, p.updated_at,
+            (SELECT COUNT(*) FROM plan_tasks t
+             WHERE t.plan_id = p.id AND t.status != 'completed') AS open_tasks,
+            (SELECT COUNT(*) FROM plan_tasks t WHERE t.plan_id = p.id) AS total_tasks
+        """,
+        "feature_plans p",
+        _filters("p", status, search, owner),
+        "p.updated_at DESC, p.id DESC",
+        limit,
+        offset,
+    )
+
+
+def list_experiments(
+    conn: sqlite3.Connection | None = None,
+    *,
+    status: str | None = None,
+    owner: str | None = None,
+    search: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Experiments with their run count and latest run, most recently updated first."""
+    page = _page(
+        _read_connection(conn),
+        """
+        SELECT e.key, e.title, e.objective, e.owner, e.status, e.created_at, e.updated_at,
+            (SELECT COUNT(*) FROM experiment_runs c WHERE c.experiment_id = e.id) AS run_count,
+            r.run_no AS latest_run_no, r.outcome AS latest_outcome,
+            r.metrics_json AS latest_metrics_json, r.created_at AS latest_run_at
+        """,
+        """experiments e
+        LEFT JOIN experiment_runs r ON r.id = (
+            SELECT l.id FROM experiment_runs l
+            WHERE l.experiment_id = e.id ORDER BY l.run_no DESC LIMIT 1
+        )""",
+        _filters("e", status, search, owner),
+        "e.updated_at DESC, e.id DESC",
+        limit,
+        offset,
+    )
+    for item in page["items"]:
+        run_no = item.pop("latest_run_no")
+        outcome = item.pop("latest_outcome")
+        metrics = item.pop("latest_metrics_json")
+        created_at = item.pop("latest_run_at")
+        item["latest_run"] = (
+            None
+            if run_no is None
+            else {
+                "run_no": run_no,
+                "outcome": outcome,
+                "metrics": json.loads(metrics) if metrics else {},
+                "created_at": created_at,
+            }
+        )
+    return page
+
+
+def list_debug_sessions(
+    conn: sqlite3.Connection | None = None,
+    *,
+    status: str | None = None,
+    search: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Debug sessions with their note count, most recently started first."""
+    return _page(
+        _read_connection(conn),
+        """
+        SELECT d.key, d.title, d.status, d.hypothesis, d.scope, d.started_at, d.updated_at,
+            (SELECT COUNT(*) FROM debug_notes n WHERE n.session_id = d.id) AS note_count
+        """,
+        "debug_sessions d",
+        _filters("d", status, search),
+        "d.started_at DESC, d.id DESC",
+        limit,
+        offset,
+    )
+
+
+def list_refactors(
+    conn: sqlite3.Connection | None = None,
+    *,
+    status: str | None = None,
+    search: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Refactors, most recently updated first."""
+    return _page(
+        _read_connection(conn),
+        "SELECT r.key, r.title, r.status, r.notes, r.started_at, r.updated_at",
+        "refactors r",
+        _filters("r", status, search),
+        "r.updated_at DESC, r.id DESC",
+        limit,
+        offset,
+    )
+
+
+__all__ = [
+    "MAX_PAGE_SIZE",
+    "get_status",
+    "list_debug_sessions",
+    "list_experiments",
+    "list_plans",
+    "list_refactors",
+    "ultra_concise",
+]
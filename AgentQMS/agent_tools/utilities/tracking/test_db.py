@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the tracking database layer (db.py) and its listings (query.py).
+"""
+import io
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from AgentQMS.agent_tools.utilities.tracking import cli, db, query
+
+
+@pytest.fixture
+def tracking_db(tmp_path, monkeypatch):
+    """Point the tracking module at a fresh database file."""
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "tracking.db")
+    yield db.DB_PATH
+    db.close_connections()
+
+
+class TestConnections:
+    """Connections are shared per thread and tuned for concurrent access."""
+
+    def test_connection_is_reused_within_a_thread(self, tracking_db):
+        assert db.get_connection() is db.get_connection()
+
+    def test_threads_get_their_own_connection(self, tracking_db):
+        main = db.get_connection()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.get_connection()))
+        thread.start()
+        thread.join()
+        assert other and other[0] is not main
+
+    def test_close_connections_reopens_on_next_use(self, tracking_db):
+        first = db.get_connection()
+        db.close_connections()
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+        assert db.get_connection() is not first
+
+    def test_database_uses_wal(self, tracking_db):
+        conn = db.get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_readonly_connection_rejects_writes(self, tracking_db):
+        db.init_db()
+        conn = db.get_connection(readonly=True)
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM feature_plans")
+
+    def test_readonly_requires_existing_database(self, tracking_db):
+        with pytest.raises(FileNotFoundError):
+            db.get_connection(readonly=True)
+
+    def test_reader_is_not_blocked_by_open_write_transaction(self, tracking_db):
+        db.upsert_feature_plan("plan-a", "Plan A")
+        # Another process (e.g. the CLI) holding a write transaction
+        writer = sqlite3.connect(str(tracking_db))
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("UPDATE feature_plans SET title='changed'")
+        try:
+            rows = db.get_plan_status()
+        finally:
+            writer.rollback()
+            writer.close()
+        assert [row["title"] for row in rows] == ["Plan A"]
+
+
+class TestSchema:
+    """The schema includes indexes for the status and listing queries."""
+
+    def test_indexes_are_created(self, tracking_db):
+        conn = db.get_connection()
+        names = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert {
+            "idx_feature_plans_status",
+            "idx_feature_plans_updated_at",
+            "idx_feature_plans_started_at",
+            "idx_plan_tasks_plan_id",
+            "idx_experiments_status",
+            "idx_experiment_artifacts_experiment_id",
+        } <= names
+
+    def test_plan_round_trip(self, tracking_db):
+        db.upsert_feature_plan("plan-a", "Plan A")
+        db.add_plan_task("plan-a", "first")
+        db.set_plan_status("plan-a", "in_progress")
+        rows = db.get_plan_status("plan-a")
+        assert rows == [
+            {"key": "plan-a", "title": "Plan A", "status": "in_progress", "open_tasks": 1}
+        ]
+
+
+class TestListings:
+    """Structured listings page and filter in SQL and accept any connection."""
+
+    @pytest.fixture
+    def seeded(self, tracking_db):
+        for n in range(5):
+            db.upsert_feature_plan(f"plan-{n}", f"Plan {n}", owner="team-a" if n % 2 else "team-b")
+        db.add_plan_task("plan-1", "open task")
+        db.set_plan_status("plan-3", "in_progress")
+        db.upsert_experiment("exp-a", "Experiment A")
+        db.add_experiment_run("exp-a", 1, {"lr": 0.1}, {"acc": 0.8}, "fail")
+        db.add_experiment_run("exp-a", 2, {"lr": 0.01}, {"acc": 0.9}, "pass")
+        return db.get_connection()
+
+    def test_pagination(self, seeded):
+        first = query.list_plans(seeded, limit=2)
+        second = query.list_plans(seeded, limit=2, offset=2)
+        assert first["total"] == second["total"] == 5
+        assert len(first["items"]) == len(second["items"]) == 2
+        assert not {r["key"] for r in first["items"]} & {r["key"] for r in second["items"]}
+
+    def test_filters(self, seeded):
+        assert [r["key"] for r in query.list_plans(seeded, status="in_progress")["items"]] == ["plan-3"]
+        assert query.list_plans(seeded, owner="team-a")["total"] == 2
+        assert query.list_plans(seeded, search="plan-1")["items"][0]["open_tasks"] == 1
+        # LIKE wildcards in the search text are matched literally
+        assert query.list_plans(seeded, search="plan_%")["total"] == 0
+
+    def test_invalid_status_is_rejected(self, seeded):
+        with pytest.raises(ValueError):
+            query.list_refactors(seeded, status="done")
+
+    def test_experiment_includes_latest_run(self, seeded):
+        (item,) = query.list_experiments(seeded)["items"]
+        assert item["run_count"] == 2
+        assert item["latest_run"]["run_no"] == 2
+        assert item["latest_run"]["metrics"] == {"acc": 0.9}
+
+    def test_in_memory_connection(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        db.create_schema(conn)
+        conn.execute(
+            "INSERT INTO refactors(key,title,status) VALUES ('r-1','Refactor','pending')"
+        )
+        assert query.list_refactors(conn)["items"][0]["key"] == "r-1"
+        assert query.get_status("refactor", conn=conn) == "r-1:pending"
+
+
+class TestIngest:
+    """Bulk ingestion upserts experiments and writes runs in batches."""
+
+    def _records(self, count, key="exp-sweep"):
+        return [
+            {
+                "experiment_key": key,
+                "run_no": n,
+                "params": {"lr": n / 1000},
+                "metrics": {"loss": 1 / (n + 1)},
+                "outcome": "pass" if n % 2 else "fail",
+            }
+            for n in range(count)
+        ]
+
+    def test_ingest_creates_experiment_and_runs(self, tracking_db):
+        totals = db.ingest_experiment_runs(self._records(25), batch_size=10)
+        assert totals == {"runs": 25, "experiments_created": 1, "artifacts": 0, "batches": 3}
+        (item,) = query.list_experiments(db.get_connection())["items"]
+        assert item["key"] == "exp-sweep" and item["run_count"] == 25
+        assert item["latest_run"]["run_no"] == 24
+
+    def test_ingest_replaces_runs_and_links_artifacts(self, tracking_db):
+        db.upsert_experiment("exp-sweep", "Sweep", "objective", "ml")
+        db.add_experiment_run("exp-sweep", 1, {}, None, "fail")
+        totals = db.ingest_experiment_runs(
+            [
+                {
+                    "experiment_key": "exp-sweep",
+                    "run_no": 1,
+                    "outcome": "pass",
+                    "artifacts": [{"type": "report", "path": "docs/run1.md"}],
+                }
+            ]
+        )
+        assert totals["experiments_created"] == 0 and totals["artifacts"] == 1
+        rows = db.get_experiment_runs_export()
+        assert [(r["run_no"], r["outcome"]) for r in rows] == [(1, "pass")]
+        # Fields not given in the records are kept
+        experiment = db.get_connection().execute(
+            "SELECT title, owner FROM experiments WHERE key='exp-sweep'"
+        ).fetchone()
+        assert tuple(experiment) == ("Sweep", "ml")
+
+    def test_reimport_replaces_artifacts(self, tracking_db):
+        records = self._records(20)
+        for record in records:
+            record["artifacts"] = [{"type": "report", "path": f"docs/run{record['run_no']}.md"}]
+        db.ingest_experiment_runs(records, batch_size=7)
+        db.ingest_experiment_runs(records, batch_size=7)
+        conn = db.get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM experiment_artifacts").fetchone()[0] == 20
+        orphans = conn.execute(
+            "SELECT COUNT(*) FROM experiment_artifacts a"
+            " WHERE NOT EXISTS (SELECT 1 FROM experiment_runs r WHERE r.id = a.run_id)"
+        ).fetchone()[0]
+        assert orphans == 0
+
+    def test_invalid_record_keeps_earlier_batches(self, tracking_db):
+        records = self._records(5) + [{"experiment_key": "exp-sweep", "run_no": 9, "outcome": "ok"}]
+        with pytest.raises(ValueError, match="Record 6"):
+            db.ingest_experiment_runs(records, batch_size=5)
+        assert len(db.get_experiment_runs_export()) == 5
+
+    def test_cli_reads_jsonl_from_stdin(self, tracking_db, monkeypatch, capsys):
+        lines = "\n".join(json.dumps(r) for r in self._records(3)) + "\n\n"
+        monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+        assert cli.main(["exp", "ingest"]) == 0
+        assert json.loads(capsys.readouterr().out)["runs"] == 3
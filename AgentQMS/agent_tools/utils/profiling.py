@@ -0,0 +1,105 @@
+"""Lightweight per-rule profiling for AgentQMS validators (agent_tools canonical).
+
+Validators hold an optional :class:`RuleProfiler`. When it is ``None`` the
+only cost is a single ``is None`` check per rule call. The dashboard backend
+uses the same class, so CLI and API profiles share one schema.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class RuleProfiler:
+    """Accumulates per-rule timings, per-file timings, and bytes read."""
+
+    def __init__(self, slowest_n: int = 10) -> None:
+        self.slowest_n = slowest_n
+        self.rule_time: dict[str, float] = {}
+        self.rule_calls: dict[str, int] = {}
+        self.bytes_read = 0
+        self.files = 0
+        self.total_time = 0.0
+        self._slowest: list[tuple[float, str]] = []
+
+    def time_rule(self, rule: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``func`` and charge its wall time to ``rule``."""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record_rule(rule, time.perf_counter() - start)
+
+    def lap(self, rule: str, start: float) -> float:
+        """Charge the time since ``start`` to ``rule`` and return the new start."""
+        now = time.perf_counter()
+        self.record_rule(rule, now - start)
+        return now
+
+    def record_rule(self, rule: str, seconds: float) -> None:
+        self.rule_time[rule] = self.rule_time.get(rule, 0.0) + seconds
+        self.rule_calls[rule] = self.rule_calls.get(rule, 0) + 1
+
+    def record_file(self, path: str, seconds: float) -> None:
+        """Record total validation time for one file (keeps only the slowest N)."""
+        self.files += 1
+        self.total_time += seconds
+        entry = (seconds, path)
+        if len(self._slowest) < self.slowest_n:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def add_bytes(self, count: int) -> None:
+        self.bytes_read += count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the profile as a JSON-serializable dict."""
+        rules = [
+            {
+                "rule": rule,
+                "calls": self.rule_calls[rule],
+                "total_ms": round(seconds * 1000, 3),
+                "avg_ms": round(seconds * 1000 / self.rule_calls[rule], 4),
+            }
+            for rule, seconds in sorted(self.rule_time.items(), key=lambda item: -item[1])
+        ]
+        return {
+            "files": self.files,
+            "total_ms": round(self.total_time * 1000, 3),
+            "bytes_read": self.bytes_read,
+            "rules": rules,
+            "slowest_files": [
+                {"path": path, "ms": round(seconds * 1000, 3)}
+                for seconds, path in sorted(self._slowest, reverse=True)
+            ],
+        }
+
+    def format_report(self) -> str:
+        """Return a human-readable profile table."""
+        data = self.to_dict()
+        lines = [
+            "VALIDATION PROFILE",
+            "-" * 60,
+            f"Files: {data['files']}  Total: {data['total_ms']:.1f} ms  Bytes read: {data['bytes_read']}",
+            "",
+            f"{'Rule':<20} | {'Calls':>7} | {'Total ms':>10} | {'Avg ms':>8}",
+            "-" * 60,
+        ]
+        for row in data["rules"]:
+            lines.append(
+                f"{row['rule']:<20} | {row['calls']:>7} | {row['total_ms']:>10.2f} | {row['avg_ms']:>8.3f}"
+            )
+        if data["slowest_files"]:
+            lines.append("")
+            lines.append(f"Slowest {len(data['slowest_files'])} files:")
+            for row in data["slowest_files"]:
+                lines.append(f"  {row['ms']:>8.2f} ms  {row['path']}")
+        return "\n".join(lines)
+
+
+__all__ = ["RuleProfiler"]
@@ -0,0 +1,159 @@
+"""Admin diagnostics endpoints (request profiles, slow-request log, memory, tool probe)."""
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+from pydantic import BaseModel
+
+from services.observability.caches import cache_sizes
+from services.observability.memory import GROUP_BY, MEMORY_DEBUG, get_memory_inspector
+from services.observability.profiling import (
+    PROFILES,
+    PROFILING_ENABLED,
+    SLOW_REQUEST_SECONDS,
+    SLOW_REQUESTS,
+    run_in_threadpool,
+)
+from services.tools.probe import reprobe
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """List retained request profiles (newest first)."""
+    return {
+        "enabled": PROFILING_ENABLED,
+        "profiles": PROFILES.list()
+    }
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = Query("json", description="json, text (pstats report or collapsed stacks), or pstats (binary dump)")
+):
+    """
+    Fetch one request profile.
+
+    ``text`` returns the pstats report for cProfile runs and collapsed
+    stacks (flamegraph.pl / speedscope input) for sampled runs; ``pstats``
+    downloads the raw cProfile dump for snakeviz or ``pstats``.
+    """
+    profile = PROFILES.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+
+    if format == "text":
+        return PlainTextResponse(profile.get("report") or profile.get("collapsed") or "")
+    if format == "pstats":
+        if not profile.get("pstats_path"):
+            raise HTTPException(status_code=400, detail="Only cProfile runs have a pstats dump")
+        return FileResponse(profile["pstats_path"], media_type="application/octet-stream",
+                            filename=f"{profile_id}.prof")
+    return profile
+
+
+@router.get("/slow-requests")
+async def list_slow_requests(limit: int = Query(50, ge=1, le=1000)):
+    """Recent requests that exceeded the slow-request threshold, newest first."""
+    entries = list(SLOW_REQUESTS.entries)[-limit:]
+    return {
+        "threshold_s": SLOW_REQUEST_SECONDS,
+        "requests": list(reversed(entries))
+    }
+
+
+class TracemallocStartRequest(BaseModel):
+    frames: int = 10
+
+
+class SnapshotRequest(BaseModel):
+    label: str | None = None
+
+
+def _check_group_by(group_by: str) -> None:
+    if group_by not in GROUP_BY:
+        raise HTTPException(status_code=400, detail=f"group_by must be one of {list(GROUP_BY)}")
+
+
+def _require_memory_debug() -> None:
+    if not MEMORY_DEBUG:
+        raise HTTPException(status_code=403, detail="Memory tracing is disabled; set MEMORY_DEBUG=true to enable it")
+
+
+@router.get("/memory")
+async def get_memory_status():
+    """Process RSS, tracemalloc state and retained snapshots."""
+    return {"enabled": MEMORY_DEBUG, **get_memory_inspector().status()}
+
+
+@router.post("/memory/tracemalloc/start")
+async def start_tracemalloc(request: TracemallocStartRequest):
+    """Start tracing allocations, keeping ``frames`` frames per traceback."""
+    _require_memory_debug()
+    if not 1 <= request.frames <= 100:
+        raise HTTPException(status_code=400, detail="frames must be between 1 and 100")
+    return get_memory_inspector().start(request.frames)
+
+
+@router.post("/memory/tracemalloc/stop")
+async def stop_tracemalloc():
+    """Stop tracing allocations (retained snapshots stay available)."""
+    _require_memory_debug()
+    return get_memory_inspector().stop()
+
+
+@router.post("/memory/snapshots")
+async def take_memory_snapshot(request: SnapshotRequest):
+    """Take a tracemalloc snapshot; only the newest few are retained."""
+    _require_memory_debug()
+    try:
+        return await run_in_threadpool(get_memory_inspector().take_snapshot, request.label)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.get("/memory/snapshots/{snapshot_id}")
+async def get_memory_snapshot(
+    snapshot_id: str,
+    group_by: str = Query("lineno", description="lineno, filename or traceback"),
+    limit: int = Query(25, ge=1, le=500)
+):
+    """Top allocation sites in a snapshot."""
+    _require_memory_debug()
+    _check_group_by(group_by)
+    try:
+        return await run_in_threadpool(get_memory_inspector().top, snapshot_id, group_by, limit)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Snapshot not found: {snapshot_id}")
+
+
+@router.get("/memory/diff")
+async def diff_memory_snapshots(
+    base: str = Query(..., description="Earlier snapshot ID"),
+    current: str = Query(..., description="Later snapshot ID"),
+    group_by: str = Query("lineno", description="lineno, filename or traceback"),
+    limit: int = Query(25, ge=1, le=500)
+):
+    """Allocation sites that grew (or shrank) the most between two snapshots."""
+    _require_memory_debug()
+    _check_group_by(group_by)
+    try:
+        return await run_in_threadpool(get_memory_inspector().diff, base, current, group_by, limit)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Snapshot not found: {e.args[0]}")
+
+
+@router.get("/memory/caches")
+async def get_cache_sizes():
+    """Entry counts and approximate memory of every registered cache."""
+    return await run_in_threadpool(cache_sizes)
+
+
+@router.post("/tools/probe")
+async def probe_tools():
+    """
+    Re-detect how each tool can run (warm worker, make, direct script) and
+    reload the tool registry, e.g. after installing make or uv.
+    """
+    catalog = await run_in_threadpool(reprobe)
+    return catalog.to_dict()
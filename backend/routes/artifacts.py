@@ -7,6 +7,8 @@ import frontmatter
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from services.corpus.index import invalidate_all
+
 router = APIRouter(prefix="/api/v1/artifacts", tags=["artifacts"])
 
 # Configuration
@@ -236,6 +238,7 @@ async def create_artifact(artifact: ArtifactCreate):
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(frontmatter.dumps(post))
+        invalidate_all()
 
         return parse_artifact(file_path, include_content=True)
     except Exception as e:
@@ -270,6 +273,7 @@ async def update_artifact(id: str, update: ArtifactUpdate):
 
         with open(found_path, "w", encoding="utf-8") as f:
             f.write(frontmatter.dumps(post))
+        invalidate_all()
 
         return parse_artifact(found_path, include_content=True)
     except Exception as e:
@@ -299,6 +303,7 @@ async def delete_artifact(id: str):
         dest_path = os.path.join(archive_dir, filename)
 
         os.rename(found_path, dest_path)
+        invalidate_all()
         return {"success": True, "message": "Artifact archived", "path": dest_path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,9 +4,14 @@ import subprocess
 import sys
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from services.coalescing.singleflight import SingleFlight, make_key
+from services.observability.profiling import run_in_threadpool
+from services.views.scheduler import SCHEDULER, View
+
 router = APIRouter(prefix="/api/v1/compliance", tags=["compliance"])
 
 # Check if running in demo mode
@@ -21,158 +26,172 @@ class FixRequest(BaseModel):
     rule_id: str
     dry_run: bool = False
 
+class BatchFixRequest(BaseModel):
+    target: str = "all"
+    dry_run: bool = False
+    rule_ids: list[str] | None = None
+    commit_chunk_size: int = 0  # 0 = a single commit for the whole batch
+
+class ValidationJobRequest(BaseModel):
+    target: str = "all"
+
 # Models
 class ValidationResult(BaseModel):
     compliance_rate: float
     total_files: int
     valid_files: int
     violations: list[dict[str, Any]]
+    profile: dict[str, Any] | None = None
+
+_validate_flight = SingleFlight("compliance_validate")
+
+
+def _compliance_trend() -> list[dict[str, Any]]:
+    from services.compliance.trend import compute_compliance_trend
+    from services.corpus.index import get_corpus_index
+
+    index = get_corpus_index(_get_artifacts_root())
+    # The scheduler reruns this every max_staleness; unchanged artifacts
+    # reuse the last trend instead of revalidating the corpus
+    return index.memoize("compliance_trend", lambda: compute_compliance_trend(index.files()))
+
+
+# Full validation per period is too slow for the request path; it is
+# recomputed in the background after writes and at least every 5 minutes
+SCHEDULER.register(View("compliance_trend", _compliance_trend, max_staleness=300, events=("corpus",)))
 
 @router.get("/metrics")
-async def get_compliance_metrics():
+def get_compliance_metrics():
     """Get compliance metrics for Strategy Dashboard."""
-    import glob
-    import frontmatter
-    
-    # Use same artifacts root logic as artifacts route
+    return read_compliance_metrics()
+
+
+@router.get("/trend")
+async def get_compliance_trend(response: Response):
+    """
+    Compliance rate by ISO week of artifact creation.
+
+    Served from the background compliance_trend view; ``age_seconds`` (and
+    the ``Age`` header) say how old the value is.
+    """
+    snapshot = await run_in_threadpool(SCHEDULER.read, "compliance_trend")
+    response.headers["Age"] = str(int(snapshot["age_seconds"] or 0))
+    return {
+        "trend": snapshot["value"] or [],
+        "computed_at": snapshot["computed_at"],
+        "age_seconds": snapshot["age_seconds"],
+        "stale": snapshot["stale"],
+        "error": snapshot["error"],
+    }
+
+
+def read_compliance_metrics() -> dict[str, Any]:
+    """
+    Compliance metrics for the current artifacts root.
+
+    Computed from cached frontmatter and memoized under the corpus
+    fingerprint, so repeat calls only recompute after artifacts change.
+    """
+    from services.compliance.metrics import EMPTY_METRICS, compute_compliance_metrics
+    from services.corpus.index import get_corpus_index
+
+    index = get_corpus_index(_get_artifacts_root())
+    try:
+        return index.memoize(
+            "compliance_metrics",
+            lambda: compute_compliance_metrics(index.records())
+        )
+    except Exception as e:
+        return {**EMPTY_METRICS, "error": str(e)}
+
+
+def _get_artifacts_root() -> str:
+    """Get artifacts root directory with auto-detection."""
     _routes_dir = os.path.dirname(os.path.abspath(__file__))
     _backend_dir = os.path.dirname(_routes_dir)
     _project_root = os.path.dirname(_backend_dir)
-    
-    def get_artifacts_root():
-        """Get artifacts root directory with auto-detection."""
-        demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
-        
-        # Try the configured path first
-        artifacts_rel = "demo_data/artifacts" if demo_mode else "docs/artifacts"
-        artifacts_root = os.path.join(_project_root, artifacts_rel)
-        
-        # Auto-detect: if configured path doesn't exist, try the alternative
-        if not os.path.exists(artifacts_root):
-            alt_artifacts_rel = "docs/artifacts" if demo_mode else "demo_data/artifacts"
-            alt_artifacts_root = os.path.join(_project_root, alt_artifacts_rel)
-            if os.path.exists(alt_artifacts_root):
-                return alt_artifacts_root
-        
+
+    demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
+    # Try the configured path first
+    artifacts_rel = "demo_data/artifacts" if demo_mode else "docs/artifacts"
+    artifacts_root = os.path.join(_project_root, artifacts_rel)
+
+    # Auto-detect: if configured path doesn't exist, try the alternative
+    if not os.path.exists(artifacts_root):
+        alt_artifacts_rel = "docs/artifacts" if demo_mode else "demo_data/artifacts"
+        alt_artifacts_root = os.path.join(_project_root, alt_artifacts_rel)
+        if os.path.exists(alt_artifacts_root):
+            return alt_artifacts_root
+    return artifacts_root
+
+
+def _resolve_target(target: str) -> str:
+    """Resolve a validation target ('all' or a path relative to the artifacts root)."""
+    artifacts_root = _get_artifacts_root()
+    if target == "all":
         return artifacts_root
-    
-    artifacts_root = get_artifacts_root()
-    
-    # Debug logging
-    print(f"DEBUG: Compliance metrics - artifacts_root: {artifacts_root}")
-    print(f"DEBUG: Compliance metrics - artifacts_root exists: {os.path.exists(artifacts_root)}")
-    
-    try:
-        search_pattern = os.path.join(artifacts_root, "**", "*.md")
-        artifact_files = glob.glob(search_pattern, recursive=True)
-        total = len(artifact_files)
-        
-        print(f"DEBUG: Compliance metrics - found {total} artifact files")
-        
-        if total == 0:
-            print(f"WARNING: No artifacts found in {artifacts_root}")
-            # Try to list what's actually there
-            if os.path.exists(artifacts_root):
-                try:
-                    import os as os_module
-                    contents = os_module.listdir(artifacts_root)
-                    print(f"DEBUG: Contents of {artifacts_root}: {contents}")
-                except:
-                    pass
-            return {
-                "schema_compliance": 0,
-                "branch_integration": 0,
-                "timestamp_accuracy": 0,
-                "index_coverage": 0
-            }
-        
-        # Calculate metrics
-        valid_schema = 0
-        has_timestamps = 0
-        has_branch = 0
-        
-        for f in artifact_files:
-            try:
-                post = frontmatter.load(f)
-                metadata = post.metadata
-                
-                # Schema compliance: has required fields
-                if metadata.get("title") and metadata.get("type") and metadata.get("status"):
-                    valid_schema += 1
-                
-                # Timestamp accuracy: has date field
-                if metadata.get("date") or metadata.get("created"):
-                    has_timestamps += 1
-                
-                # Branch integration: has branch_name field
-                if metadata.get("branch_name"):
-                    has_branch += 1
-            except:
-                pass
-        
-        return {
-            "schema_compliance": int((valid_schema / total) * 100) if total > 0 else 0,
-            "branch_integration": int((has_branch / total) * 100) if total > 0 else 0,
-            "timestamp_accuracy": int((has_timestamps / total) * 100) if total > 0 else 0,
-            "index_coverage": int((total / max(total, 1)) * 100)  # Simplified
-        }
-    except Exception as e:
-        return {
-            "schema_compliance": 0,
-            "branch_integration": 0,
-            "timestamp_accuracy": 0,
-            "index_coverage": 0,
-            "error": str(e)
-        }
+    if ".." in target or target.startswith("/"):
+        # Simple security check
+        return artifacts_root
+    return os.path.join(artifacts_root, target)
 
 
 @router.get("/validate", response_model=ValidationResult)
 async def validate_artifacts(
     target: str = Query("all", description="Target to validate: 'all', directory path, or file path"),
-    force_real: bool = Query(False, description="Force real validation even in demo mode")
+    force_real: bool = Query(False, description="Force real validation even in demo mode"),
+    stream: bool = Query(False, description="Stream one NDJSON record per file, then a summary record"),
+    profile: bool = Query(False, description="Include per-rule timings, slowest files and bytes read")
 ):
     """
     Run the artifact validation tool.
+
+    With ``stream=true`` the response is NDJSON: a ``file`` record per
+    validated file as soon as it is done, ``cross_artifact`` records for
+    corpus-level violations, and a trailing ``summary`` record.
+
+    With ``profile=true`` a ``profile`` section is added to the result (or to
+    the summary record when streaming).
     """
-    # Initialize Validator
+    target_path = _resolve_target(target)
+
+    if stream:
+        # Streams are per-client and are never coalesced
+        try:
+            from services.compliance.profiling import ValidationProfiler
+            from services.compliance.validator import Validator
+            validator = Validator(profiler=ValidationProfiler() if profile else None)
+        except ImportError as e:
+            raise HTTPException(status_code=500, detail=f"Failed to import compliance service: {e}")
+
+        if os.path.isfile(target_path):
+            files, cross_artifact = [target_path], False
+        elif os.path.isdir(target_path):
+            files, cross_artifact = validator.list_files(target_path), True
+        else:
+            raise HTTPException(status_code=404, detail=f"Target not found: {target_path}")
+
+        records = validator.iter_records(files, cross_artifact=cross_artifact)
+        return StreamingResponse(
+            (json.dumps(record, default=str) + "\n" for record in records),
+            media_type="application/x-ndjson"
+        )
+
+    # Identical concurrent validations (same target and options) share one run
+    key = make_key("validate", target=os.path.normpath(target_path), profile=profile)
+    return await _validate_flight.run(key, _validate_target, target_path, profile)
+
+
+def _validate_target(target_path: str, profile: bool) -> ValidationResult:
+    """Validate a file or directory and return the aggregate result."""
     try:
+        from services.compliance.profiling import ValidationProfiler
         from services.compliance.validator import Validator
-        validator = Validator()
+        profiler = ValidationProfiler() if profile else None
+        validator = Validator(profiler=profiler)
     except ImportError as e:
         raise HTTPException(status_code=500, detail=f"Failed to import compliance service: {e}")
 
-    # Determine artifacts root
-    def get_artifacts_root():
-        """Get artifacts root directory with auto-detection."""
-        _routes_dir = os.path.dirname(os.path.abspath(__file__))
-        _backend_dir = os.path.dirname(_routes_dir)
-        _project_root = os.path.dirname(_backend_dir)
-        
-        demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
-        # Try the configured path first
-        artifacts_rel = "demo_data/artifacts" if demo_mode else "docs/artifacts"
-        artifacts_root = os.path.join(_project_root, artifacts_rel)
-        
-        # Auto-detect: if configured path doesn't exist, try the alternative
-        if not os.path.exists(artifacts_root):
-             alt_artifacts_rel = "docs/artifacts" if demo_mode else "demo_data/artifacts"
-             alt_artifacts_root = os.path.join(_project_root, alt_artifacts_rel)
-             if os.path.exists(alt_artifacts_root):
-                 return alt_artifacts_root
-        return artifacts_root
-
-    artifacts_root = get_artifacts_root()
-    
-    # Resolve Target
-    target_path = artifacts_root
-    if target != "all":
-        # Sanitize and resolve relative path
-        if ".." in target or target.startswith("/"):
-             # Simple security check
-             pass 
-        else:
-             target_path = os.path.join(artifacts_root, target)
-
     # Execute Validation
     try:
         if os.path.isfile(target_path):
@@ -182,13 +201,8 @@ async def validate_artifacts(
                 compliance_rate=100 if report.is_compliant else 0,
                 total_files=1,
                 valid_files=1 if report.is_compliant else 0,
-                violations=[{
-                    "file": os.path.basename(report.file_path),
-                    "path": report.file_path,
-                    "rule_id": v.rule_id,
-                    "message": v.message,
-                    "severity": v.severity
-                } for v in report.violations]
+                violations=validator.violation_dicts(report),
+                profile=profiler.to_dict() if profiler else None
             )
         elif os.path.isdir(target_path):
             result = validator.validate_directory(target_path)
@@ -199,6 +213,65 @@ async def validate_artifacts(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/jobs", status_code=202)
+async def start_validation_job(request: ValidationJobRequest):
+    """
+    Start a background validation job.
+
+    Returns immediately with a job ID; an identical request made while a job
+    for the same target is still running joins that job instead.
+    """
+    from services.compliance.jobs import get_job_manager
+
+    target_path = _resolve_target(request.target)
+    if not os.path.exists(target_path):
+        raise HTTPException(status_code=404, detail=f"Target not found: {target_path}")
+
+    job, created = get_job_manager().submit(request.target, target_path)
+    return {**job.progress(), "deduplicated": not created}
+
+
+@router.get("/jobs/{job_id}")
+async def get_validation_job(job_id: str):
+    """Get progress of a validation job (files done/total, violations so far, ETA)."""
+    from services.compliance.jobs import get_job_manager
+
+    job = get_job_manager().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.progress()
+
+
+@router.get("/jobs/{job_id}/results")
+async def get_validation_job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """Get the results of a finished validation job, with paginated violations."""
+    from services.compliance.jobs import get_job_manager
+
+    job = get_job_manager().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+
+    violations = job.result["violations"]
+    return {
+        "job_id": job.id,
+        "compliance_rate": job.result["compliance_rate"],
+        "total_files": job.result["total_files"],
+        "valid_files": job.result["valid_files"],
+        "total_violations": len(violations),
+        "offset": offset,
+        "limit": limit,
+        "violations": violations[offset:offset + limit]
+    }
+
+
 @router.post("/fix")
 async def fix_violation(request: FixRequest):
     """
@@ -212,6 +285,10 @@ async def fix_violation(request: FixRequest):
         
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["message"])
+
+        if not request.dry_run:
+            from services.corpus.index import invalidate_all
+            invalidate_all()
             
         return result
     except ImportError:
@@ -219,3 +296,44 @@ async def fix_violation(request: FixRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.post("/fix/batch")
+async def fix_batch(request: BatchFixRequest):
+    """
+    Auto-fix every fixable violation across a target.
+
+    All fixes for a file are applied in one rewrite, files are written in
+    parallel, and the batch is committed once (or once per
+    ``commit_chunk_size`` files). ``dry_run`` returns a combined diff.
+    """
+    try:
+        from services.compliance.remediator import Remediator
+    except ImportError:
+        raise HTTPException(status_code=500, detail="Remediator service not found")
+
+    remediator = Remediator()
+    target_path = _resolve_target(request.target)
+    if os.path.isfile(target_path):
+        files = [target_path]
+    elif os.path.isdir(target_path):
+        files = remediator.validator.list_files(target_path)
+    else:
+        raise HTTPException(status_code=404, detail=f"Target not found: {target_path}")
+
+    try:
+        result = await run_in_threadpool(
+            remediator.remediate_batch,
+            files,
+            dry_run=request.dry_run,
+            rule_ids=request.rule_ids,
+            commit_chunk_size=request.commit_chunk_size,
+            project_root=os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not request.dry_run and result["files_fixed"]:
+        from services.corpus.index import invalidate_all
+        invalidate_all()
+
+    return result
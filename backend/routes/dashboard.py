@@ -0,0 +1,70 @@
+"""Dashboard summary endpoint (everything the dashboard needs on first load)."""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from services.observability.profiling import run_in_threadpool
+
+from routes import compliance, system, tracking
+
+router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
+
+# section name -> callable(tracking_kind) returning the same payload as its standalone endpoint
+FIELDS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "status": lambda kind: system.bridge_status(),
+    "stats": lambda kind: system.compute_stats(),
+    "compliance": lambda kind: compliance.read_compliance_metrics(),
+    "tracking": lambda kind: tracking.read_tracking_status(kind),
+    "git_branch": lambda kind: system.read_git_branch(),
+    "demo_mode": lambda kind: system.demo_mode_info(),
+}
+
+
+def _parse_fields(fields: Optional[str]) -> list:
+    if not fields:
+        return list(FIELDS)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(FIELDS)}"
+        )
+    # Keep the caller's order but drop duplicates
+    return list(dict.fromkeys(requested))
+
+
+async def _compute(name: str, kind: str) -> Dict[str, Any]:
+    try:
+        return await run_in_threadpool(FIELDS[name], kind)
+    except Exception as e:
+        # One failing section should not blank the whole dashboard
+        return {"error": str(e)}
+
+
+@router.get("/summary")
+async def get_dashboard_summary(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sections to include: status, stats, compliance, tracking, git_branch, demo_mode (default: all)"
+    ),
+    tracking_kind: str = Query("all", description="Tracking kind for the tracking section")
+):
+    """
+    Everything the dashboard fetches on load, in one response.
+
+    Replaces the separate /status, /api/v1/stats, /api/v1/compliance/metrics,
+    /api/v1/tracking/status, /api/v1/git-branch and /api/v1/demo-mode calls.
+    Each section is the same payload as its standalone endpoint; stats and
+    compliance share one corpus index, so the artifacts are scanned and
+    parsed at most once. Sections are computed concurrently and a section
+    that fails carries an ``error`` instead of failing the request.
+    """
+    names = _parse_fields(fields)
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_compute(name, tracking_kind) for name in names))
+    summary: Dict[str, Any] = dict(zip(names, results))
+    summary["generated_in_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return summary
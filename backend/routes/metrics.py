@@ -0,0 +1,17 @@
+"""Prometheus metrics endpoint."""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+# Imported for their metric registrations (cache, corpus and pool gauges),
+# so every series is present from the first scrape.
+import services.compliance.jobs  # noqa: F401
+import services.corpus.index  # noqa: F401
+from services.observability.metrics import render_metrics
+
+router = APIRouter(tags=["observability"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
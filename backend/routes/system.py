@@ -1,9 +1,13 @@
 import os
-import glob
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 from typing import List, Dict, Any
 
+from services.coalescing.singleflight import SingleFlight, make_key
+from services.git.client import GitClient
+from services.observability.profiling import run_in_threadpool
+from services.views.scheduler import SCHEDULER, View
+
 router = APIRouter(prefix="/api/v1", tags=["system"])
 
 # Helper to get artifacts root (same logic as artifacts route)
@@ -34,6 +38,12 @@ class DirectoryNode(BaseModel):
 
 DirectoryNode.model_rebuild()
 
+# Concurrent identical requests share one computation (COALESCE_TTL_SECONDS adds a short result cache)
+_stats_flight = SingleFlight("stats")
+
+# Window for the "docs added" growth figure
+DOC_GROWTH_DAYS = 7
+
 @router.get("/health")
 async def health_check():
     return {"status": "ok"}
@@ -42,9 +52,8 @@ async def health_check():
 async def version():
     return {"version": "0.1.0"}
 
-@router.get("/demo-mode")
-async def get_demo_mode():
-    """Get current DEMO_MODE setting and artifacts path."""
+def demo_mode_info() -> Dict[str, Any]:
+    """Current DEMO_MODE setting and which artifacts paths exist."""
     demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
     demo_mode_env = os.getenv("DEMO_MODE", "not set")
     
@@ -64,9 +73,18 @@ async def get_demo_mode():
         "using_demo_data": "demo_data" in artifacts_root
     }
 
-@router.get("/git-branch")
-async def get_git_branch():
-    """Get the current git branch name."""
+# The branch only changes when .git/HEAD is rewritten, so cache it on HEAD's mtime
+_branch_cache: Dict[str, Any] = {}
+
+def read_git_branch() -> Dict[str, Any]:
+    """Current git branch name, re-read only when .git/HEAD changes."""
+    try:
+        head_mtime = os.stat(os.path.join(_project_root, ".git", "HEAD")).st_mtime_ns
+    except OSError:
+        head_mtime = None  # worktree or not a checkout; always ask git
+    if head_mtime is not None and _branch_cache.get("mtime") == head_mtime:
+        return {"branch": _branch_cache["branch"]}
+
     try:
         import subprocess
         result = subprocess.run(
@@ -76,58 +94,81 @@ async def get_git_branch():
             check=True,
             cwd=_project_root
         )
-        return {"branch": result.stdout.strip()}
+        branch = result.stdout.strip()
+        if head_mtime is not None:
+            _branch_cache.update(mtime=head_mtime, branch=branch)
+        return {"branch": branch}
     except Exception as e:
         # Fallback if not a git repo or error
         return {"branch": "main", "error": str(e)}
 
-@router.get("/stats", response_model=SystemStats)
-async def get_stats():
-    """Get real system statistics from artifacts."""
+def compute_stats() -> Dict[str, Any]:
+    """System stats from the shared corpus index, memoized until artifacts change."""
+    from services.corpus.index import get_corpus_index
+    from services.corpus.stats import EMPTY_STATS, compute_system_stats
+
     try:
-        # Count artifacts
-        artifacts_root = get_artifacts_root()
-        artifact_files = glob.glob(os.path.join(artifacts_root, "**", "*.md"), recursive=True)
-        total_docs = len(artifact_files)
-        
-        # Count by type
-        type_counts = {}
-        for f in artifact_files:
-            try:
-                import frontmatter
-                post = frontmatter.load(f)
-                artifact_type = post.metadata.get("type", "unknown")
-                type_counts[artifact_type] = type_counts.get(artifact_type, 0) + 1
-            except:
-                pass
-        
-        # Build distribution
-        distribution = [
-            {"name": "Implementation Plans", "valid": type_counts.get("implementation_plan", 0), "issues": 0},
-            {"name": "Assessments", "valid": type_counts.get("assessment", 0), "issues": 0},
-            {"name": "Audits", "valid": type_counts.get("audit", 0), "issues": 0},
-            {"name": "Bug Reports", "valid": type_counts.get("bug_report", 0), "issues": 0},
-            {"name": "Designs", "valid": type_counts.get("design", 0), "issues": 0},
-        ]
-        
-        return SystemStats(
-            totalDocs=total_docs,
-            docGrowth=0,  # TODO: Calculate from git history
-            referenceHealth=100,  # TODO: Check link validity
-            brokenLinks=0,  # TODO: Validate links
-            pendingMigrations=0,  # TODO: Check for legacy artifacts
-            distribution=distribution
-        )
-    except Exception as e:
+        index = get_corpus_index(get_artifacts_root())
+        stats = dict(index.memoize("system_stats", lambda: compute_system_stats(index.records())))
+    except Exception:
         # Fallback to safe defaults
-        return SystemStats(
-            totalDocs=0,
-            docGrowth=0,
-            referenceHealth=100,
-            brokenLinks=0,
-            pendingMigrations=0,
-            distribution=[]
-        )
+        stats = dict(EMPTY_STATS)
+
+    # Link and git figures come from background views; until their first
+    # computation finishes the defaults are served rather than blocking
+    links = SCHEDULER.peek("link_health")
+    if links:
+        stats.update(referenceHealth=links["reference_health"], brokenLinks=links["broken_links"])
+    growth = SCHEDULER.peek("doc_growth")
+    if growth:
+        stats["docGrowth"] = growth["added"]
+    return stats
+
+def compute_link_health() -> Dict[str, Any]:
+    """Broken relative links across the artifacts (materialized as the link_health view)."""
+    from services.corpus.index import get_corpus_index
+    from services.corpus.links import compute_link_health as check_links
+
+    artifacts_root = get_artifacts_root()
+    index = get_corpus_index(artifacts_root)
+    return index.memoize("link_health", lambda: check_links(index.files(), artifacts_root))
+
+def compute_doc_growth() -> Dict[str, Any]:
+    """Artifacts added to git in the last DOC_GROWTH_DAYS days (the doc_growth view)."""
+    artifacts_rel = os.path.relpath(get_artifacts_root(), _project_root)
+    added = GitClient.added_files_since(artifacts_rel, f"{DOC_GROWTH_DAYS} days ago", _project_root)
+    return {"window_days": DOC_GROWTH_DAYS, "added": len(added), "files": added[:100]}
+
+def bridge_status() -> Dict[str, Any]:
+    """Payload of the bridge's /status health check."""
+    return {
+        "status": "online",
+        "version": "0.1.0",
+        "cwd": os.getcwd(),
+        "agentqms_root": os.path.abspath(os.path.join(os.getcwd(), "../../.."))
+    }
+
+@router.get("/demo-mode")
+async def get_demo_mode():
+    """Get current DEMO_MODE setting and artifacts path."""
+    return demo_mode_info()
+
+@router.get("/git-branch")
+def get_git_branch():
+    """Get the current git branch name."""
+    return read_git_branch()
+
+@router.get("/stats", response_model=SystemStats)
+async def get_stats():
+    """
+    Get real system statistics from artifacts.
+
+    Uses the shared corpus index, so frontmatter is only re-parsed for
+    files that changed since the last call; concurrent requests share one
+    computation.
+    """
+    stats = await _stats_flight.run(make_key("stats", root=get_artifacts_root()), compute_stats)
+    return SystemStats(**stats)
 
 def scan_directory_tree(root_path: str, max_depth: int = 5, current_depth: int = 0) -> Dict[str, Any]:
     """Recursively scan directory structure and return tree with file counts."""
@@ -166,8 +207,23 @@ def scan_directory_tree(root_path: str, max_depth: int = 5, current_depth: int =
     return result
 
 @router.get("/system/directory-structure")
-async def get_directory_structure():
-    """Get AgentQMS directory structure with file counts."""
+async def get_directory_structure(response: Response):
+    """
+    Get AgentQMS directory structure with file counts.
+
+    Served from the directory_tree view, which is rescanned in the
+    background; ``age_seconds`` (and the ``Age`` header) say how old it is.
+    """
+    snapshot = await run_in_threadpool(SCHEDULER.read, "directory_tree")
+    response.headers["Age"] = str(int(snapshot["age_seconds"] or 0))
+    return {
+        **(snapshot["value"] or {"tree": None, "total_files": 0}),
+        "age_seconds": snapshot["age_seconds"],
+        "stale": snapshot["stale"],
+    }
+
+def directory_structure() -> Dict[str, Any]:
+    """Scan the AgentQMS tree (or the project root if it is missing)."""
     try:
         agentqms_path = os.path.join(_project_root, "AgentQMS")
         
@@ -216,3 +272,9 @@ async def get_directory_structure():
             },
             "total_files": 0
         }
+
+# Expensive views recomputed off the request path (see services/views/scheduler.py).
+# "corpus" views are also refreshed right after writes through the API.
+SCHEDULER.register(View("link_health", compute_link_health, max_staleness=300, events=("corpus",)))
+SCHEDULER.register(View("doc_growth", compute_doc_growth, max_staleness=600, events=("corpus",)))
+SCHEDULER.register(View("directory_tree", directory_structure, max_staleness=60))
@@ -1,290 +1,241 @@
-"""Tools execution endpoint."""
+"""Tools execution endpoints."""
+import asyncio
+import json
 import os
-import subprocess
-import sys
+from typing import Optional, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from services.observability.profiling import run_in_threadpool
+from services.tools.cache import get_tool_cache
+from services.tools.commands import TOOL_TIMEOUT, ToolPlanError, plan_tool_run
+from services.tools.history import get_tool_history, parse_window
+from services.tools.probe import get_catalog, reprobe
+from services.tools.runs import ToolRun, get_run_manager
+from services.tools.sandbox import SANDBOX_SUPPORTED, configured_limits
+from services.tools.warm import get_warm_runner
+
 router = APIRouter(prefix="/api/v1/tools", tags=["tools"])
 
 # Check if running in demo mode
 DEMO_MODE = os.getenv("DEMO_MODE", "false").lower() == "true"
-DEMO_SCRIPTS_DIR = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "../../demo_scripts")
-)
 
 
 class ToolExecRequest(BaseModel):
     tool_id: str
-    args: dict
+    args: dict = {}
+    priority: str = "interactive"  # or "background"
+    use_cache: bool = True
+
+
+async def start_tool_run(
+    tool_id: str,
+    args: Optional[dict],
+    priority: str = "interactive",
+    use_cache: bool = True
+) -> Tuple[ToolRun, bool]:
+    """
+    Plan and queue a run; returns the run and whether it is new (False when
+    an identical queued run was joined). Read-only tools whose inputs are
+    unchanged since an earlier run get that result back as a finished run
+    (``cached``). Raises ToolPlanError for unknown tools or missing scripts
+    and ValueError for an unknown priority.
+    """
+    attempts = plan_tool_run(tool_id, args, DEMO_MODE)
+    lookup = None
+    if use_cache:
+        # Fingerprinting stats the tool's input files
+        lookup = await run_in_threadpool(get_tool_cache().lookup, tool_id, args, attempts)
+    return get_run_manager().submit(tool_id, args, attempts, priority, lookup)
+
+
+def _get_run(run_id: str) -> ToolRun:
+    run = get_run_manager().get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    return run
+
+
+@router.get("")
+async def list_tools():
+    """
+    Tools this server can run: the built-in tool ids with the execution
+    strategies the probe found working here, and the AgentQMS tool registry
+    (``tool_registry.gather_tools()``) whose scripts can be run by path.
+    """
+    catalog = get_catalog()
+    if catalog is None and not DEMO_MODE:
+        catalog = await run_in_threadpool(reprobe)
+    if catalog is None:
+        return {"demo_mode": DEMO_MODE, "probed_at": None, "tools": {}, "registry": []}
+    return {"demo_mode": DEMO_MODE, **catalog.to_dict()}
 
 
 @router.post("/exec")
 async def execute_tool(request: ToolExecRequest):
-    """Execute an AgentQMS tool via make command or demo stub."""
-    
-    if DEMO_MODE:
-        # Check if tool_id is a script path
-        if request.tool_id.startswith(("AgentQMS/", "agent_tools/", "AgentQMS\\", "agent_tools\\")):
-            script_path = os.path.join(workspace_root, request.tool_id.replace("\\", "/"))
-            if os.path.exists(script_path):
-                cmd = [sys.executable, script_path]
-                if request.args:
-                    for key, value in request.args.items():
-                        if value:
-                            cmd.append(str(value))
-            else:
-                return {
-                    "success": False,
-                    "error": f"Script not found: {script_path}",
-                    "output": ""
-                }
-        else:
-            # Use demo stubs
-            demo_commands = {
-                "validate": ["python", os.path.join(DEMO_SCRIPTS_DIR, "validate_stub.py")],
-                "compliance": ["python", os.path.join(DEMO_SCRIPTS_DIR, "compliance_stub.py")],
-                "boundary": ["python", os.path.join(DEMO_SCRIPTS_DIR, "validate_stub.py")],
-                "discover": ["echo", "Demo: Tool discovery not implemented"],
-                "status": ["echo", "Demo: Status check OK"],
-                "ast_analyze": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "analyze", "."],
-                "ast_generate_tests": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "generate-tests"],
-                "ast_extract_docs": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "extract-docs"],
-                "ast_check_quality": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "check-quality", "."],
-            }
-            cmd = demo_commands.get(request.tool_id)
-            
-            # For AST tools in demo mode, add arguments
-            if cmd and request.tool_id.startswith("ast_") and request.args:
-                for key, value in request.args.items():
-                    if value:
-                        cmd.append(str(value))
-        
-        if not cmd:
-            return {
-                "success": False,
-                "error": f"Unknown tool: {request.tool_id}",
-                "output": ""
-            }
-        
-        # Get workspace root for demo scripts
-        workspace_root = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "../..")
-        )
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=workspace_root
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr if result.returncode != 0 else None,
-                "return_code": result.returncode
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Tool execution timed out",
-                "output": ""
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "output": ""
-            }
-    else:
-        # Real execution path (expects AgentQMS present)
-        # Workspace root (backend/routes -> backend -> project root)
-        workspace_root = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "../..")
-        )
-
-        # Verify AgentQMS exists
-        agentqms_path = os.path.join(workspace_root, "AgentQMS", "interface")
-        if not os.path.exists(agentqms_path):
-            return {
-                "success": False,
-                "error": f"AgentQMS path not found at {agentqms_path}",
-                "output": ""
-            }
-
-        # Map tool IDs to commands (try make first, fallback to direct script execution)
-        tool_make_commands = {
-            "validate": ["make", "-C", "AgentQMS/interface", "validate"],
-            "compliance": ["make", "-C", "AgentQMS/interface", "compliance"],
-            "boundary": ["make", "-C", "AgentQMS/interface", "boundary"],
-            "discover": ["make", "-C", "AgentQMS/interface", "discover"],
-            "status": ["make", "-C", "AgentQMS/interface", "status"],
-            "ast_analyze": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "analyze"],
-            "ast_generate_tests": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "generate-tests"],
-            "ast_extract_docs": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "extract-docs"],
-            "ast_check_quality": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "check-quality"],
-        }
-
-        # Fallback: direct script execution (if make/uv not available)
-        # Auto-detect artifacts root for validation tools
-        def get_artifacts_root_for_tools():
-            """Get artifacts root with auto-detection."""
-            demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
-            artifacts_rel = "demo_data/artifacts" if demo_mode else "docs/artifacts"
-            artifacts_root = os.path.join(workspace_root, artifacts_rel)
-            
-            # Auto-detect: if configured path doesn't exist, try the alternative
-            if not os.path.exists(artifacts_root):
-                alt_artifacts_rel = "docs/artifacts" if demo_mode else "demo_data/artifacts"
-                alt_artifacts_root = os.path.join(workspace_root, alt_artifacts_rel)
-                if os.path.exists(alt_artifacts_root):
-                    return alt_artifacts_root
-            return artifacts_root
-        
-        artifacts_root = get_artifacts_root_for_tools()
-        
-        tool_direct_commands = {
-            "validate": [sys.executable, "AgentQMS/agent_tools/compliance/validate_artifacts.py", "--all", "--artifacts-root", artifacts_root],
-            "compliance": [sys.executable, "AgentQMS/agent_tools/compliance/monitor_artifacts.py", "--check", "--artifacts-root", artifacts_root],
-            "boundary": [sys.executable, "AgentQMS/agent_tools/compliance/validate_boundaries.py"],
-            "discover": [sys.executable, "AgentQMS/agent_tools/core/discover.py"],
-            "status": ["echo", "Status check - AgentQMS interface available"],
-            "ast_analyze": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "analyze"],
-            "ast_generate_tests": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "generate-tests"],
-            "ast_extract_docs": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "extract-docs"],
-            "ast_check_quality": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "check-quality"],
-        }
-
-        # Check if tool_id is a script path (starts with AgentQMS/ or agent_tools/)
-        if request.tool_id.startswith(("AgentQMS/", "agent_tools/", "AgentQMS\\", "agent_tools\\")):
-            # Direct script execution
-            script_path = os.path.join(workspace_root, request.tool_id.replace("\\", "/"))
-            if not os.path.exists(script_path):
-                return {
-                    "success": False,
-                    "error": f"Script not found: {script_path}",
-                    "output": ""
-                }
-            
-            # Build command with arguments
-            cmd = [sys.executable, script_path]
-            if request.args:
-                for key, value in request.args.items():
-                    if value:  # Only add non-empty arguments
-                        cmd.append(str(value))
-            
-            # Set PYTHONPATH for imports
-            env = os.environ.copy()
-            env["PYTHONPATH"] = workspace_root + os.pathsep + env.get("PYTHONPATH", "")
-            
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    cwd=workspace_root,
-                    env=env
-                )
-                
-                return {
-                    "success": result.returncode == 0,
-                    "output": result.stdout,
-                    "error": result.stderr if result.returncode != 0 else None,
-                    "return_code": result.returncode
-                }
-            except subprocess.TimeoutExpired:
-                return {
-                    "success": False,
-                    "error": "Tool execution timed out",
-                    "output": ""
-                }
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "output": ""
-                }
-        
-        if request.tool_id not in tool_make_commands:
-            return {
-                "success": False,
-                "error": f"Unknown tool: {request.tool_id}",
-                "output": ""
-            }
-
-        try:
-            # For AST tools, use direct execution (they don't use make)
-            if request.tool_id.startswith("ast_"):
-                cmd = tool_direct_commands.get(request.tool_id, tool_make_commands[request.tool_id])
-                # Add arguments from request.args (AST tools use positional args)
-                if request.args:
-                    # For AST tools, 'path' key contains the positional argument
-                    if 'path' in request.args and request.args['path']:
-                        cmd.append(str(request.args['path']))
-                    # Also check for direct values (fallback)
-                    for key, value in request.args.items():
-                        if key != 'path' and value:  # Skip 'path' as we already handled it
-                            cmd.append(str(value))
-                
-                # Set PYTHONPATH for imports
-                env = os.environ.copy()
-                env["PYTHONPATH"] = workspace_root + os.pathsep + env.get("PYTHONPATH", "")
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    cwd=workspace_root,
-                    env=env
-                )
-            else:
-                # Try make command first
-                cmd = tool_make_commands[request.tool_id]
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    cwd=workspace_root
-                )
-
-                # If make fails and it's a known tool, try direct script execution
-                if result.returncode != 0 and request.tool_id in tool_direct_commands:
-                    fallback_cmd = tool_direct_commands[request.tool_id]
-                    # Set PYTHONPATH for imports
-                    env = os.environ.copy()
-                    env["PYTHONPATH"] = workspace_root + os.pathsep + env.get("PYTHONPATH", "")
-                    
-                    result = subprocess.run(
-                        fallback_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=60,
-                        cwd=workspace_root,
-                        env=env
-                    )
-
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr if result.returncode != 0 else None,
-                "return_code": result.returncode
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Tool execution timed out",
-                "output": ""
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "output": ""
-            }
+    """
+    Execute an AgentQMS tool via make command or demo stub and wait for it.
+
+    The run goes through the tool queue and executes as an asyncio
+    subprocess, so waiting does not hold a worker thread. The run is also
+    retained under ``run_id``; use ``POST /runs`` to start a tool without
+    waiting.
+    """
+    try:
+        run, _ = await start_tool_run(request.tool_id, request.args, request.priority, request.use_cache)
+    except (ToolPlanError, ValueError) as e:
+        return {"success": False, "error": str(e), "output": ""}
+
+    # A client disconnect must not cancel the run itself
+    await asyncio.shield(run.wait())
+    return run.legacy_result()
+
+
+@router.post("/runs", status_code=202)
+async def start_run(request: ToolExecRequest):
+    """
+    Queue a tool run and return immediately.
+
+    The response includes ``queue_position`` while the run waits for a
+    worker; ``deduplicated`` is true when an identical queued run was
+    returned instead of queueing another, and ``cached`` when the run was
+    answered from the result cache (it is then already finished).
+    """
+    try:
+        run, created = await start_tool_run(request.tool_id, request.args, request.priority, request.use_cache)
+    except (ToolPlanError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {**run.to_dict(), "deduplicated": not created}
+
+
+@router.get("/runs")
+async def list_runs():
+    """Recent tool runs, newest first (output omitted)."""
+    return {"runs": get_run_manager().list()}
+
+
+@router.get("/queue")
+async def get_queue():
+    """Worker and per-tool limits, sandbox limits, warm pool and cache state, and queued runs in start order."""
+    manager = get_run_manager()
+    return {
+        **manager.stats(),
+        "warm_runner": get_warm_runner().stats(),
+        "result_cache": get_tool_cache().stats(),
+        "sandbox": {"supported": SANDBOX_SUPPORTED, **configured_limits()},
+        "queue": [run.to_dict() for run in manager.queued()],
+    }
+
+
+@router.delete("/cache")
+async def clear_cache():
+    """Drop every cached tool result."""
+    return {"cleared": get_tool_cache().clear()}
+
+
+@router.get("/history")
+async def get_history(
+    tool: Optional[str] = Query(None, description="Only runs of this tool"),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """Recorded tool runs, newest first."""
+    runs = await run_in_threadpool(get_tool_history().recent, tool, limit)
+    return {"runs": runs}
+
+
+@router.get("/history/stats")
+async def get_history_stats(
+    window: str = Query("24h", description="How far back to look, e.g. 30m, 24h, 7d"),
+    tool: Optional[str] = Query(None, description="Only this tool")
+):
+    """
+    Per-tool run counts, failure rates and p50/p90/p95/p99/max of duration,
+    queue wait, output size and peak RSS over the window, for spotting
+    slowdowns and sizing timeouts (currently a fixed ``timeout_s``).
+    """
+    try:
+        window_seconds = parse_window(window)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    tools = await run_in_threadpool(get_tool_history().stats, window_seconds, tool)
+    return {"window": window, "window_seconds": window_seconds, "timeout_s": TOOL_TIMEOUT, "tools": tools}
+
+
+@router.get("/runs/{run_id}")
+async def get_run(run_id: str, output: bool = Query(True, description="Include stdout/stderr of the final attempt")):
+    """Status of a run and, once available, its exit code and output."""
+    return _get_run(run_id).to_dict(include_output=output)
+
+
+@router.get("/runs/{run_id}/output")
+async def get_run_output(
+    run_id: str,
+    offset: int = Query(0, ge=0, description="Sequence number of the first line"),
+    limit: int = Query(1000, ge=1, le=10000),
+    stream: Optional[str] = Query(None, description="Only stdout or stderr lines")
+):
+    """
+    A page of a run's output lines, including output spilled to disk.
+
+    ``next_offset`` is where the next page starts (null once the end of the
+    output so far has been reached).
+    """
+    run = _get_run(run_id)
+    page = run.log.read(offset, limit)
+    next_offset = page[-1]["seq"] + 1 if page else offset
+    if stream:
+        page = [line for line in page if line["stream"] == stream]
+    return {
+        "run_id": run.id,
+        "status": run.status,
+        "offset": offset,
+        "line_count": run.log.count,
+        "lines": page,
+        "next_offset": next_offset if next_offset < run.log.count else None,
+    }
+
+
+@router.post("/runs/{run_id}/cancel")
+async def cancel_run(run_id: str):
+    """Cancel a queued or running tool (SIGTERM to its process group, then SIGKILL after a grace period)."""
+    run = _get_run(run_id)
+    await get_run_manager().cancel(run)
+    await asyncio.shield(run.wait())
+    return run.to_dict()
+
+
+@router.get("/runs/{run_id}/stream")
+async def stream_run(
+    run_id: str,
+    after: int = Query(-1, description="Only send lines with a higher sequence number"),
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    Server-Sent Events stream of a run's output.
+
+    Each line is sent as a ``stdout``, ``stderr`` or ``attempt`` event whose
+    ``id`` is its sequence number, so an ``EventSource`` that reconnects
+    (``Last-Event-ID``) resumes where it left off. Lines produced before the
+    client connected are replayed first. A final ``end`` event carries the
+    run's status and exit code.
+    """
+    run = _get_run(run_id)
+    if last_event_id is not None and last_event_id.isdigit():
+        after = max(after, int(last_event_id))
+
+    async def events():
+        async for line in run.follow(after):
+            if line is None:
+                yield ": keepalive\n\n"
+                continue
+            data = json.dumps({"text": line["text"], "attempt": line["attempt"]})
+            yield f"id: {line['seq']}\nevent: {line['stream']}\ndata: {data}\n\n"
+        yield f"event: end\ndata: {json.dumps(run.to_dict())}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,9 +1,14 @@
-"""Tracking database status endpoint."""
+"""Tracking database endpoints: status text and structured, paginated listings."""
 import os
-import subprocess
+import sqlite3
 import sys
+from typing import Any, Callable, Dict, List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+
+from services.observability.profiling import run_in_threadpool
+from services.tracking import demo
 
 # Ensure AgentQMS is in path (backend/routes -> backend -> project root)
 workspace_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
@@ -11,127 +16,149 @@ sys.path.insert(0, workspace_root)
 
 router = APIRouter(prefix="/api/v1/tracking", tags=["tracking"])
 
-# Check if running in demo mode
-DEMO_MODE = os.getenv("DEMO_MODE", "false").lower() == "true"
-DEMO_SCRIPTS_DIR = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "../../demo_scripts")
-)
+
+class IngestRunsRequest(BaseModel):
+    # Same records as `tracking exp ingest` reads from JSONL
+    runs: List[Dict[str, Any]]
+    batch_size: Optional[int] = None
+
+# Status texts of an empty tracking database (shown as demo data instead)
+EMPTY_PATTERNS = ["no plans found", "no experiments found", "no debug sessions", "no refactors", "no data found"]
+
+
+def _demo_mode() -> bool:
+    return os.getenv("DEMO_MODE", "false").lower() == "true"
 
 
 @router.get("/status")
-async def get_tracking_status(kind: str = Query("all", description="Kind: plan, experiment, debug, refactor, or all")):
+def get_tracking_status(kind: str = Query("all", description="Kind: plan, experiment, debug, refactor, or all")):
     """Get tracking database status for plans, experiments, debug sessions, or refactors."""
-    
-    if DEMO_MODE:
-        # Use demo stub
-        try:
-            workspace_root = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "../..")
-            )
-            result = subprocess.run(
-                ["python", os.path.join(DEMO_SCRIPTS_DIR, "tracking_stub.py"), "--kind", kind],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=workspace_root
-            )
-            status_text = result.stdout.strip()
-            return {
-                "kind": kind,
-                "status": status_text,
-                "success": result.returncode == 0
-            }
-        except Exception as e:
-            return {
-                "kind": kind,
-                "status": "",
-                "success": False,
-                "error": str(e)
-            }
-    else:
-        # Real AgentQMS tracking (requires AgentQMS in path)
+    return read_tracking_status(kind)
+
+
+def read_tracking_status(kind: str = "all") -> dict:
+    """Tracking status text for ``kind``, using the demo data in demo mode or when the database is empty."""
+    # Demo images ship without AgentQMS/; the demo data needs none of it
+    if _demo_mode():
+        return {"kind": kind, "status": demo.get_status(kind), "success": True}
+
+    try:
+        from AgentQMS.agent_tools.utilities.tracking.query import get_status
+    except ImportError as e:
+        return {
+            "kind": kind,
+            "status": f"AgentQMS tracking module not available: {str(e)}\n\nTo use real tracking, ensure:\n1. AgentQMS/ directory exists\n2. DEMO_MODE=false\n3. Tracking database is initialized",
+            "success": False,
+            "error": f"Import error: {str(e)}"
+        }
+
+    try:
+        status_text = get_status(kind)
+        # If the real database returns empty results, show demo data for better UX
+        if status_text and any(pattern in status_text.lower() for pattern in EMPTY_PATTERNS):
+            status_text = demo.get_status(kind)
+        return {"kind": kind, "status": status_text, "success": True}
+    except Exception as e:
+        return {
+            "kind": kind,
+            "status": f"Error querying tracking database: {str(e)}",
+            "success": False,
+            "error": str(e)
+        }
+
+
+def _list(name: str, filtered: bool, **kwargs) -> Dict[str, Any]:
+    """
+    Run one of the ``query.list_*`` functions against the tracking database
+    (or its ``demo.list_*`` counterpart) and tag the page with where it came from.
+    """
+    list_demo: Callable[..., Dict[str, Any]] = getattr(demo, name)
+    try:
+        if _demo_mode():
+            return {**list_demo(**kwargs), "source": "demo"}
+
         try:
-            # Ensure workspace root is in path
-            workspace_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
-            if workspace_root not in sys.path:
-                sys.path.insert(0, workspace_root)
-            
-            from AgentQMS.agent_tools.utilities.tracking.query import get_status
-
-            status_text = get_status(kind)
-            
-            # If the real database returns empty results, fall back to demo data
-            # Check for empty status patterns (with or without periods/semicolons)
-            empty_patterns = ["no plans found", "no experiments found", "no debug sessions", "no refactors", "no data found"]
-            status_lower = status_text.lower() if status_text else ""
-            if status_text and any(pattern in status_lower for pattern in empty_patterns):
-                # Fall back to demo stub for better UX
-                try:
-                    result = subprocess.run(
-                        ["python", os.path.join(DEMO_SCRIPTS_DIR, "tracking_stub.py"), "--kind", kind],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                        cwd=workspace_root
-                    )
-                    if result.returncode == 0:
-                        status_text = result.stdout.strip()
-                except Exception:
-                    pass  # Keep original empty status if demo stub fails
-            
-            return {
-                "kind": kind,
-                "status": status_text,
-                "success": True
-            }
+            from AgentQMS.agent_tools.utilities.tracking import query
         except ImportError as e:
-            # AgentQMS not available - fall back to demo stub
-            try:
-                result = subprocess.run(
-                    ["python", os.path.join(DEMO_SCRIPTS_DIR, "tracking_stub.py"), "--kind", kind],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=workspace_root
-                )
-                if result.returncode == 0:
-                    return {
-                        "kind": kind,
-                        "status": result.stdout.strip(),
-                        "success": True
-                    }
-            except Exception:
-                pass
-            
-            # If demo stub also fails, return helpful error
-            return {
-                "kind": kind,
-                "status": f"AgentQMS tracking module not available: {str(e)}\n\nTo use real tracking, ensure:\n1. AgentQMS/ directory exists\n2. DEMO_MODE=false\n3. Tracking database is initialized",
-                "success": False,
-                "error": f"Import error: {str(e)}"
-            }
-        except Exception as e:
-            # On any error, try demo stub as fallback
-            try:
-                result = subprocess.run(
-                    ["python", os.path.join(DEMO_SCRIPTS_DIR, "tracking_stub.py"), "--kind", kind],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    cwd=workspace_root
-                )
-                if result.returncode == 0:
-                    return {
-                        "kind": kind,
-                        "status": result.stdout.strip(),
-                        "success": True
-                    }
-            except Exception:
-                pass
-            
-            return {
-                "kind": kind,
-                "status": f"Error querying tracking database: {str(e)}",
-                "success": False,
-                "error": str(e)
-            }
+            raise HTTPException(status_code=503, detail=f"AgentQMS tracking module not available: {e}")
+        page = getattr(query, name)(**kwargs)
+        # An empty database shows the demo data, as /status does; a filter
+        # that matches nothing is a real (empty) answer
+        if page["total"] == 0 and not filtered:
+            return {**list_demo(**kwargs), "source": "demo"}
+        return {**page, "source": "database"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=500, detail=f"Error querying tracking database: {e}")
+
+
+@router.get("/plans")
+def list_plans(
+    status: Optional[str] = Query(None, description="pending, in_progress, paused, completed or cancelled"),
+    owner: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Substring of the key or title"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """Feature plans with open and total task counts, most recently updated first."""
+    return _list("list_plans", bool(status or owner or q),
+                 status=status, owner=owner, search=q, limit=limit, offset=offset)
+
+
+@router.get("/experiments")
+def list_experiments(
+    status: Optional[str] = Query(None, description="pending, in_progress, paused, completed or cancelled"),
+    owner: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Substring of the key or title"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """Experiments with their run count and latest run, most recently updated first."""
+    return _list("list_experiments", bool(status or owner or q),
+                 status=status, owner=owner, search=q, limit=limit, offset=offset)
+
+
+@router.get("/debug")
+def list_debug_sessions(
+    status: Optional[str] = Query(None, description="pending, in_progress, paused, completed or cancelled"),
+    q: Optional[str] = Query(None, description="Substring of the key or title"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """Debug sessions with their note count, most recently started first."""
+    return _list("list_debug_sessions", bool(status or q),
+                 status=status, search=q, limit=limit, offset=offset)
+
+
+@router.get("/refactors")
+def list_refactors(
+    status: Optional[str] = Query(None, description="pending, in_progress, paused, completed or cancelled"),
+    q: Optional[str] = Query(None, description="Substring of the key or title"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    """Refactors, most recently updated first."""
+    return _list("list_refactors", bool(status or q),
+                 status=status, search=q, limit=limit, offset=offset)
+
+
+@router.post("/experiments/ingest")
+async def ingest_experiment_runs(request: IngestRunsRequest):
+    """Bulk-load experiment runs (and their artifacts) into the tracking database."""
+    if _demo_mode():
+        raise HTTPException(status_code=409, detail="Tracking ingestion is disabled in demo mode")
+    try:
+        from AgentQMS.agent_tools.utilities.tracking import db
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=f"AgentQMS tracking module not available: {e}")
+
+    try:
+        # Large imports take a while; keep them off the event loop
+        return await run_in_threadpool(
+            db.ingest_experiment_runs, request.runs, request.batch_size or db.INGEST_BATCH_SIZE
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=500, detail=f"Error writing tracking database: {e}")
@@ -0,0 +1,35 @@
+"""Materialized views: status, values and manual refresh."""
+from fastapi import APIRouter, HTTPException, Response
+
+from services.observability.profiling import run_in_threadpool
+from services.views.scheduler import SCHEDULER
+
+router = APIRouter(prefix="/api/v1/views", tags=["views"])
+
+
+@router.get("")
+async def list_views():
+    """Every registered view with its age and last computation time (values omitted)."""
+    return {
+        "scheduler_enabled": SCHEDULER.enabled,
+        "views": [view.snapshot(include_value=False) for view in SCHEDULER.views.values()]
+    }
+
+
+@router.get("/{name}")
+async def get_view(name: str, response: Response):
+    """Latest materialized value of a view; ``Age`` is its age in whole seconds."""
+    if name not in SCHEDULER.views:
+        raise HTTPException(status_code=404, detail=f"Unknown view: {name}")
+    snapshot = await run_in_threadpool(SCHEDULER.read, name)
+    response.headers["Age"] = str(int(snapshot["age_seconds"] or 0))
+    return snapshot
+
+
+@router.post("/{name}/refresh", status_code=202)
+async def refresh_view(name: str):
+    """Schedule a recomputation on the next scheduler tick."""
+    if name not in SCHEDULER.views:
+        raise HTTPException(status_code=404, detail=f"Unknown view: {name}")
+    SCHEDULER.request_refresh(name)
+    return SCHEDULER.get(name).snapshot(include_value=False)
@@ -1,5 +1,7 @@
+import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,13 +15,37 @@ workspace_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, workspace_root)
 
 import fs_utils
-from routes import artifacts, compliance, system, tools, tracking
+from routes import admin, artifacts, compliance, dashboard, metrics, system, tools, tracking, views
+from services.observability.metrics import MetricsMiddleware
+from services.observability.profiling import ProfilingMiddleware, trace_sync_endpoints
+from services.tools.probe import reprobe
+from services.tools.warm import WARM_ENABLED, get_warm_runner
+from services.views.scheduler import SCHEDULER
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Plain `def` endpoints run in the threadpool; keep them in request
+    # profiles (every route, including those defined below, exists by now)
+    trace_sync_endpoints(app)
+    # Start materializing background views before the first request needs them
+    SCHEDULER.start()
+    demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
+    if not demo_mode and os.path.isdir(os.path.join(workspace_root, "AgentQMS", "interface")):
+        # Decide once how each tool can run here, rather than failing over per call
+        await asyncio.to_thread(reprobe)
+        # Spawn the warm tool workers now so the first tool run skips the imports
+        if WARM_ENABLED:
+            get_warm_runner().warm_up()
+    yield
+    get_warm_runner().recycle()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="AgentQMS Dashboard Bridge",
     description="Backend bridge for AgentQMS Manager Dashboard",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Include Routers
@@ -28,6 +54,10 @@ app.include_router(compliance.router)
 app.include_router(system.router)
 app.include_router(tracking.router)
 app.include_router(tools.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
+app.include_router(dashboard.router)
+app.include_router(views.router)
 
 # Configure CORS
 app.add_middleware(
@@ -38,6 +68,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request duration / in-flight metrics for /metrics
+app.add_middleware(MetricsMiddleware)
+# Opt-in request profiling (REQUEST_PROFILING=true) and the slow-request log
+app.add_middleware(ProfilingMiddleware)
+
 # Models
 class WriteRequest(BaseModel):
     path: str
@@ -50,12 +85,7 @@ class ToolExecRequest(BaseModel):
 @app.get("/status")
 async def get_status():
     """Health check endpoint."""
-    return {
-        "status": "online",
-        "version": "0.1.0",
-        "cwd": os.getcwd(),
-        "agentqms_root": os.path.abspath(os.path.join(os.getcwd(), "../../.."))
-    }
+    return system.bridge_status()
 
 # Health check endpoint for Cloud Run
 @app.get("/api/v1/health")
@@ -106,53 +136,33 @@ async def write_file(request: WriteRequest):
 
 @app.post("/tools/exec")
 async def execute_tool(request: ToolExecRequest):
-    """Execute an AgentQMS tool via make command."""
-    import subprocess
-
-    # Map tool IDs to make targets
-    tool_commands = {
-        "validate": ["make", "-C", "AgentQMS/interface", "validate"],
-        "compliance": ["make", "-C", "AgentQMS/interface", "compliance"],
-        "boundary": ["make", "-C", "AgentQMS/interface", "boundary"],
-    }
+    """Execute an AgentQMS tool (legacy path; runs through /api/v1/tools)."""
+    from services.tools.commands import ToolPlanError
 
-    if request.tool_id not in tool_commands:
+    try:
+        run, _ = await tools.start_tool_run(request.tool_id, request.args)
+    except ToolPlanError as e:
         return {
             "tool_id": request.tool_id,
             "exit_code": 1,
             "stdout": "",
-            "stderr": f"Unknown tool_id: {request.tool_id}. Available: {list(tool_commands.keys())}"
+            "stderr": str(e)
         }
 
-    try:
-        result = subprocess.run(
-            tool_commands[request.tool_id],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=os.path.abspath(".")
-        )
-
-        return {
-            "tool_id": request.tool_id,
-            "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr
-        }
-    except subprocess.TimeoutExpired:
+    await asyncio.shield(run.wait())
+    if run.status == "timed_out":
         return {
             "tool_id": request.tool_id,
             "exit_code": 124,
-            "stdout": "",
-            "stderr": "Tool execution timed out after 30 seconds"
-        }
-    except Exception as e:
-        return {
-            "tool_id": request.tool_id,
-            "exit_code": 1,
-            "stdout": "",
-            "stderr": str(e)
+            "stdout": run.output("stdout"),
+            "stderr": "Tool execution timed out"
         }
+    return {
+        "tool_id": request.tool_id,
+        "exit_code": run.exit_code if run.exit_code is not None else 1,
+        "stdout": run.output("stdout"),
+        "stderr": run.output("stderr") or (run.error or "")
+    }
 
 # Serve static files in production (Cloud Run)
 if os.path.exists("frontend/dist"):
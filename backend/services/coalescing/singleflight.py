@@ -0,0 +1,113 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from services.corpus.index import on_invalidate
+from services.observability.caches import register_cache
+from services.observability.metrics import register_pool
+from services.observability.profiling import in_request_thread
+
+# Default result TTL for coalesced endpoints; 0 only merges calls that overlap
+DEFAULT_TTL = float(os.getenv("COALESCE_TTL_SECONDS", "0"))
+MAX_WORKERS = int(os.getenv("COALESCE_WORKERS", "4"))
+# Expired results are swept once a flight group holds this many
+MAX_CACHED_RESULTS = 256
+
+# Shared by every flight group; computations run here rather than in the
+# request's threadpool slot so a disconnecting leader cannot orphan waiters.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="singleflight")
+register_pool("singleflight", lambda: _executor._work_queue.qsize())
+
+
+def make_key(*parts: Any, **params: Any) -> Tuple:
+    """Hashable key from positional parts and keyword params (order-insensitive)."""
+    return parts + tuple(sorted((name, repr(value)) for name, value in params.items()))
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one computation.
+
+    The first caller for a key starts ``fn`` on a worker thread; callers that
+    arrive while it is running await the same result instead of starting
+    their own. Exceptions are shared the same way but never cached. With a
+    TTL, a successful result is also reused for ``ttl`` seconds after it
+    completes.
+    """
+
+    def __init__(self, name: str, ttl: float = DEFAULT_TTL):
+        self.name = name
+        self.ttl = ttl
+        self.executions = 0
+        self.coalesced = 0
+        self.ttl_hits = 0
+        self._inflight: Dict[Hashable, Future] = {}
+        # key -> (expires_at, value)
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        register_cache(f"singleflight_{name}", self.stats)
+        # Writes through the API must not be hidden behind a TTL-cached result
+        on_invalidate(self.invalidate)
+
+    async def run(self, key: Hashable, fn: Callable[..., Any], *args: Any, ttl: Optional[float] = None) -> Any:
+        """Return ``fn(*args)``, sharing the computation with identical concurrent calls."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self.ttl_hits += 1
+                    return cached[1]
+                del self._results[key]
+
+            future = self._inflight.get(key)
+            if future is None:
+                self.executions += 1
+                # Run in the leader's context so its request profile covers the computation
+                future = self._inflight[key] = _executor.submit(
+                    copy_context().run, in_request_thread(self._call), key, ttl, fn, args
+                )
+            else:
+                self.coalesced += 1
+
+        # shield: a cancelled (disconnected) caller must not cancel the shared computation
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _call(self, key: Hashable, ttl: float, fn: Callable[..., Any], args: Tuple) -> Any:
+        try:
+            value = fn(*args)
+        except BaseException:
+            with self._lock:
+                self._inflight.pop(key, None)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            if ttl > 0:
+                now = time.monotonic()
+                if len(self._results) >= MAX_CACHED_RESULTS:
+                    self._results = {k: v for k, v in self._results.items() if v[0] > now}
+                self._results[key] = (now + ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop TTL-cached results (in-flight computations still complete)."""
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            live = sum(1 for expires, _ in self._results.values() if expires > now)
+            return {
+                "hits": self.coalesced + self.ttl_hits,
+                "misses": self.executions,
+                "coalesced": self.coalesced,
+                "ttl_hits": self.ttl_hits,
+                "in_flight": len(self._inflight),
+                "entries": live,
+                "ttl_seconds": self.ttl,
+            }
@@ -0,0 +1,136 @@
+import hashlib
+import os
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Leading "YYYY-MM-DD_" or "YYYY-MM-DD_HHMM_" timestamp in artifact filenames
+TIMESTAMP_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2}(?:_\d{4})?_")
+
+# Frontmatter fields that point at other artifacts
+REFERENCE_FIELDS = ("related", "supersedes")
+
+
+def artifact_id(file_path: str) -> str:
+    """Artifact ID is the filename without extension (timestamp + slug)."""
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+def artifact_slug(file_path: str) -> str:
+    """Slug is the artifact ID with its timestamp prefix removed."""
+    return TIMESTAMP_PREFIX.sub("", artifact_id(file_path)).lower()
+
+
+def normalize_reference(value: Any) -> Optional[str]:
+    """Reduce a reference (ID, filename or path) to a comparable artifact ID."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    ref = value.strip().replace("\\", "/").rstrip("/")
+    ref = ref.rsplit("/", 1)[-1]
+    if ref.endswith(".md"):
+        ref = ref[:-3]
+    return ref or None
+
+
+class CrossArtifactIndex:
+    """
+    Corpus-level rule stage built on hash indexes.
+
+    Files are added one at a time while the per-file validator runs; each
+    ``add`` is O(1) and ``check`` makes a single pass over the indexes, so the
+    whole stage is O(n) instead of comparing every pair of artifacts.
+    """
+
+    def __init__(self):
+        self.by_id: Dict[str, List[str]] = defaultdict(list)
+        self.by_title: Dict[str, List[str]] = defaultdict(list)
+        self.by_slug: Dict[str, List[str]] = defaultdict(list)
+        self.by_content: Dict[str, List[str]] = defaultdict(list)
+        # (source path, field, raw value, normalized id)
+        self.references: List[tuple] = []
+
+    def __len__(self) -> int:
+        return sum(len(paths) for paths in self.by_id.values())
+
+    def add(self, file_path: str, metadata: Optional[dict], content: Optional[bytes] = None) -> None:
+        """Index a single artifact."""
+        metadata = metadata or {}
+
+        self.by_id[artifact_id(file_path)].append(file_path)
+        self.by_slug[artifact_slug(file_path)].append(file_path)
+
+        title = metadata.get("title")
+        if isinstance(title, str) and title.strip():
+            self.by_title[" ".join(title.lower().split())].append(file_path)
+
+        if content is not None:
+            self.by_content[hashlib.sha1(content).hexdigest()].append(file_path)
+
+        for field in REFERENCE_FIELDS:
+            values = metadata.get(field)
+            if values is None:
+                continue
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                ref = normalize_reference(value)
+                if ref:
+                    self.references.append((file_path, field, value, ref))
+
+    def check(self) -> List[Dict[str, Any]]:
+        """Return cross-artifact violations in the validator's violation format."""
+        violations: List[Dict[str, Any]] = []
+
+        violations += self._duplicates(
+            self.by_id, "duplicate_id", "error",
+            lambda key, others: f"Artifact ID '{key}' is also used by: {', '.join(others)}"
+        )
+        violations += self._duplicates(
+            self.by_title, "duplicate_title", "warning",
+            lambda key, others: f"Title is also used by: {', '.join(others)}"
+        )
+        # Same slug with the same ID is already reported as duplicate_id
+        violations += self._duplicates(
+            self.by_slug, "duplicate_slug", "warning",
+            lambda key, others: f"Slug '{key}' is also used by: {', '.join(others)}",
+            skip=lambda paths: len({artifact_id(p) for p in paths}) == 1
+        )
+        violations += self._duplicates(
+            self.by_content, "duplicate_content", "warning",
+            lambda key, others: f"Identical content found in: {', '.join(others)}"
+        )
+
+        for source, field, value, ref in self.references:
+            if ref not in self.by_id:
+                violations.append(_violation(
+                    source, "broken_reference", "error",
+                    f"Frontmatter '{field}' references missing artifact: {value}",
+                    field=field
+                ))
+
+        return violations
+
+    @staticmethod
+    def _duplicates(index, rule_id, severity, describe, skip=None) -> List[Dict[str, Any]]:
+        violations = []
+        for key, paths in index.items():
+            if len(paths) < 2 or (skip and skip(paths)):
+                continue
+            for path in paths:
+                others = [os.path.relpath(p, os.path.dirname(path)) for p in paths if p != path]
+                violations.append(_violation(path, rule_id, severity, describe(key, others)))
+        return violations
+
+
+def _violation(path: str, rule_id: str, severity: str, message: str, field: Optional[str] = None) -> Dict[str, Any]:
+    violation = {
+        "file": os.path.basename(path),
+        "path": path,
+        "rule_id": rule_id,
+        "message": message,
+        "severity": severity,
+    }
+    if field:
+        violation["field"] = field
+    return violation
+
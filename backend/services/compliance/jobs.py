@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.compliance.validator import Validator
+from services.observability.metrics import register_pool
+
+# Worker pool size and how many finished jobs to keep around for result paging
+MAX_WORKERS = int(os.getenv("VALIDATION_JOB_WORKERS", "2"))
+MAX_RETAINED_JOBS = int(os.getenv("VALIDATION_JOB_RETAIN", "50"))
+
+ACTIVE_STATES = ("queued", "running")
+
+
+class ValidationJob:
+    """State of a single background validation run."""
+
+    def __init__(self, key: str, target: str, target_path: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.key = key
+        self.target = target
+        self.target_path = target_path
+        self.status = "queued"
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.files_total = 0
+        self.files_done = 0
+        self.violations_so_far = 0
+        self.result: Optional[Dict[str, Any]] = None
+
+    def progress(self) -> Dict[str, Any]:
+        """Snapshot of the job for the status endpoint."""
+        eta = None
+        if self.status == "running" and self.started_at and self.files_done:
+            elapsed = time.time() - self.started_at
+            eta = round(elapsed / self.files_done * (self.files_total - self.files_done), 2)
+        elif self.status == "completed":
+            eta = 0
+
+        return {
+            "job_id": self.id,
+            "target": self.target,
+            "status": self.status,
+            "files_done": self.files_done,
+            "files_total": self.files_total,
+            "violations_so_far": self.violations_so_far,
+            "eta_seconds": eta,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class ValidationJobManager:
+    """
+    Runs validation jobs on a bounded thread pool.
+
+    Identical requests (same resolved target) submitted while a job for that
+    target is still queued or running share the existing job.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, max_retained: int = MAX_RETAINED_JOBS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="validation-job")
+        self.max_retained = max_retained
+        self.jobs: "OrderedDict[str, ValidationJob]" = OrderedDict()
+        self._active: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, target: str, target_path: str) -> Tuple[ValidationJob, bool]:
+        """Start (or join) a job. Returns the job and whether it was newly created."""
+        key = os.path.normpath(target_path)
+        with self._lock:
+            job_id = self._active.get(key)
+            if job_id and self.jobs[job_id].status in ACTIVE_STATES:
+                return self.jobs[job_id], False
+
+            job = ValidationJob(key, target, target_path)
+            self.jobs[job.id] = job
+            self._active[key] = job.id
+            self._evict()
+
+        self.executor.submit(self._run, job)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[ValidationJob]:
+        return self.jobs.get(job_id)
+
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a free worker."""
+        return sum(1 for job in list(self.jobs.values()) if job.status == "queued")
+
+    def _run(self, job: ValidationJob) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            validator = Validator()
+            if os.path.isfile(job.target_path):
+                files: List[str] = [job.target_path]
+                cross_artifact = False
+            else:
+                files = validator.list_files(job.target_path)
+                cross_artifact = True
+            job.files_total = len(files)
+
+            def on_file(record):
+                job.files_done += 1
+                job.violations_so_far += len(record["violations"])
+
+            job.result = validator.validate_files(files, cross_artifact=cross_artifact, on_file=on_file)
+            job.violations_so_far = len(job.result["violations"])
+            job.status = "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._active.get(job.key) == job.id:
+                    del self._active[job.key]
+
+    def _evict(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit (lock held)."""
+        excess = len(self.jobs) - self.max_retained
+        for job_id in list(self.jobs):
+            if excess <= 0:
+                break
+            if self.jobs[job_id].status not in ACTIVE_STATES:
+                del self.jobs[job_id]
+                excess -= 1
+
+
+_manager: Optional[ValidationJobManager] = None
+
+
+def get_job_manager() -> ValidationJobManager:
+    """Return the process-wide job manager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = ValidationJobManager()
+    return _manager
+
+
+register_pool("validation_jobs", lambda: _manager.queue_depth() if _manager else 0)
@@ -0,0 +1,39 @@
+from typing import Dict, List, Tuple
+
+EMPTY_METRICS = {
+    "schema_compliance": 0,
+    "branch_integration": 0,
+    "timestamp_accuracy": 0,
+    "index_coverage": 0
+}
+
+
+def compute_compliance_metrics(records: List[Tuple[str, dict]]) -> Dict[str, int]:
+    """Compute Strategy Dashboard metrics from (path, frontmatter metadata) records."""
+    total = len(records)
+    if total == 0:
+        return dict(EMPTY_METRICS)
+
+    valid_schema = 0
+    has_timestamps = 0
+    has_branch = 0
+
+    for _, metadata in records:
+        # Schema compliance: has required fields
+        if metadata.get("title") and metadata.get("type") and metadata.get("status"):
+            valid_schema += 1
+
+        # Timestamp accuracy: has date field
+        if metadata.get("date") or metadata.get("created"):
+            has_timestamps += 1
+
+        # Branch integration: has branch_name field
+        if metadata.get("branch_name"):
+            has_branch += 1
+
+    return {
+        "schema_compliance": int((valid_schema / total) * 100),
+        "branch_integration": int((has_branch / total) * 100),
+        "timestamp_accuracy": int((has_timestamps / total) * 100),
+        "index_coverage": int((total / max(total, 1)) * 100)  # Simplified
+    }
@@ -0,0 +1,66 @@
+import heapq
+import time
+from typing import Any, Dict, List, Tuple
+
+try:
+    # Same profiler as `validate_artifacts.py --profile`, so CLI and API
+    # reports have one schema
+    from AgentQMS.agent_tools.utils.profiling import RuleProfiler as ValidationProfiler
+except ImportError:
+    # Images built without AgentQMS/ (see .dockerignore): a minimal copy
+    # producing the same report
+    class ValidationProfiler:
+        """
+        Per-rule timings, slowest files and bytes read for one validation run.
+
+        The validator only touches the profiler when one is passed in, so an
+        unprofiled run pays a single ``is None`` check per stage.
+        """
+
+        def __init__(self, slowest_n: int = 10):
+            self.slowest_n = slowest_n
+            self.rule_time: Dict[str, float] = {}
+            self.rule_calls: Dict[str, int] = {}
+            self.bytes_read = 0
+            self.files = 0
+            self.total_time = 0.0
+            self._slowest: List[Tuple[float, str]] = []
+
+        def lap(self, rule: str, start: float) -> float:
+            """Charge the time since ``start`` to ``rule`` and return the new start."""
+            now = time.perf_counter()
+            self.rule_time[rule] = self.rule_time.get(rule, 0.0) + (now - start)
+            self.rule_calls[rule] = self.rule_calls.get(rule, 0) + 1
+            return now
+
+        def record_file(self, path: str, seconds: float) -> None:
+            self.files += 1
+            self.total_time += seconds
+            entry = (seconds, path)
+            if len(self._slowest) < self.slowest_n:
+                heapq.heappush(self._slowest, entry)
+            elif entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+
+        def add_bytes(self, count: int) -> None:
+            self.bytes_read += count
+
+        def to_dict(self) -> Dict[str, Any]:
+            return {
+                "files": self.files,
+                "total_ms": round(self.total_time * 1000, 3),
+                "bytes_read": self.bytes_read,
+                "rules": [
+                    {
+                        "rule": rule,
+                        "calls": self.rule_calls[rule],
+                        "total_ms": round(seconds * 1000, 3),
+                        "avg_ms": round(seconds * 1000 / self.rule_calls[rule], 4)
+                    }
+                    for rule, seconds in sorted(self.rule_time.items(), key=lambda item: -item[1])
+                ],
+                "slowest_files": [
+                    {"path": path, "ms": round(seconds * 1000, 3)}
+                    for seconds, path in sorted(self._slowest, reverse=True)
+                ]
+            }
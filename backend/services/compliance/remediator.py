@@ -1,15 +1,78 @@
-
 import os
+import difflib
 import frontmatter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from services.compliance.validator import Validator
+from typing import Dict, List, Optional, Tuple
+from services.compliance.validator import RULES, Validator
 from services.git.client import GitClient
 
+# Rules with an automatic fix
+FIXABLE_RULES = ("missing_required_field", "invalid_status")
+
+# Default values for fields we know how to fill in.
+# For Phase 3 L1, we focus on 'date', 'status', 'category' and 'tags'.
+FIELD_DEFAULTS = {
+    "date": lambda metadata: datetime.now().strftime("%Y-%m-%d %H:%M (KST)"),
+    "status": lambda metadata: _allowed_status(metadata) or "draft",
+    "category": lambda metadata: "uncategorized",
+    "tags": lambda metadata: [],
+}
+
+
+def _allowed_status(metadata: dict) -> Optional[str]:
+    """First allowed status for the artifact's type in rules.yaml, if it lists any."""
+    type_rules = RULES["artifact_types"].get(metadata.get("type")) or {}
+    allowed = type_rules.get("allowed_statuses") or []
+    return allowed[0] if allowed else None
+
+WRITE_WORKERS = int(os.getenv("REMEDIATION_WRITE_WORKERS", "8"))
+
+
 class Remediator:
     def __init__(self):
         self.validator = Validator()
         self.git = GitClient()
 
+    @staticmethod
+    def _apply_fixes(metadata: dict, rule_ids: List[str], fields: Optional[List[str]] = None) -> List[str]:
+        """
+        Applies every applicable fix to frontmatter metadata in place.
+
+        ``fields`` names the missing fields reported by the validator; when it
+        is not given, every known default field that is absent is filled in.
+        Returns one message per applied fix.
+        """
+        messages = []
+
+        if "missing_required_field" in rule_ids:
+            candidates = fields if fields is not None else list(FIELD_DEFAULTS)
+            for field in candidates:
+                if field in FIELD_DEFAULTS and field not in metadata:
+                    metadata[field] = FIELD_DEFAULTS[field](metadata)
+                    messages.append(f"Added missing {field}")
+
+        if "invalid_status" in rule_ids:
+            # Reset to the type's first allowed status; without one there is
+            # nothing valid to reset to, so the status is left alone
+            status = _allowed_status(metadata)
+            if status is not None and metadata.get("status") != status:
+                metadata["status"] = status
+                messages.append(f"Reset invalid status to '{status}'")
+
+        return messages
+
+    @staticmethod
+    def _diff(original: str, new_content: str, file_path: str = None) -> str:
+        diff = difflib.unified_diff(
+            original.splitlines(),
+            new_content.splitlines(),
+            fromfile=f"a/{file_path}" if file_path else "original",
+            tofile=f"b/{file_path}" if file_path else "fixed",
+            lineterm=""
+        )
+        return "\n".join(diff)
+
     def fix_violation(self, file_path: str, rule_id: str, dry_run: bool = False) -> dict:
         """
         Attempts to fix a specific violation in a file.
@@ -19,92 +82,148 @@ class Remediator:
              return {"success": False, "message": "File not found"}
 
         try:
-            # Load the file
-            post = frontmatter.load(file_path)
-            
-            # Apply Fix based on rule_id
-            changed = False
-            fix_message = ""
-
-            if rule_id == "missing_required_field":
-                 # We need to know WHICH field is missing. 
-                 # Since we only get rule_id, we infer common missing fields or check generic ones.
-                 # For Phase 3 L1, we focus on 'date', 'status', 'category'.
-                 
-                 # 1. Date
-                 if "date" not in post.metadata:
-                     post.metadata["date"] = datetime.now().strftime("%Y-%m-%d %H:%M (KST)")
-                     changed = True
-                     fix_message = "Added missing date"
-                 
-                 # 2. Status
-                 elif "status" not in post.metadata:
-                     # Default status based on type? Or just 'draft'
-                     post.metadata["status"] = "draft"
-                     changed = True
-                     fix_message = "Added missing status (draft)"
-
-                 # 3. Category
-                 elif "category" not in post.metadata:
-                     post.metadata["category"] = "uncategorized"
-                     changed = True
-                     fix_message = "Added missing category"
-                 
-                 # 4. Tags
-                 elif "tags" not in post.metadata:
-                     post.metadata["tags"] = []
-                     changed = True
-                     fix_message = "Added missing tags"
-
-            elif rule_id == "invalid_status":
-                # Reset to draft if invalid
-                post.metadata["status"] = "draft"
-                changed = True
-                fix_message = "Reset invalid status to 'draft'"
-
-            if not changed:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                original_content = f.read()
+            post = frontmatter.loads(original_content)
+
+            # Since we only get rule_id, fill in every known field that is missing
+            messages = self._apply_fixes(post.metadata, [rule_id])
+
+            if not messages:
                  return {"success": False, "message": f"No automatic fix available for rule '{rule_id}' or field was already present."}
 
+            fix_message = "; ".join(messages)
+            new_content = frontmatter.dumps(post)
+
             if dry_run:
-                # Return diff logic
-                import difflib
-                
-                # We need the original content as string
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-                
-                # Get new content as string
-                new_content = frontmatter.dumps(post)
-                
-                # Generate diff
-                diff = difflib.unified_diff(
-                    original_content.splitlines(),
-                    new_content.splitlines(),
-                    fromfile="original",
-                    tofile="fixed",
-                    lineterm=""
-                )
-                
                 return {
                     "success": True,
                     "message": f"Dry Run: {fix_message}",
                     "dry_run": True,
-                    "diff": "\n".join(list(diff)),
+                    "diff": self._diff(original_content, new_content),
                     "new_content": new_content
                 }
 
             # Save the file
-            with open(file_path, "wb") as f:
-                frontmatter.dump(post, f)
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(new_content)
 
             # Auto-Commit
             commit_success = self.git.commit_file(file_path, fix_message)
-            
+
             return {
-                "success": True, 
+                "success": True,
                 "message": f"Fixed: {fix_message}",
                 "git_committed": commit_success
             }
 
         except Exception as e:
             return {"success": False, "message": f"Error applying fix: {str(e)}"}
+
+    def _plan_file(self, file_path: str, rule_ids: Optional[List[str]]) -> Optional[Dict]:
+        """Validate one file and compute its fully-fixed content (no writes)."""
+        report = self.validator.validate_file(file_path)
+        fixable = [
+            v for v in report.violations
+            if v.rule_id in FIXABLE_RULES and (rule_ids is None or v.rule_id in rule_ids)
+        ]
+        if not fixable:
+            return None
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            original_content = f.read()
+        post = frontmatter.loads(original_content)
+
+        missing_fields = [v.field for v in fixable if v.rule_id == "missing_required_field" and v.field]
+        messages = self._apply_fixes(post.metadata, [v.rule_id for v in fixable], fields=missing_fields)
+        if not messages:
+            return None
+
+        return {
+            "path": file_path,
+            "fixes": messages,
+            "original": original_content,
+            "new_content": frontmatter.dumps(post)
+        }
+
+    def remediate_batch(
+        self,
+        files: List[str],
+        dry_run: bool = False,
+        rule_ids: Optional[List[str]] = None,
+        commit_chunk_size: int = 0,
+        project_root: str = None
+    ) -> dict:
+        """
+        Fixes every auto-fixable violation across a set of files.
+
+        Each file gets all of its fixes in a single rewrite; files are written
+        in parallel and committed together (one commit, or one per
+        ``commit_chunk_size`` files). ``dry_run`` returns a combined diff.
+        """
+        plans = []
+        errors = []
+        for file_path in files:
+            try:
+                plan = self._plan_file(file_path, rule_ids)
+            except Exception as e:
+                errors.append({"path": file_path, "error": str(e)})
+                continue
+            if plan:
+                plans.append(plan)
+
+        fixes = [{"path": p["path"], "fixes": p["fixes"]} for p in plans]
+
+        if dry_run:
+            base = project_root or os.getcwd()
+            diff = "\n".join(
+                self._diff(p["original"], p["new_content"], os.path.relpath(p["path"], base))
+                for p in plans
+            )
+            return {
+                "success": True,
+                "dry_run": True,
+                "files_scanned": len(files),
+                "files_fixed": len(plans),
+                "fixes": fixes,
+                "errors": errors,
+                "diff": diff
+            }
+
+        def write(plan: Dict) -> Tuple[str, Optional[str]]:
+            try:
+                with open(plan["path"], "w", encoding="utf-8") as f:
+                    f.write(plan["new_content"])
+                return plan["path"], None
+            except Exception as e:
+                return plan["path"], str(e)
+
+        written = []
+        if plans:
+            with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(plans))) as pool:
+                for path, error in pool.map(write, plans):
+                    if error:
+                        errors.append({"path": path, "error": error})
+                    else:
+                        written.append(path)
+
+        chunk_size = commit_chunk_size if commit_chunk_size and commit_chunk_size > 0 else len(written)
+        commits = []
+        for start in range(0, len(written), max(chunk_size, 1)):
+            chunk = written[start:start + chunk_size]
+            message = f"Batch remediation of {len(chunk)} file(s)"
+            commits.append({
+                "files": len(chunk),
+                "git_committed": self.git.commit_files(chunk, message, project_root)
+            })
+
+        written_set = set(written)
+        return {
+            "success": not errors,
+            "dry_run": False,
+            "files_scanned": len(files),
+            "files_fixed": len(written),
+            "fixes": [f for f in fixes if f["path"] in written_set],
+            "errors": errors,
+            "commits": commits
+        }
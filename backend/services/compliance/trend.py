@@ -0,0 +1,57 @@
+import datetime
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from services.compliance.validator import Validator
+
+# Artifact filenames start with their creation date: 2025-12-01_1100_assessment-...
+_DATE_PREFIX = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
+
+
+def _artifact_date(path: str) -> datetime.date:
+    match = _DATE_PREFIX.match(os.path.basename(path))
+    if match:
+        try:
+            return datetime.date(*(int(part) for part in match.groups()))
+        except ValueError:
+            pass
+    # Misnamed files fall back to their modification date
+    return datetime.date.fromtimestamp(os.path.getmtime(path))
+
+
+def compute_compliance_trend(files: List[str], validator: Optional[Validator] = None) -> List[Dict[str, Any]]:
+    """
+    Compliance rate of the corpus grouped by ISO week of artifact creation.
+
+    Runs the full validator (including corpus-level rules) once; a file
+    counts as valid if it has no violations and no cross-artifact error.
+    """
+    validator = validator or Validator()
+    invalid = set()
+    for record in validator.iter_records(files, cross_artifact=True):
+        if record["type"] == "file" and not record["is_compliant"]:
+            invalid.add(record["path"])
+        elif record["type"] == "cross_artifact" and record.get("severity") == "error":
+            invalid.add(record["path"])
+
+    periods: Dict[str, Dict[str, int]] = {}
+    for path in files:
+        try:
+            year, week, _ = _artifact_date(path).isocalendar()
+        except OSError:
+            continue
+        bucket = periods.setdefault(f"{year}-W{week:02d}", {"total": 0, "valid": 0})
+        bucket["total"] += 1
+        if path not in invalid:
+            bucket["valid"] += 1
+
+    return [
+        {
+            "period": period,
+            "total_files": counts["total"],
+            "valid_files": counts["valid"],
+            "compliance_rate": round(counts["valid"] / counts["total"] * 100, 1),
+        }
+        for period, counts in sorted(periods.items())
+    ]
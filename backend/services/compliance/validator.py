@@ -1,10 +1,13 @@
 import os
+import time
 import yaml
 import frontmatter
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterator, Optional
 from pydantic import ValidationError
 
+from services.compliance.cross_rules import CrossArtifactIndex
 from services.compliance.models import ArtifactMetadata, ValidationReport, ValidationViolation
+from services.compliance.profiling import ValidationProfiler
 
 # Load Rules
 RULES_PATH = os.path.join(os.path.dirname(__file__), "rules.yaml")
@@ -12,10 +15,12 @@ with open(RULES_PATH, "r") as f:
     RULES = yaml.safe_load(f)
 
 class Validator:
-    def __init__(self):
+    def __init__(self, profiler: Optional[ValidationProfiler] = None):
         self.rules = RULES
+        # Optional per-rule timing; when None no timers run at all
+        self.profiler = profiler
 
-    def validate_file(self, file_path: str) -> ValidationReport:
+    def validate_file(self, file_path: str, index: Optional[CrossArtifactIndex] = None) -> ValidationReport:
         violations = []
         metadata_dict = {}
 
@@ -26,9 +31,22 @@ class Validator:
                 violations=[ValidationViolation(rule_id="file_not_found", message="File does not exist")]
             )
 
+        profiler = self.profiler
+        if profiler is not None:
+            file_start = lap = time.perf_counter()
+
+        raw = None
         try:
-            post = frontmatter.load(file_path)
+            # Read once: the bytes feed both the frontmatter parser and the content hash
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            if profiler is not None:
+                lap = profiler.lap("read", lap)
+                profiler.add_bytes(len(raw))
+            post = frontmatter.loads(raw.decode("utf-8"))
             metadata_dict = post.metadata
+            if profiler is not None:
+                lap = profiler.lap("frontmatter_yaml", lap)
             
             # 1. Pydantic Base Validation (Type Checks)
             try:
@@ -43,6 +61,8 @@ class Validator:
                         message=f"Field '{field}': {msg}",
                         field=str(field)
                     ))
+            if profiler is not None:
+                lap = profiler.lap("pydantic_schema", lap)
 
             # 2. Rule-Based Validation (Logic Checks)
             artifact_type = metadata_dict.get("type")
@@ -55,6 +75,8 @@ class Validator:
                         message=f"Missing required field: {field}",
                         field=field
                     ))
+            if profiler is not None:
+                lap = profiler.lap("required_fields", lap)
 
             # Type-Specific Rules
             if artifact_type and artifact_type in self.rules["artifact_types"]:
@@ -78,6 +100,8 @@ class Validator:
                             message=f"Status '{status}' not allowed for type '{artifact_type}'. Allowed: {type_rules['allowed_statuses']}",
                             field="status"
                         ))
+            if profiler is not None:
+                lap = profiler.lap("type_rules", lap)
 
         except Exception as e:
             violations.append(ValidationViolation(
@@ -85,6 +109,16 @@ class Validator:
                 message=f"Failed to parse file: {str(e)}"
             ))
 
+        if index is not None:
+            if profiler is not None:
+                lap = time.perf_counter()
+            index.add(file_path, metadata_dict, raw)
+            if profiler is not None:
+                profiler.lap("cross_artifact_index", lap)
+
+        if profiler is not None:
+            profiler.record_file(file_path, time.perf_counter() - file_start)
+
         return ValidationReport(
             file_path=file_path,
             is_compliant=len(violations) == 0,
@@ -92,38 +126,109 @@ class Validator:
             metadata=metadata_dict
         )
 
-    def validate_directory(self, dir_path: str) -> Dict[str, Any]:
-        """Validate all markdown files in a directory recursively."""
-        reports = []
-        total_files = 0
-        valid_files = 0
-        violations_list = []
-
+    def list_files(self, dir_path: str) -> List[str]:
+        """List markdown files under a directory recursively."""
         import glob
         search_pattern = os.path.join(dir_path, "**", "*.md")
-        files = glob.glob(search_pattern, recursive=True)
+        return glob.glob(search_pattern, recursive=True)
+
+    @staticmethod
+    def violation_dicts(report: ValidationReport) -> List[Dict[str, Any]]:
+        """Flatten a file report into the API's violation records."""
+        return [{
+            "file": os.path.basename(report.file_path),
+            "path": report.file_path,
+            "rule_id": v.rule_id,
+            "message": v.message,
+            "severity": v.severity
+        } for v in report.violations]
+
+    def validate_directory(self, dir_path: str, cross_artifact: bool = True) -> Dict[str, Any]:
+        """Validate all markdown files in a directory recursively.
+
+        With ``cross_artifact`` enabled, corpus-level rules (duplicate IDs,
+        titles, slugs and content, broken ``related``/``supersedes``
+        references) run after the per-file pass and are merged into the report.
+        """
+        return self.validate_files(self.list_files(dir_path), cross_artifact=cross_artifact)
+
+    def validate_files(
+        self,
+        files: List[str],
+        cross_artifact: bool = True,
+        on_file: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """Validate a list of files and aggregate the results.
+
+        ``on_file`` receives each per-file record so callers can report progress.
+        """
+        violations_list = []
+        summary: Dict[str, Any] = {}
+
+        for record in self.iter_records(files, cross_artifact=cross_artifact):
+            kind = record.pop("type")
+            if kind == "file":
+                violations_list.extend(record["violations"])
+                if on_file:
+                    on_file(record)
+            elif kind == "cross_artifact":
+                violations_list.append(record)
+            else:
+                summary = record
+
+        return {**summary, "violations": violations_list}
+
+    def iter_records(self, files: List[str], cross_artifact: bool = True) -> Iterator[Dict[str, Any]]:
+        """Validate files lazily, yielding one record per file as it completes.
+
+        Record types, in order: ``file`` (one per file), ``cross_artifact``
+        (one per corpus-level violation) and a trailing ``summary``. Only
+        counters and the cross-artifact index are kept between files, so
+        memory does not grow with the number of violations.
+        """
+        invalid_paths = set()
+        total_violations = 0
+        index = CrossArtifactIndex() if cross_artifact else None
 
         for f in files:
-            report = self.validate_file(f)
-            reports.append(report)
-            total_files += 1
-            if report.is_compliant:
-                valid_files += 1
+            report = self.validate_file(f, index)
+            if not report.is_compliant:
+                invalid_paths.add(f)
+            violations = self.violation_dicts(report)
+            total_violations += len(violations)
+            yield {
+                "type": "file",
+                "file": os.path.basename(f),
+                "path": f,
+                "is_compliant": report.is_compliant,
+                "violations": violations
+            }
+
+        if index is not None:
+            if self.profiler is not None:
+                start = time.perf_counter()
+                cross_violations = index.check()
+                self.profiler.lap("cross_artifact_check", start)
             else:
-                for v in report.violations:
-                    violations_list.append({
-                        "file": os.path.basename(f),
-                        "path": f,
-                        "rule_id": v.rule_id,
-                        "message": v.message,
-                        "severity": v.severity
-                    })
+                cross_violations = index.check()
+            for violation in cross_violations:
+                # Files that were compliant on their own but fail a corpus-level rule
+                if violation["severity"] == "error":
+                    invalid_paths.add(violation["path"])
+                total_violations += 1
+                yield {"type": "cross_artifact", **violation}
 
+        total_files = len(files)
+        valid_files = total_files - len(invalid_paths)
         compliance_rate = (valid_files / total_files) * 100 if total_files > 0 else 100
 
-        return {
+        summary = {
+            "type": "summary",
             "compliance_rate": compliance_rate,
             "total_files": total_files,
             "valid_files": valid_files,
-            "violations": violations_list
+            "total_violations": total_violations
         }
+        if self.profiler is not None:
+            summary["profile"] = self.profiler.to_dict()
+        yield summary
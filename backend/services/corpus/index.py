@@ -0,0 +1,198 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import frontmatter
+
+from services.observability.caches import register_cache
+from services.observability.metrics import callback_metric
+
+# How long a computed fingerprint is trusted before the tree is re-stat'ed.
+# Writes made through the API invalidate immediately; this only bounds how
+# long out-of-band edits (git checkout, editors) can go unnoticed.
+FINGERPRINT_TTL = float(os.getenv("CORPUS_FINGERPRINT_TTL", "2.0"))
+
+
+class CorpusIndex:
+    """
+    Cached view of the artifacts under one root directory.
+
+    Frontmatter is parsed once per file and reused until the file's mtime or
+    size changes. Derived values are memoized under a corpus fingerprint (a
+    hash of every path, mtime and size), so repeat calls are O(1) until the
+    corpus changes.
+    """
+
+    def __init__(self, root: str, fingerprint_ttl: float = FINGERPRINT_TTL):
+        self.root = root
+        self.fingerprint_ttl = fingerprint_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._stats: List[Tuple[str, int, int]] = []
+        self._fingerprint: Optional[str] = None
+        self._fingerprint_at = 0.0
+        self.file_count = 0
+        self.total_bytes = 0
+        # path -> (mtime_ns, size, metadata)
+        self._metadata: Dict[str, Tuple[int, int, dict]] = {}
+        # name -> (fingerprint, value)
+        self._memo: Dict[str, Tuple[str, Any]] = {}
+        # name -> lock held while that value is computed
+        self._memo_locks: Dict[str, threading.Lock] = {}
+
+    def invalidate(self) -> None:
+        """Force the next call to re-scan the tree."""
+        with self._lock:
+            self._fingerprint = None
+
+    def fingerprint(self) -> str:
+        """Combined hash of (path, mtime, size) for every markdown file."""
+        with self._lock:
+            now = time.monotonic()
+            if self._fingerprint is None or now - self._fingerprint_at > self.fingerprint_ttl:
+                self._stats = self._scan()
+                digest = hashlib.sha1()
+                for path, mtime_ns, size in self._stats:
+                    digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode("utf-8"))
+                self._fingerprint = digest.hexdigest()
+                self._fingerprint_at = now
+                self.file_count = len(self._stats)
+                self.total_bytes = sum(size for _, _, size in self._stats)
+            return self._fingerprint
+
+    def files(self) -> List[str]:
+        """Markdown files in the corpus, as of the current fingerprint."""
+        with self._lock:
+            self.fingerprint()
+            return [path for path, _, _ in self._stats]
+
+    def records(self) -> List[Tuple[str, dict]]:
+        """(path, frontmatter metadata) for every file, parsing only changed files."""
+        with self._lock:
+            self.fingerprint()
+            seen = set()
+            records = []
+            for path, mtime_ns, size in self._stats:
+                seen.add(path)
+                cached = self._metadata.get(path)
+                if cached and cached[0] == mtime_ns and cached[1] == size:
+                    metadata = cached[2]
+                else:
+                    metadata = self._load_metadata(path)
+                    self._metadata[path] = (mtime_ns, size, metadata)
+                records.append((path, metadata))
+
+            for path in list(self._metadata):
+                if path not in seen:
+                    del self._metadata[path]
+            return records
+
+    def memoize(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return ``compute()``, reusing the last value while the corpus is unchanged.
+
+        The index lock is not held while computing, so a slow value (e.g. the
+        compliance trend) does not block readers of other values; concurrent
+        callers of the same ``name`` wait for one computation.
+        """
+        with self._lock:
+            memo_lock = self._memo_locks.setdefault(name, threading.Lock())
+
+        with memo_lock:
+            with self._lock:
+                fingerprint = self.fingerprint()
+                cached = self._memo.get(name)
+                if cached and cached[0] == fingerprint:
+                    self.hits += 1
+                    return cached[1]
+                self.misses += 1
+
+            value = compute()
+            with self._lock:
+                # Stored under the fingerprint seen before computing, so a
+                # change made meanwhile is picked up by the next call
+                self._memo[name] = (fingerprint, value)
+            return value
+
+    def _scan(self) -> List[Tuple[str, int, int]]:
+        stats = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            # Match glob("**/*.md"): hidden directories are not part of the corpus
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            for name in sorted(filenames):
+                if not name.endswith(".md"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                stats.append((path, st.st_mtime_ns, st.st_size))
+        return stats
+
+    @staticmethod
+    def _load_metadata(path: str) -> dict:
+        try:
+            return dict(frontmatter.load(path).metadata)
+        except Exception:
+            return {}
+
+
+_indexes: Dict[str, CorpusIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_corpus_index(root: str) -> CorpusIndex:
+    """Return the shared index for an artifacts root (one per root, since DEMO_MODE can switch roots)."""
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = CorpusIndex(root)
+        return index
+
+
+_invalidation_hooks: List[Callable[[], None]] = []
+
+
+def on_invalidate(hook: Callable[[], None]) -> None:
+    """Call ``hook`` whenever the corpus is invalidated (for caches derived from it)."""
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_all() -> None:
+    """Invalidate every corpus index (called after writes through the API)."""
+    with _indexes_lock:
+        for index in _indexes.values():
+            index.invalidate()
+    for hook in list(_invalidation_hooks):
+        hook()
+
+
+def _cache_stats() -> Dict[str, int]:
+    indexes = list(_indexes.values())
+    return {
+        "hits": sum(index.hits for index in indexes),
+        "misses": sum(index.misses for index in indexes),
+        "entries": sum(len(index._metadata) + len(index._memo) for index in indexes),
+    }
+
+
+register_cache(
+    "corpus_index",
+    _cache_stats,
+    contents=lambda: [(index._stats, index._metadata, index._memo) for index in list(_indexes.values())]
+)
+callback_metric(
+    "agentqms_corpus_files",
+    "Markdown files in the corpus as of the last scan, by artifacts root.",
+    lambda: [({"root": root}, index.file_count) for root, index in list(_indexes.items())]
+)
+callback_metric(
+    "agentqms_corpus_bytes",
+    "Total size of the corpus as of the last scan, by artifacts root.",
+    lambda: [({"root": root}, index.total_bytes) for root, index in list(_indexes.items())]
+)
@@ -0,0 +1,62 @@
+import os
+import re
+from typing import Any, Dict, List
+
+# Same link syntax the AgentQMS link checker looks for: [text](target)
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+# file:// links point at other machines' checkouts and cannot be checked here
+_EXTERNAL = ("http://", "https://", "mailto:", "file://", "#")
+
+# Cap on broken links listed in the result (the counts are always complete)
+MAX_REPORTED = 200
+
+
+def compute_link_health(files: List[str], root: str) -> Dict[str, Any]:
+    """
+    Check relative markdown links in every file and report broken targets.
+
+    ``referenceHealth`` is the percentage of internal links whose target
+    exists; external URLs and in-page anchors are not checked.
+    """
+    total = 0
+    broken: List[Dict[str, Any]] = []
+    broken_count = 0
+    exists_cache: Dict[str, bool] = {}
+
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        base = os.path.dirname(path)
+        for line_number, line in enumerate(content.split("\n"), 1):
+            if "](" not in line:
+                continue
+            for match in _LINK.finditer(line):
+                target = match.group(2)
+                if target.startswith(_EXTERNAL):
+                    continue
+                target = target.split("#", 1)[0]
+                if not target:
+                    continue
+                total += 1
+                resolved = os.path.normpath(os.path.join(base, target))
+                exists = exists_cache.get(resolved)
+                if exists is None:
+                    exists = exists_cache[resolved] = os.path.exists(resolved)
+                if not exists:
+                    broken_count += 1
+                    if len(broken) < MAX_REPORTED:
+                        broken.append({
+                            "source": os.path.relpath(path, root),
+                            "line": line_number,
+                            "target": match.group(2),
+                        })
+
+    return {
+        "total_links": total,
+        "broken_links": broken_count,
+        "reference_health": int((total - broken_count) / total * 100) if total else 100,
+        "broken": broken,
+    }
@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Tuple
+
+# (display name, frontmatter type) in the order the dashboard charts them
+DISTRIBUTION_TYPES = [
+    ("Implementation Plans", "implementation_plan"),
+    ("Assessments", "assessment"),
+    ("Audits", "audit"),
+    ("Bug Reports", "bug_report"),
+    ("Designs", "design"),
+]
+
+EMPTY_STATS = {
+    "totalDocs": 0,
+    "docGrowth": 0,
+    "referenceHealth": 100,
+    "brokenLinks": 0,
+    "pendingMigrations": 0,
+    "distribution": [],
+}
+
+
+def compute_system_stats(records: List[Tuple[str, dict]]) -> Dict[str, Any]:
+    """Compute dashboard system stats from (path, frontmatter metadata) records."""
+    type_counts: Dict[str, int] = {}
+    for _, metadata in records:
+        artifact_type = metadata.get("type", "unknown")
+        type_counts[artifact_type] = type_counts.get(artifact_type, 0) + 1
+
+    return {
+        "totalDocs": len(records),
+        # Filled in from the doc_growth and link_health views when available
+        "docGrowth": 0,
+        "referenceHealth": 100,
+        "brokenLinks": 0,
+        "pendingMigrations": 0,  # TODO: Check for legacy artifacts
+        "distribution": [
+            {"name": name, "valid": type_counts.get(artifact_type, 0), "issues": 0}
+            for name, artifact_type in DISTRIBUTION_TYPES
+        ],
+    }
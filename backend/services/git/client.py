@@ -1,6 +1,6 @@
 import subprocess
 import os
-from typing import Optional
+from typing import List, Optional
 
 class GitClient:
     """
@@ -47,6 +47,38 @@ class GitClient:
             print(f"Git operation error: {str(e)}")
             return False
 
+    @staticmethod
+    def commit_files(file_paths: List[str], message: str, project_root: str = None) -> bool:
+        """
+        Stages and commits several files in a single commit.
+        Runs exactly two git processes regardless of how many files are passed.
+        """
+        if not file_paths:
+            return False
+        if not project_root:
+             project_root = os.getcwd()
+
+        try:
+            subprocess.run(
+                ["git", "add", "--", *file_paths],
+                cwd=project_root,
+                check=True,
+                capture_output=True
+            )
+            subprocess.run(
+                ["git", "commit", "-m", f"AgentQMS Auto-Fix: {message}", "--", *file_paths],
+                cwd=project_root,
+                check=True,
+                capture_output=True
+            )
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"Git commit failed: {e.stderr.decode()}")
+            return False
+        except Exception as e:
+            print(f"Git operation error: {str(e)}")
+            return False
+
     @staticmethod
     def get_last_commit(file_path: str, project_root: str = None) -> Optional[str]:
         if not project_root:
@@ -63,3 +95,22 @@ class GitClient:
             return result.stdout.strip()
         except Exception:
             return None
+
+    @staticmethod
+    def added_files_since(path: str, since: str, project_root: str = None) -> List[str]:
+        """
+        Markdown files under ``path`` first added to git after ``since``
+        (any ``git log --since`` expression, e.g. "7 days ago").
+        Raises on git errors so callers can tell "none added" from "unknown".
+        """
+        if not project_root:
+             project_root = os.getcwd()
+
+        result = subprocess.run(
+            ["git", "log", f"--since={since}", "--diff-filter=A", "--name-only", "--pretty=format:", "--", path],
+            cwd=project_root,
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        return sorted({line for line in result.stdout.splitlines() if line.endswith(".md")})
@@ -0,0 +1,114 @@
+import sys
+import types
+from typing import Any, Callable, Dict, Optional
+
+from services.observability.metrics import callback_metric
+
+# name -> callable returning {"hits": int, "misses": int, "entries": int, ...}
+_caches: Dict[str, Callable[[], Dict[str, Any]]] = {}
+# name -> callable returning the object graph(s) the cache holds, for sizing
+_contents: Dict[str, Callable[[], Any]] = {}
+
+# Upper bound on objects visited per cache when estimating sizes
+SIZE_WALK_LIMIT = 2_000_000
+
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def register_cache(
+    name: str,
+    stats: Callable[[], Dict[str, Any]],
+    contents: Optional[Callable[[], Any]] = None
+) -> None:
+    """Register a cache so its hit rate and entry count are exported on /metrics.
+
+    ``contents`` returns the objects the cache holds; it is only walked on
+    demand (``cache_sizes``), never during a metrics scrape.
+    """
+    _caches[name] = stats
+    if contents is not None:
+        _contents[name] = contents
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Current stats for every registered cache (failing callbacks report an error)."""
+    result = {}
+    for name, stats in list(_caches.items()):
+        try:
+            result[name] = stats()
+        except Exception as e:
+            result[name] = {"error": str(e)}
+    return result
+
+
+def approx_size(obj: Any, limit: int = SIZE_WALK_LIMIT) -> Dict[str, Any]:
+    """
+    Approximate deep size of an object graph in bytes.
+
+    Follows containers and instance ``__dict__``/``__slots__``; shared
+    objects are counted once. Stops after ``limit`` objects and reports
+    ``truncated`` so a huge cache cannot stall the caller.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        if len(seen) >= limit:
+            return {"bytes": total, "objects": len(seen), "truncated": True}
+        current = stack.pop()
+        # Classes, modules and functions are shared program state, not cache contents
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, bytearray, int, float, bool)) and current is not None:
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for slot in getattr(type(current), "__slots__", ()):
+                if isinstance(slot, str) and hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return {"bytes": total, "objects": len(seen), "truncated": False}
+
+
+def cache_sizes() -> Dict[str, Dict[str, Any]]:
+    """Entry counts plus approximate memory for every registered cache."""
+    result = {}
+    for name, stats in cache_stats().items():
+        entry = {"entries": stats.get("entries")}
+        contents = _contents.get(name)
+        if contents is not None:
+            try:
+                held = contents()
+                size = approx_size(held) if held is not None else {"bytes": 0, "objects": 0, "truncated": False}
+                entry.update(approx_bytes=size["bytes"], objects=size["objects"], truncated=size["truncated"])
+            except Exception as e:
+                entry["error"] = str(e)
+        result[name] = entry
+    return result
+
+
+def _samples(field: str):
+    def collect():
+        for name, stats in cache_stats().items():
+            if field in stats:
+                yield {"cache": name}, stats[field]
+    return collect
+
+
+def _hit_ratio():
+    for name, stats in cache_stats().items():
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        if lookups:
+            yield {"cache": name}, stats.get("hits", 0) / lookups
+
+
+callback_metric("agentqms_cache_hits_total", "Cache hits, by cache.", _samples("hits"), kind="counter")
+callback_metric("agentqms_cache_misses_total", "Cache misses, by cache.", _samples("misses"), kind="counter")
+callback_metric("agentqms_cache_hit_ratio", "Hits / (hits + misses) since start, by cache.", _hit_ratio)
+callback_metric("agentqms_cache_entries", "Entries currently held, by cache.", _samples("entries"))
@@ -0,0 +1,183 @@
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+
+from services.observability.caches import register_cache
+
+# tracemalloc slows every allocation and snapshots expose source paths, so
+# the tracing endpoints are opt-in
+MEMORY_DEBUG = os.getenv("MEMORY_DEBUG", "false").lower() == "true"
+
+# Snapshots hold every traced allocation; keep only a few
+SNAPSHOT_RETAIN = int(os.getenv("MEMORY_SNAPSHOT_RETAIN", "4"))
+DEFAULT_FRAMES = int(os.getenv("TRACEMALLOC_FRAMES", "10"))
+
+GROUP_BY = ("lineno", "filename", "traceback")
+
+# Allocations made by the tracer or the import machinery are noise
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux), or None if unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryInspector:
+    """Controls tracemalloc and keeps a small set of named snapshots."""
+
+    def __init__(self, retain: int = SNAPSHOT_RETAIN):
+        self.retain = retain
+        self.snapshots: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def status(self) -> Dict[str, Any]:
+        tracing = tracemalloc.is_tracing()
+        current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        return {
+            "tracing": tracing,
+            "frames": tracemalloc.get_traceback_limit() if tracing else None,
+            "traced_current_bytes": current,
+            "traced_peak_bytes": peak,
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory() if tracing else 0,
+            "rss_bytes": current_rss_bytes(),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "snapshots": [self._describe(s) for s in self.snapshots.values()],
+        }
+
+    def start(self, frames: int = DEFAULT_FRAMES) -> Dict[str, Any]:
+        if tracemalloc.is_tracing():
+            # The frame limit can only change by restarting the tracer
+            if tracemalloc.get_traceback_limit() == frames:
+                return self.status()
+            tracemalloc.stop()
+        tracemalloc.start(frames)
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop tracing; existing snapshots are kept for comparison."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return self.status()
+
+    def take_snapshot(self, label: Optional[str] = None) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not running; start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        entry = {
+            "id": uuid.uuid4().hex[:8],
+            "label": label,
+            "taken_at": time.time(),
+            "rss_bytes": current_rss_bytes(),
+            "traced_bytes": sum(trace.size for trace in snapshot.traces),
+            "snapshot": snapshot,
+        }
+        with self._lock:
+            self.snapshots[entry["id"]] = entry
+            while len(self.snapshots) > self.retain:
+                self.snapshots.popitem(last=False)
+        return self._describe(entry)
+
+    def get(self, snapshot_id: str) -> Dict[str, Any]:
+        entry = self.snapshots.get(snapshot_id)
+        if entry is None:
+            raise KeyError(snapshot_id)
+        return entry
+
+    def top(self, snapshot_id: str, group_by: str = "lineno", limit: int = 25) -> Dict[str, Any]:
+        entry = self.get(snapshot_id)
+        stats = entry["snapshot"].statistics(group_by)
+        return {
+            **self._describe(entry),
+            "group_by": group_by,
+            "top": [
+                {
+                    "site": _site(stat.traceback, group_by),
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+    def diff(self, base_id: str, current_id: str, group_by: str = "lineno", limit: int = 25) -> Dict[str, Any]:
+        base = self.get(base_id)
+        current = self.get(current_id)
+        stats = current["snapshot"].compare_to(base["snapshot"], group_by)
+        return {
+            "base": self._describe(base),
+            "current": self._describe(current),
+            "group_by": group_by,
+            "total_size_diff_bytes": sum(stat.size_diff for stat in stats),
+            "top": [
+                {
+                    "site": _site(stat.traceback, group_by),
+                    "size_bytes": stat.size,
+                    "size_diff_bytes": stat.size_diff,
+                    "count": stat.count,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+    @staticmethod
+    def _describe(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in entry.items() if key != "snapshot"}
+
+
+def _site(traceback: tracemalloc.Traceback, group_by: str) -> Union[str, List[str]]:
+    if group_by == "traceback":
+        return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+    frame = traceback[0]
+    return frame.filename if group_by == "filename" else f"{frame.filename}:{frame.lineno}"
+
+
+_inspector = MemoryInspector()
+
+
+def get_memory_inspector() -> MemoryInspector:
+    return _inspector
+
+
+def _plugin_registry():
+    """The AgentQMS plugin registry if it has been loaded (never triggers a load)."""
+    plugins = sys.modules.get("AgentQMS.agent_tools.core.plugins")
+    loader = getattr(plugins, "_plugin_loader", None) if plugins else None
+    return getattr(loader, "_registry", None) if loader else None
+
+
+def _plugin_registry_stats() -> Dict[str, Any]:
+    registry = _plugin_registry()
+    if registry is None:
+        return {"entries": 0}
+    artifact_types = getattr(registry, "artifact_types", None) or {}
+    return {"entries": len(artifact_types)}
+
+
+# AgentQMS is optional in the backend image; the registry is only sized if it was loaded
+register_cache("plugin_registry", _plugin_registry_stats, contents=_plugin_registry)
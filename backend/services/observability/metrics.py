@@ -0,0 +1,278 @@
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Request latency buckets in seconds (Prometheus client defaults plus a 30s tail for tool runs)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Settable gauge with optional labels."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class CallbackMetric(_Metric):
+    """Gauge or counter whose samples are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[Tuple[Dict[str, str], float]]],
+        kind: str = "gauge"
+    ):
+        super().__init__(name, documentation)
+        self.callback = callback
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        try:
+            samples = list(self.callback())
+        except Exception:
+            samples = []
+        return self.header() + [
+            f"{self.name}{_format_labels(tuple(sorted(labels.items())))} {_format_value(value)}"
+            for labels, value in samples
+        ]
+
+
+class Histogram(_Metric):
+    """
+    Cumulative histogram with optional labels.
+
+    ``observe`` is a bisect plus two additions under a lock; buckets are
+    stored non-cumulatively and summed only when scraped.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [bucket counts..., +Inf count], sum
+        self._series: Dict[LabelKey, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+        lines = self.header()
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Ordered set of metrics rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # Modules may be re-imported (e.g. under reload); keep the first instance
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, documentation: str) -> Counter:
+    return REGISTRY.register(Counter(name, documentation))
+
+
+def gauge(name: str, documentation: str) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation))
+
+
+def histogram(name: str, documentation: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, buckets))
+
+
+def callback_metric(name: str, documentation: str, callback, kind: str = "gauge") -> CallbackMetric:
+    return REGISTRY.register(CallbackMetric(name, documentation, callback, kind))
+
+
+# --- HTTP metrics --------------------------------------------------------
+
+REQUEST_DURATION = histogram(
+    "agentqms_http_request_duration_seconds", "HTTP request duration by route template, method and status."
+)
+REQUESTS_IN_FLIGHT = gauge("agentqms_http_requests_in_flight", "HTTP requests currently being handled.")
+
+# --- Subprocess metrics (tools route) -------------------------------------
+
+SUBPROCESS_SPAWNS = counter(
+    "agentqms_subprocess_spawns_total", "Subprocesses spawned by tool runs, by tool, strategy and outcome."
+)
+SUBPROCESS_DURATION = histogram(
+    "agentqms_subprocess_duration_seconds", "Wall time of tool subprocesses, by tool and strategy."
+)
+
+
+# --- Worker pools ------------------------------------------------------------
+
+_pools: Dict[str, Callable[[], int]] = {}
+
+
+def register_pool(name: str, queue_depth: Callable[[], int]) -> None:
+    """Expose a worker pool's queue depth as ``agentqms_pool_queue_depth{pool=name}``."""
+    _pools[name] = queue_depth
+
+
+callback_metric(
+    "agentqms_pool_queue_depth",
+    "Tasks waiting for a free worker, by pool.",
+    lambda: [({"pool": name}, depth()) for name, depth in list(_pools.items())]
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request duration and in-flight requests.
+
+    Routes are labelled by their template (``/api/v1/artifacts/{id}``), not
+    the raw path, so label cardinality stays bounded; unmatched requests
+    share the ``<unmatched>`` label. The duration covers the full response
+    body, including streamed responses.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                route=getattr(route, "path", "<unmatched>"),
+                method=scope.get("method", ""),
+                status=str(status["code"]),
+            )
+
+
+def render_metrics() -> str:
+    """Render every registered metric (the ``/metrics`` response body)."""
+    return REGISTRY.render()
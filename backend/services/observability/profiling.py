@@ -0,0 +1,415 @@
+import asyncio
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from collections import Counter, OrderedDict, deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+from urllib.parse import parse_qs
+
+from starlette.concurrency import run_in_threadpool as _run_in_threadpool
+
+# Per-request profiling is off unless explicitly enabled (it is not free and
+# exposes code structure). Requests opt in with the X-Profile header or the
+# _profile query parameter; the value picks the mode ("cprofile" or "stacks").
+PROFILING_ENABLED = os.getenv("REQUEST_PROFILING", "false").lower() == "true"
+PROFILE_RETAIN = int(os.getenv("REQUEST_PROFILE_RETAIN", "20"))
+SAMPLE_INTERVAL = float(os.getenv("REQUEST_PROFILE_SAMPLE_INTERVAL", "0.005"))
+PROFILE_DIR = os.getenv("REQUEST_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "agentqms-profiles"))
+
+# Requests slower than this are logged with their stack; 0 disables the log
+SLOW_REQUEST_SECONDS = float(os.getenv("SLOW_REQUEST_SECONDS", "2.0"))
+SLOW_REQUEST_RETAIN = int(os.getenv("SLOW_REQUEST_RETAIN", "100"))
+
+PROFILE_MODES = ("cprofile", "stacks")
+STACK_DEPTH = 25
+
+T = TypeVar("T")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def _stack(frame, limit: int = STACK_DEPTH) -> List[str]:
+    """Innermost-last list of frame labels."""
+    frames = []
+    while frame is not None and len(frames) < limit:
+        frames.append(_frame_label(frame))
+        frame = frame.f_back
+    return list(reversed(frames))
+
+
+class RequestTrace:
+    """
+    The threads doing one request's work: the event-loop thread it arrived
+    on, plus any worker thread currently running code on its behalf (see
+    ``in_request_thread``). Profiles and the slow-request log watch all of
+    them, since most endpoints hand their real work to a thread.
+    """
+
+    def __init__(self, request_id: str, profiling: bool = False):
+        self.request_id = request_id
+        self.loop_thread = threading.get_ident()
+        self.profiling = profiling
+        self.worker_profiles: List[cProfile.Profile] = []
+        self._workers: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def threads(self) -> Dict[int, str]:
+        """Thread id -> label of every thread currently working for the request."""
+        with self._lock:
+            threads = dict(self._workers)
+        threads[self.loop_thread] = "event-loop"
+        return threads
+
+    def enter(self) -> bool:
+        """Register the calling worker thread; False if it is already registered."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            if thread_id == self.loop_thread or thread_id in self._workers:
+                return False
+            self._workers[thread_id] = threading.current_thread().name
+        return True
+
+    def leave(self) -> None:
+        with self._lock:
+            self._workers.pop(threading.get_ident(), None)
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+def in_request_thread(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap ``fn`` so that, when a worker thread runs it for a traced request
+    (the request's context was copied into the thread), the thread is
+    sampled, watched and cProfiled along with the request.
+    """
+    if getattr(fn, "_in_request_thread", False):
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        trace = _current_trace.get()
+        if trace is None or not trace.enter():
+            return fn(*args, **kwargs)
+        profile = None
+        if trace.profiling:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+: one profiler per process, already covering every thread
+                profile = None
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            if profile is not None:
+                profile.disable()
+                trace.worker_profiles.append(profile)
+            trace.leave()
+    wrapper._in_request_thread = True
+    return wrapper
+
+
+async def run_in_threadpool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """``fastapi.concurrency.run_in_threadpool`` that keeps the worker thread in the request's trace."""
+    return await _run_in_threadpool(in_request_thread(func), *args, **kwargs)
+
+
+def trace_sync_endpoints(app) -> None:
+    """Trace the threadpool threads that run plain ``def`` endpoints (call after adding routers)."""
+    from fastapi.routing import APIRoute
+
+    for route in app.routes:
+        if isinstance(route, APIRoute) and not asyncio.iscoroutinefunction(route.dependant.call):
+            # FastAPI reads dependant.call per request, so the wrapper takes effect
+            route.dependant.call = in_request_thread(route.dependant.call)
+
+
+class StackSampler(threading.Thread):
+    """Samples a request's threads at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, trace: RequestTrace, interval: float = SAMPLE_INTERVAL):
+        super().__init__(name="request-stack-sampler", daemon=True)
+        self.trace = trace
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id, label in self.trace.threads().items():
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    # Root each stack at its thread; collapsed format forbids ';' inside frame names
+                    stack = [f"thread {label}"] + _stack(frame, 200)
+                    self.counts[";".join(part.replace(";", ":") for part in stack)] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        """Brendan Gregg collapsed-stack text (input for flamegraph.pl / speedscope)."""
+        return "\n".join(f"{stack} {count}" for stack, count in self.counts.most_common())
+
+
+class ProfileStore:
+    """Keeps the most recent request profiles in memory (cProfile dumps also go to disk)."""
+
+    def __init__(self, retain: int = PROFILE_RETAIN, directory: str = PROFILE_DIR):
+        self.retain = retain
+        self.directory = directory
+        self._profiles: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: Dict[str, Any]) -> None:
+        with self._lock:
+            self._profiles[profile["id"]] = profile
+            while len(self._profiles) > self.retain:
+                _, old = self._profiles.popitem(last=False)
+                if old.get("pstats_path"):
+                    try:
+                        os.remove(old["pstats_path"])
+                    except OSError:
+                        pass
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [
+            {key: value for key, value in p.items() if key not in ("report", "collapsed")}
+            for p in reversed(profiles)
+        ]
+
+
+class SlowRequestLog:
+    """
+    Captures requests that exceed a duration threshold.
+
+    A watchdog thread grabs the stack of any request still running past the
+    threshold, so the log shows where the time went rather than just the
+    total; completed slow requests are recorded with their final duration.
+    """
+
+    def __init__(self, threshold: float = SLOW_REQUEST_SECONDS, retain: int = SLOW_REQUEST_RETAIN):
+        self.threshold = threshold
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=retain)
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._watchdog: Optional[threading.Thread] = None
+
+    def start(self, trace: RequestTrace, scope: Dict[str, Any]) -> None:
+        with self._lock:
+            self._active[trace.request_id] = {
+                "scope": scope,
+                "trace": trace,
+                "started": time.perf_counter(),
+                "stacks": None,
+            }
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watch, name="slow-request-watchdog", daemon=True)
+                self._watchdog.start()
+
+    def finish(self, request_id: str, status: int) -> None:
+        with self._lock:
+            active = self._active.pop(request_id, None)
+        if active is None:
+            return
+        duration = time.perf_counter() - active["started"]
+        if duration < self.threshold:
+            return
+
+        scope = active["scope"]
+        route = scope.get("route")
+        entry = {
+            "id": request_id,
+            "at": time.time(),
+            "method": scope.get("method"),
+            "route": getattr(route, "path", scope.get("path")),
+            "path": scope.get("path"),
+            "params": {k: v if len(v) > 1 else v[0] for k, v in parse_qs(scope.get("query_string", b"").decode("latin-1")).items()},
+            "status": status,
+            "duration_s": round(duration, 4),
+            # Worker threads first: that is where endpoints do their work
+            "stack": active["stacks"][0]["stack"] if active["stacks"] else [],
+            "stacks": active["stacks"] or [],
+        }
+        self.entries.append(entry)
+        print(f"SLOW REQUEST: {entry['method']} {entry['path']} took {entry['duration_s']:.2f}s (status {status})")
+
+    def _watch(self) -> None:
+        interval = max(self.threshold / 2, 0.05)
+        while True:
+            time.sleep(interval)
+            now = time.perf_counter()
+            with self._lock:
+                overdue = [a for a in self._active.values() if a["stacks"] is None and now - a["started"] >= self.threshold]
+            if not overdue:
+                continue
+            frames = sys._current_frames()
+            for active in overdue:
+                trace = active["trace"]
+                stacks = [
+                    {"thread": label, "stack": _stack(frames[thread_id])}
+                    for thread_id, label in trace.threads().items()
+                    if thread_id in frames
+                ]
+                stacks.sort(key=lambda entry: entry["thread"] == "event-loop")
+                active["stacks"] = stacks
+
+
+PROFILES = ProfileStore()
+SLOW_REQUESTS = SlowRequestLog()
+
+# cProfile can only profile one request at a time per process
+_cprofile_lock = threading.Lock()
+
+
+def _requested_mode(scope: Dict[str, Any]) -> Optional[str]:
+    for name, value in scope.get("headers", []):
+        if name == b"x-profile":
+            mode = value.decode("latin-1").strip().lower()
+            return mode if mode in PROFILE_MODES else "cprofile"
+    query = scope.get("query_string", b"")
+    if b"_profile" in query:
+        values = parse_qs(query.decode("latin-1")).get("_profile")
+        if values:
+            mode = values[0].strip().lower()
+            return mode if mode in PROFILE_MODES else "cprofile"
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware for opt-in request profiling and the slow-request log.
+
+    Profiles and the slow-request log cover the event-loop thread and every
+    worker thread running for the request: plain ``def`` endpoints (see
+    ``trace_sync_endpoints``), ``run_in_threadpool`` from this module and
+    SingleFlight computations. Concurrent requests on the same loop can
+    still show up in the loop thread's part. The response carries
+    ``X-Profile-Id``; the profile is fetched from
+    ``/api/v1/admin/profiles/{id}``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mode = _requested_mode(scope) if PROFILING_ENABLED else None
+        if mode is None and SLOW_REQUEST_SECONDS <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex[:12]
+        status = {"code": 500}
+        profiler = sampler = None
+        if mode == "cprofile" and _cprofile_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+        trace = RequestTrace(request_id, profiling=profiler is not None)
+        if mode == "stacks":
+            sampler = StackSampler(trace)
+        skipped = mode == "cprofile" and profiler is None
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                if profiler is not None or sampler is not None:
+                    message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", request_id.encode())]
+                elif skipped:
+                    message["headers"] = list(message.get("headers", [])) + [(b"x-profile-skipped", b"busy")]
+            await send(message)
+
+        if SLOW_REQUEST_SECONDS > 0:
+            SLOW_REQUESTS.start(trace, scope)
+        token = _current_trace.set(trace)
+        started = time.perf_counter()
+        try:
+            if profiler is not None:
+                profiler.enable()
+            elif sampler is not None:
+                sampler.start()
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            _current_trace.reset(token)
+            if profiler is not None:
+                profiler.disable()
+                _cprofile_lock.release()
+                _store_cprofile(request_id, scope, duration, profiler, trace.worker_profiles)
+            elif sampler is not None:
+                sampler.stop()
+                _store_stacks(request_id, scope, duration, sampler)
+            if SLOW_REQUEST_SECONDS > 0:
+                SLOW_REQUESTS.finish(request_id, status["code"])
+
+
+def _profile_header(request_id: str, scope: Dict[str, Any], duration: float, mode: str) -> Dict[str, Any]:
+    route = scope.get("route")
+    return {
+        "id": request_id,
+        "mode": mode,
+        "at": time.time(),
+        "method": scope.get("method"),
+        "route": getattr(route, "path", scope.get("path")),
+        "path": scope.get("path"),
+        "query": scope.get("query_string", b"").decode("latin-1"),
+        "duration_s": round(duration, 4),
+    }
+
+
+def _store_cprofile(
+    request_id: str,
+    scope: Dict[str, Any],
+    duration: float,
+    profiler: cProfile.Profile,
+    worker_profiles: List[cProfile.Profile],
+) -> None:
+    try:
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        # Merge in what worker threads ran for the request
+        for worker_profile in list(worker_profiles):
+            try:
+                stats.add(worker_profile)
+            except TypeError:
+                pass  # the worker recorded no calls
+        stats.sort_stats("cumulative").print_stats(60)
+        profile = _profile_header(request_id, scope, duration, "cprofile")
+        profile["report"] = buffer.getvalue()
+
+        os.makedirs(PROFILES.directory, exist_ok=True)
+        path = os.path.join(PROFILES.directory, f"{request_id}.prof")
+        stats.dump_stats(path)
+        profile["pstats_path"] = path
+        PROFILES.add(profile)
+    except Exception:
+        traceback.print_exc()
+
+
+def _store_stacks(request_id: str, scope: Dict[str, Any], duration: float, sampler: StackSampler) -> None:
+    profile = _profile_header(request_id, scope, duration, "stacks")
+    profile["samples"] = sum(sampler.counts.values())
+    profile["interval_s"] = sampler.interval
+    profile["collapsed"] = sampler.collapsed()
+    PROFILES.add(profile)
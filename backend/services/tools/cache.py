@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from services.corpus.index import on_invalidate
+from services.observability.caches import register_cache
+from services.tools.commands import WORKSPACE_ROOT, Attempt, get_artifacts_root_for_tools
+from services.tools.warm import WARM_MODULES
+
+# Results of read-only tools are reused while their inputs are unchanged;
+# set TOOL_RESULT_CACHE=false to always run them.
+CACHE_ENABLED = os.getenv("TOOL_RESULT_CACHE", "true").lower() == "true"
+MAX_ENTRIES = int(os.getenv("TOOL_RESULT_CACHE_ENTRIES", "64"))
+# How long an input fingerprint is trusted before the files are re-stat'ed
+# (writes through the API reset it immediately, as for the corpus index)
+FINGERPRINT_TTL = float(os.getenv("TOOL_CACHE_FINGERPRINT_TTL", "2.0"))
+
+CACHEABLE_TOOLS = ("validate", "compliance", "boundary", "discover", "ast_analyze", "ast_check_quality")
+
+# Tool state that is not an output of the run (effective.yaml is rewritten by
+# every AgentQMS tool and would invalidate everything)
+_CONFIG_FILES = (".agentqms/settings.yaml",)
+_SKIP_DIRS = ("__pycache__", ".venv", ".git", "node_modules")
+
+
+class InputSpec(NamedTuple):
+    """Files a tool reads: everything under ``path`` ending in one of ``suffixes``."""
+    path: str
+    suffixes: Tuple[str, ...] = ("",)
+    recursive: bool = True
+
+
+class CacheLookup(NamedTuple):
+    """Result of a lookup: a hit carries the stored entry, a miss what to store it under."""
+    key: str
+    fingerprint: str
+    entry: Optional[Dict[str, Any]]
+
+
+def _workspace_path(path: str) -> str:
+    return os.path.normpath(path if os.path.isabs(path) else os.path.join(WORKSPACE_ROOT, path))
+
+
+def tool_inputs(tool_id: str, args: Optional[dict]) -> List[InputSpec]:
+    """The files whose state decides a tool's result."""
+    config = [InputSpec(_workspace_path(path), recursive=False) for path in _CONFIG_FILES]
+    if tool_id in ("validate", "compliance"):
+        return [InputSpec(get_artifacts_root_for_tools())] + config
+    if tool_id == "boundary":
+        # Checks which top-level directories exist, and the configured paths
+        return [
+            InputSpec(WORKSPACE_ROOT, recursive=False),
+            InputSpec(_workspace_path("AgentQMS"), recursive=False),
+        ] + config
+    if tool_id == "discover":
+        return [InputSpec(_workspace_path("AgentQMS/agent_tools"), (".py",))]
+    if tool_id in ("ast_analyze", "ast_check_quality"):
+        return [InputSpec(_workspace_path(str((args or {}).get("path") or ".")), (".py",))]
+    return []
+
+
+def _tool_sources(attempts: List[Attempt]) -> List[str]:
+    """Source files of the entry points the attempts would run."""
+    sources = []
+    for attempt in attempts:
+        if attempt.warm:
+            continue
+        sources += [
+            _workspace_path(part) for part in attempt.cmd
+            if part.endswith(".py") and os.path.isfile(_workspace_path(part))
+        ]
+    return sources
+
+
+def _module_source(tool_id: str) -> List[str]:
+    module = WARM_MODULES.get(tool_id)
+    return [_workspace_path(module.replace(".", "/") + ".py")] if module else []
+
+
+class ToolResultCache:
+    """
+    Results of read-only tool runs, reused while nothing they depend on changed.
+
+    An entry is keyed by the tool id, its normalized arguments, the commands
+    it would run and a hash of the tools' source; it is valid only for the
+    fingerprint (path, mtime and size of every input file) it was produced
+    under. A lookup with a different fingerprint drops the entry.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, fingerprint_ttl: float = FINGERPRINT_TTL):
+        self.max_entries = max_entries
+        self.fingerprint_ttl = fingerprint_ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        # input spec -> (fingerprint, computed at)
+        self._fingerprints: Dict[InputSpec, Tuple[str, float]] = {}
+        # source path -> (mtime_ns, size, sha1)
+        self._source_hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, tool_id: str, args: Optional[dict], attempts: List[Attempt]) -> Optional[CacheLookup]:
+        """
+        Find a stored result for this request (None if the tool is not cacheable).
+
+        Stats the tool's input files, so call it off the event loop.
+        """
+        if not CACHE_ENABLED or tool_id not in CACHEABLE_TOOLS:
+            return None
+        key = self._key(tool_id, args, attempts)
+        fingerprint = self._fingerprint(tool_inputs(tool_id, args))
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None and stored[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return CacheLookup(key, fingerprint, stored[1])
+            if stored is not None:
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+        return CacheLookup(key, fingerprint, None)
+
+    def store(self, lookup: CacheLookup, entry: Dict[str, Any]) -> None:
+        """Keep a finished run's result under the fingerprint taken before it ran."""
+        with self._lock:
+            self._entries[lookup.key] = (lookup.fingerprint, entry)
+            self._entries.move_to_end(lookup.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._fingerprints.clear()
+        return count
+
+    def reset_fingerprints(self) -> None:
+        """Re-stat inputs on the next lookup (after writes through the API)."""
+        with self._lock:
+            self._fingerprints.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": CACHE_ENABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+    def _key(self, tool_id: str, args: Optional[dict], attempts: List[Attempt]) -> str:
+        # Tools ignore empty argument values, so they do not change the key
+        normalized = {name: str(value) for name, value in (args or {}).items() if value}
+        digest = hashlib.sha1()
+        digest.update(json.dumps(
+            [tool_id, normalized, [[attempt.strategy] + list(attempt.cmd) for attempt in attempts]],
+            sort_keys=True
+        ).encode("utf-8"))
+        for path in sorted(set(_tool_sources(attempts) + _module_source(tool_id))):
+            digest.update(f"{path}\0{self._source_hash(path)}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _source_hash(self, path: str) -> str:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "missing"
+        with self._lock:
+            cached = self._source_hashes.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, "rb") as f:
+            content_hash = hashlib.sha1(f.read()).hexdigest()
+        with self._lock:
+            self._source_hashes[path] = (st.st_mtime_ns, st.st_size, content_hash)
+        return content_hash
+
+    def _fingerprint(self, specs: List[InputSpec]) -> str:
+        digest = hashlib.sha1()
+        now = time.monotonic()
+        for spec in specs:
+            with self._lock:
+                cached = self._fingerprints.get(spec)
+            if cached is None or now - cached[1] > self.fingerprint_ttl:
+                cached = (self._scan(spec), now)
+                with self._lock:
+                    self._fingerprints[spec] = cached
+            digest.update(f"{spec.path}\0{cached[0]}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _scan(spec: InputSpec) -> str:
+        digest = hashlib.sha1()
+        if os.path.isfile(spec.path) or not os.path.exists(spec.path):
+            try:
+                st = os.stat(spec.path)
+                digest.update(f"{st.st_mtime_ns}\0{st.st_size}".encode("utf-8"))
+            except OSError:
+                digest.update(b"missing")
+            return digest.hexdigest()
+
+        for dirpath, dirnames, filenames in os.walk(spec.path):
+            dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+            if not spec.recursive:
+                # Only which entries exist matters, not their contents
+                for name in sorted(dirnames + filenames):
+                    digest.update(f"{name}\n".encode("utf-8"))
+                break
+            for name in sorted(filenames):
+                if not name.endswith(spec.suffixes):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+
+_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_cache() -> ToolResultCache:
+    global _cache
+    if _cache is None:
+        _cache = ToolResultCache()
+    return _cache
+
+
+# Writes through the API change the artifacts the compliance tools read
+on_invalidate(lambda: get_tool_cache().reset_fingerprints())
+
+register_cache(
+    "tool_results",
+    lambda: get_tool_cache().stats(),
+    contents=lambda: get_tool_cache()._entries
+)
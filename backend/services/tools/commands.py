@@ -0,0 +1,210 @@
+import os
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+# backend/services/tools -> project root
+WORKSPACE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+DEMO_SCRIPTS_DIR = os.path.join(WORKSPACE_ROOT, "demo_scripts")
+
+DEMO_TIMEOUT = 30
+TOOL_TIMEOUT = 60
+
+SCRIPT_PREFIXES = ("AgentQMS/", "agent_tools/", "AgentQMS\\", "agent_tools\\")
+
+
+class Attempt(NamedTuple):
+    """
+    One way of running a tool; a run tries its attempts in order until one
+    succeeds. With ``fallback_on_failure`` false, a run that completes is the
+    result even if it fails (only an infrastructure error moves on).
+    """
+    strategy: str
+    cmd: List[str]  # for warm attempts, the argv passed to main()
+    timeout: float
+    env: Optional[Dict[str, str]] = None
+    warm: bool = False
+    fallback_on_failure: bool = True
+
+
+class ToolPlanError(Exception):
+    """The request cannot be turned into a command (unknown tool, missing script...)."""
+
+
+def _python_env() -> Dict[str, str]:
+    # Tools import AgentQMS as a package from the workspace root
+    env = os.environ.copy()
+    env["PYTHONPATH"] = WORKSPACE_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _arg_values(args: Optional[dict]) -> List[str]:
+    """Non-empty argument values, in order (tools take positional arguments)."""
+    return [str(value) for value in (args or {}).values() if value]
+
+
+def is_script(tool_id: str) -> bool:
+    return tool_id.startswith(SCRIPT_PREFIXES)
+
+
+def get_artifacts_root_for_tools() -> str:
+    """Get artifacts root with auto-detection."""
+    demo_mode = os.getenv("DEMO_MODE", "false").lower() == "true"
+    artifacts_rel = "demo_data/artifacts" if demo_mode else "docs/artifacts"
+    artifacts_root = os.path.join(WORKSPACE_ROOT, artifacts_rel)
+
+    # Auto-detect: if configured path doesn't exist, try the alternative
+    if not os.path.exists(artifacts_root):
+        alt_artifacts_rel = "docs/artifacts" if demo_mode else "demo_data/artifacts"
+        alt_artifacts_root = os.path.join(WORKSPACE_ROOT, alt_artifacts_rel)
+        if os.path.exists(alt_artifacts_root):
+            return alt_artifacts_root
+    return artifacts_root
+
+
+def demo_commands() -> Dict[str, List[str]]:
+    return {
+        "validate": ["python", os.path.join(DEMO_SCRIPTS_DIR, "validate_stub.py")],
+        "compliance": ["python", os.path.join(DEMO_SCRIPTS_DIR, "compliance_stub.py")],
+        "boundary": ["python", os.path.join(DEMO_SCRIPTS_DIR, "validate_stub.py")],
+        "discover": ["echo", "Demo: Tool discovery not implemented"],
+        "status": ["echo", "Demo: Status check OK"],
+        "ast_analyze": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "analyze", "."],
+        "ast_generate_tests": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "generate-tests"],
+        "ast_extract_docs": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "extract-docs"],
+        "ast_check_quality": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "check-quality", "."],
+    }
+
+
+def make_commands() -> Dict[str, List[str]]:
+    return {
+        "validate": ["make", "-C", "AgentQMS/interface", "validate"],
+        "compliance": ["make", "-C", "AgentQMS/interface", "compliance"],
+        "boundary": ["make", "-C", "AgentQMS/interface", "boundary"],
+        "discover": ["make", "-C", "AgentQMS/interface", "discover"],
+        "status": ["make", "-C", "AgentQMS/interface", "status"],
+        "ast_analyze": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "analyze"],
+        "ast_generate_tests": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "generate-tests"],
+        "ast_extract_docs": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "extract-docs"],
+        "ast_check_quality": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "check-quality"],
+    }
+
+
+def _registry_script(tool_id: str, default: str) -> str:
+    """Script path from the probed tool registry, or the built-in default before the first probe."""
+    from services.tools.probe import get_catalog
+
+    catalog = get_catalog()
+    return (catalog.script_for(tool_id) if catalog else None) or default
+
+
+def direct_commands() -> Dict[str, List[str]]:
+    """Direct script execution, the fallback when make (or uv) is not available."""
+    artifacts_root = get_artifacts_root_for_tools()
+    return {
+        "validate": [sys.executable, _registry_script("validate", "AgentQMS/agent_tools/compliance/validate_artifacts.py"), "--all", "--artifacts-root", artifacts_root],
+        "compliance": [sys.executable, _registry_script("compliance", "AgentQMS/agent_tools/compliance/monitor_artifacts.py"), "--check", "--artifacts-root", artifacts_root],
+        "boundary": [sys.executable, _registry_script("boundary", "AgentQMS/agent_tools/compliance/validate_boundaries.py")],
+        "discover": [sys.executable, _registry_script("discover", "AgentQMS/agent_tools/core/discover.py")],
+        "status": ["echo", "Status check - AgentQMS interface available"],
+        "ast_analyze": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "analyze"],
+        "ast_generate_tests": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "generate-tests"],
+        "ast_extract_docs": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "extract-docs"],
+        "ast_check_quality": [sys.executable, "AgentQMS/interface/cli_tools/ast_analysis.py", "check-quality"],
+    }
+
+
+def _warm_attempts(tool_id: str, direct_cmd: List[str]) -> List[Attempt]:
+    """A warm-runner attempt for ``tool_id`` if it has an in-process entry point."""
+    from services.tools.warm import WARM_ENABLED, WARM_MODULES
+
+    if not WARM_ENABLED or tool_id not in WARM_MODULES or len(direct_cmd) < 2:
+        return []
+    # [python, script, *argv] -> argv for the script's main()
+    return [Attempt("warm", direct_cmd[2:], TOOL_TIMEOUT, warm=True, fallback_on_failure=False)]
+
+
+def _probed_attempts(
+    tool_id: str,
+    strategies: List[str],
+    unavailable: Dict[str, str],
+    make: Dict[str, List[str]],
+    direct: Dict[str, List[str]]
+) -> List[Attempt]:
+    """Attempts limited to the strategies the startup probe found working."""
+    attempts = []
+    if "warm" in strategies:
+        attempts += _warm_attempts(tool_id, direct[tool_id])
+    elif "make" in strategies:
+        attempts.append(Attempt("make", make[tool_id], TOOL_TIMEOUT))
+    if "fallback" in strategies and tool_id in direct:
+        attempts.append(Attempt("fallback", direct[tool_id], TOOL_TIMEOUT, _python_env()))
+    if not attempts:
+        reasons = "; ".join(f"{strategy}: {reason}" for strategy, reason in unavailable.items())
+        raise ToolPlanError(f"No working way to run {tool_id} ({reasons}). Re-probe after fixing the environment.")
+    return attempts
+
+
+def plan_tool_run(tool_id: str, args: Optional[dict], demo_mode: bool) -> List[Attempt]:
+    """
+    Commands to try, in order, for a tool request.
+
+    Demo mode runs the stubs in demo_scripts/. Otherwise AgentQMS tools with
+    a ``main()`` entry point run in the warm worker pool (falling back to
+    the direct script), the rest go through ``make -C AgentQMS/interface``
+    with the direct script as a fallback; script paths are always run
+    directly. Once the startup probe has run, strategies it found not to
+    work here (e.g. make is not installed) are left out.
+    """
+    if is_script(tool_id):
+        script_path = os.path.join(WORKSPACE_ROOT, tool_id.replace("\\", "/"))
+        if not os.path.exists(script_path):
+            raise ToolPlanError(f"Script not found: {script_path}")
+        cmd = [sys.executable, script_path] + _arg_values(args)
+        if demo_mode:
+            return [Attempt("demo", cmd, DEMO_TIMEOUT)]
+        return [Attempt("script", cmd, TOOL_TIMEOUT, _python_env())]
+
+    if demo_mode:
+        cmd = demo_commands().get(tool_id)
+        if not cmd:
+            raise ToolPlanError(f"Unknown tool: {tool_id}")
+        # For AST tools in demo mode, add arguments
+        if tool_id.startswith("ast_"):
+            cmd += _arg_values(args)
+        return [Attempt("demo", cmd, DEMO_TIMEOUT)]
+
+    # Real execution path (expects AgentQMS present)
+    agentqms_path = os.path.join(WORKSPACE_ROOT, "AgentQMS", "interface")
+    if not os.path.exists(agentqms_path):
+        raise ToolPlanError(f"AgentQMS path not found at {agentqms_path}")
+
+    make = make_commands()
+    if tool_id not in make:
+        raise ToolPlanError(f"Unknown tool: {tool_id}")
+    direct = direct_commands()
+
+    if tool_id.startswith("ast_"):
+        # AST tools don't use make; 'path' is their positional argument
+        cmd = list(direct.get(tool_id, make[tool_id]))
+        args = args or {}
+        if args.get("path"):
+            cmd.append(str(args["path"]))
+        cmd += [str(value) for key, value in args.items() if key != "path" and value]
+        return _warm_attempts(tool_id, cmd) + [Attempt("direct", cmd, TOOL_TIMEOUT, _python_env())]
+
+    from services.tools.probe import get_catalog
+
+    catalog = get_catalog()
+    if catalog is not None and tool_id in catalog.strategies:
+        return _probed_attempts(tool_id, catalog.strategies[tool_id], catalog.unavailable[tool_id], make, direct)
+
+    warm = _warm_attempts(tool_id, direct.get(tool_id, []))
+    if warm:
+        # The warm worker runs the same entry point as the direct script, so
+        # make is skipped; the script is only used if the pool is unusable
+        return warm + [Attempt("fallback", direct[tool_id], TOOL_TIMEOUT, _python_env())]
+
+    attempts = [Attempt("make", make[tool_id], TOOL_TIMEOUT)]
+    if tool_id in direct:
+        attempts.append(Attempt("fallback", direct[tool_id], TOOL_TIMEOUT, _python_env()))
+    return attempts
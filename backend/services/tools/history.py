@@ -0,0 +1,217 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from services.observability.metrics import register_pool
+from services.tools.commands import WORKSPACE_ROOT
+
+# Every finished tool run is recorded here; TOOL_HISTORY=false turns it off
+HISTORY_ENABLED = os.getenv("TOOL_HISTORY", "true").lower() == "true"
+HISTORY_DB = os.getenv("TOOL_HISTORY_DB", os.path.join(WORKSPACE_ROOT, "data", "ops", "tool_history.db"))
+# Rows older than this are deleted when the store is opened
+RETAIN_DAYS = float(os.getenv("TOOL_HISTORY_RETAIN_DAYS", "90"))
+
+PERCENTILES = (50, 90, 95, 99)
+
+_WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_runs (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    tool_id TEXT NOT NULL,
+    args_hash TEXT NOT NULL,
+    strategy TEXT,
+    status TEXT NOT NULL,
+    exit_code INTEGER,
+    cached INTEGER NOT NULL DEFAULT 0,
+    priority TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL NOT NULL,
+    queued_s REAL,
+    duration_s REAL,
+    output_bytes INTEGER NOT NULL DEFAULT 0,
+    peak_rss_kb INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_tool_runs_tool_finished ON tool_runs(tool_id, finished_at);
+CREATE INDEX IF NOT EXISTS idx_tool_runs_finished ON tool_runs(finished_at);
+"""
+
+_COLUMNS = (
+    "run_id", "tool_id", "args_hash", "strategy", "status", "exit_code", "cached", "priority",
+    "created_at", "started_at", "finished_at", "queued_s", "duration_s", "output_bytes", "peak_rss_kb",
+)
+
+
+def args_hash(args: Optional[dict]) -> str:
+    """Stable short hash of a run's arguments (argument order does not matter)."""
+    encoded = json.dumps(args or {}, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def parse_window(window: str) -> float:
+    """Parse "90s", "30m", "24h", "7d" or "2w" (or plain seconds) into seconds."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", window or "")
+    if not match:
+        raise ValueError(f"Invalid window '{window}'. Use e.g. 30m, 24h or 7d")
+    return float(match.group(1)) * _WINDOW_UNITS.get(match.group(2) or "s", 1)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _summary(values: List[float], digits: int = 4) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    values = sorted(values)
+    summary = {f"p{pct}": round(percentile(values, pct), digits) for pct in PERCENTILES}
+    summary["max"] = round(values[-1], digits)
+    return summary
+
+
+class ToolHistory:
+    """
+    SQLite record of tool runs, for capacity planning.
+
+    Writes go through a single background thread so recording never blocks
+    the event loop; reads use their own short-lived connection.
+    """
+
+    def __init__(self, path: str = HISTORY_DB, retain_days: float = RETAIN_DAYS):
+        self.path = path
+        self.retain_days = retain_days
+        self.recorded = 0
+        self.errors = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tool-history")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _writer(self) -> sqlite3.Connection:
+        # Only used on the writer thread
+        with self._init_lock:
+            if self._conn is None:
+                conn = self._connect()
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                conn.execute("DELETE FROM tool_runs WHERE finished_at < ?", (time.time() - self.retain_days * 86400,))
+                conn.commit()
+                self._conn = conn
+            return self._conn
+
+    def record(self, row: Dict[str, Any]) -> None:
+        """Queue one finished run for insertion (see ``ToolRun.history_row``)."""
+        if HISTORY_ENABLED:
+            self._executor.submit(self._insert, row)
+
+    def _insert(self, row: Dict[str, Any]) -> None:
+        try:
+            conn = self._writer()
+            conn.execute(
+                f"INSERT INTO tool_runs ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                [row.get(column) for column in _COLUMNS]
+            )
+            conn.commit()
+            self.recorded += 1
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"Failed to record tool run {row.get('run_id')}: {e}")
+
+    def flush(self) -> None:
+        """Wait until every queued row is written."""
+        self._executor.submit(lambda: None).result()
+
+    def recent(self, tool_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent runs, newest first."""
+        if not os.path.exists(self.path):
+            return []
+        query = f"SELECT {', '.join(_COLUMNS)} FROM tool_runs"
+        params: List[Any] = []
+        if tool_id:
+            query += " WHERE tool_id = ?"
+            params.append(tool_id)
+        query += " ORDER BY finished_at DESC LIMIT ?"
+        params.append(limit)
+        with self._read() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def stats(self, window_seconds: float, tool_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-tool run counts, failure rates and percentiles of duration, queue
+        wait, output size and peak RSS over the last ``window_seconds``.
+
+        Cached runs are counted but left out of the percentiles, since they
+        did not execute the tool. Peak RSS is only known for subprocess runs
+        that outgrew the measuring wrapper (see ``services.tools.rusage``).
+        """
+        if not os.path.exists(self.path):
+            return {}
+        query = (
+            "SELECT tool_id, status, cached, duration_s, queued_s, output_bytes, peak_rss_kb"
+            " FROM tool_runs WHERE finished_at >= ?"
+        )
+        params: List[Any] = [time.time() - window_seconds]
+        if tool_id:
+            query += " AND tool_id = ?"
+            params.append(tool_id)
+        with self._read() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        grouped: Dict[str, List[sqlite3.Row]] = {}
+        for row in rows:
+            grouped.setdefault(row["tool_id"], []).append(row)
+
+        result = {}
+        for tool, tool_rows in sorted(grouped.items()):
+            executed = [row for row in tool_rows if not row["cached"]]
+            statuses: Dict[str, int] = {}
+            for row in tool_rows:
+                statuses[row["status"]] = statuses.get(row["status"], 0) + 1
+            failures = sum(1 for row in executed if row["status"] != "completed")
+            durations = [row["duration_s"] for row in executed if row["duration_s"] is not None]
+            result[tool] = {
+                "runs": len(tool_rows),
+                "cached": len(tool_rows) - len(executed),
+                "statuses": statuses,
+                "failure_rate": round(failures / len(executed), 4) if executed else None,
+                "duration_s": _summary(durations),
+                "queued_s": _summary([row["queued_s"] for row in executed if row["queued_s"] is not None]),
+                "output_bytes": _summary([row["output_bytes"] for row in executed], 0),
+                "peak_rss_kb": _summary([row["peak_rss_kb"] for row in executed if row["peak_rss_kb"] is not None], 0),
+            }
+        return result
+
+    def _read(self) -> "closing[sqlite3.Connection]":
+        # sqlite3's own context manager commits but does not close
+        return closing(self._connect())
+
+
+_history: Optional[ToolHistory] = None
+
+
+def get_tool_history() -> ToolHistory:
+    global _history
+    if _history is None:
+        _history = ToolHistory()
+    return _history
+
+
+register_pool("tool_history", lambda: _history._executor._work_queue.qsize() if _history else 0)
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict, IO, Iterator, List, Optional
+
+# Output kept in memory per run; anything beyond is spilled to a temp file
+# (read back page by page) until the spill cap, after which lines are dropped
+MEMORY_BYTES = int(os.getenv("TOOL_OUTPUT_MEMORY_BYTES", str(1024 * 1024)))
+MAX_BYTES = int(os.getenv("TOOL_OUTPUT_MAX_BYTES", str(256 * 1024 * 1024)))
+SPILL_DIR = os.getenv("TOOL_OUTPUT_SPILL_DIR") or None
+
+# Byte offset of every Nth spilled line, so a page can be found without
+# reading the file from the start
+_INDEX_EVERY = 256
+# Rough per-line cost of the dict holding a line in memory
+_LINE_OVERHEAD = 100
+
+
+class OutputLog:
+    """
+    Numbered output lines of a tool run.
+
+    The first ``memory_bytes`` stay in memory; later lines are appended to
+    an anonymous temp file as JSON lines. ``read`` pages over both, so a
+    caller does not need to know where a line lives.
+    """
+
+    def __init__(self, memory_bytes: int = MEMORY_BYTES, max_bytes: int = MAX_BYTES):
+        self.memory_bytes = memory_bytes
+        self.max_bytes = max_bytes
+        self.memory: List[Dict[str, Any]] = []
+        self.count = 0
+        self.dropped = 0
+        self.spilled_bytes = 0
+        self._memory_used = 0
+        self._spill: Optional[IO[bytes]] = None
+        self._index: List[int] = []
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill is not None
+
+    def append(self, line: Dict[str, Any]) -> bool:
+        """Add a line (its ``seq`` is set here). Returns False if it was dropped."""
+        size = len(line["text"]) + _LINE_OVERHEAD
+        if self._spill is None and self._memory_used + size <= self.memory_bytes:
+            line["seq"] = self.count
+            self.memory.append(line)
+            self._memory_used += size
+            self.count += 1
+            return True
+
+        line["seq"] = self.count
+        encoded = (json.dumps(line) + "\n").encode("utf-8")
+        if self.spilled_bytes + len(encoded) > self.max_bytes:
+            self.dropped += 1
+            return False
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="agentqms-tool-", dir=SPILL_DIR)
+        self._spill.seek(0, os.SEEK_END)
+        if (self.count - len(self.memory)) % _INDEX_EVERY == 0:
+            self._index.append(self._spill.tell())
+        self._spill.write(encoded)
+        self.spilled_bytes += len(encoded)
+        self.count += 1
+        return True
+
+    def read(self, start: int, limit: int) -> List[Dict[str, Any]]:
+        """Up to ``limit`` lines starting at sequence number ``start``."""
+        start = max(start, 0)
+        lines = self.memory[start:start + limit]
+        position = max(start, len(self.memory))
+        remaining = limit - len(lines)
+        if remaining <= 0 or self._spill is None or position >= self.count:
+            return lines
+
+        offset = position - len(self.memory)
+        self._spill.seek(self._index[offset // _INDEX_EVERY])
+        for _ in range(offset % _INDEX_EVERY):
+            self._spill.readline()
+        while remaining > 0:
+            raw = self._spill.readline()
+            if not raw:
+                break
+            lines.append(json.loads(raw))
+            remaining -= 1
+        return lines
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        position = 0
+        while position < self.count:
+            page = self.read(position, 1000)
+            if not page:
+                return
+            yield from page
+            position += len(page)
+
+    def close(self) -> None:
+        """Delete the spill file (the in-memory lines stay readable)."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            self.count = len(self.memory)
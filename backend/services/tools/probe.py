@@ -0,0 +1,168 @@
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+from services.tools.commands import WORKSPACE_ROOT, direct_commands, make_commands
+from services.tools.warm import WARM_ENABLED, WARM_MODULES
+
+MAKE_DIR = os.path.join(WORKSPACE_ROOT, "AgentQMS", "interface")
+# A make dry run only prints the recipe; it should never take long
+PROBE_TIMEOUT = float(os.getenv("TOOL_PROBE_TIMEOUT", "10"))
+
+# Recipe words that are shell syntax rather than programs on PATH
+_SHELL_WORDS = {"cd", "set", "export", "exit", "test", "[", ":", "true", "false", "if", "for", "{", "("}
+
+# Built-in tool ids and the tool_registry entries (script stems) behind them
+REGISTRY_NAMES: Dict[str, str] = {
+    "validate": "validate_artifacts",
+    "compliance": "monitor_artifacts",
+    "boundary": "validate_boundaries",
+    "discover": "discover",
+}
+
+
+class ToolCatalog:
+    """
+    What the tools service can run, determined once instead of per call.
+
+    ``registry`` is ``tool_registry.gather_tools()`` keyed by tool name;
+    ``strategies`` lists, per built-in tool, the execution strategies that
+    passed the probe in preference order (``warm``, ``make``, ``fallback``),
+    with the reason for each strategy that did not.
+    """
+
+    def __init__(self):
+        self.registry: Dict[str, Dict[str, Any]] = {}
+        self.registry_error: Optional[str] = None
+        self.make_targets: List[str] = []
+        self.strategies: Dict[str, List[str]] = {}
+        self.unavailable: Dict[str, Dict[str, str]] = {}
+        self.probed_at: Optional[float] = None
+        self.probe_seconds = 0.0
+
+    def script_for(self, tool_id: str) -> Optional[str]:
+        """Workspace-relative script path of a built-in tool, from the registry."""
+        entry = self.registry.get(REGISTRY_NAMES.get(tool_id, ""))
+        return entry["path"].replace("\\", "/") if entry else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "probed_at": self.probed_at,
+            "probe_seconds": round(self.probe_seconds, 4),
+            "tools": {
+                tool_id: {
+                    "strategies": strategies,
+                    "unavailable": self.unavailable.get(tool_id, {}),
+                    "script": self.script_for(tool_id),
+                }
+                for tool_id, strategies in self.strategies.items()
+            },
+            "make_targets": self.make_targets,
+            "registry": list(self.registry.values()),
+            "registry_error": self.registry_error,
+        }
+
+
+def _load_registry(catalog: ToolCatalog) -> None:
+    try:
+        from AgentQMS.agent_tools.core.tool_registry import gather_tools, parse_makefile_targets
+        catalog.registry = {tool.name: asdict(tool) for tool in gather_tools()}
+        catalog.make_targets = [workflow.name for workflow in parse_makefile_targets()]
+    except (ImportError, SystemExit) as e:
+        # tool_registry exits when PyYAML is missing; keep the built-in paths
+        catalog.registry_error = str(e) or type(e).__name__
+
+
+def _probe_make(target: str, catalog: ToolCatalog) -> Optional[str]:
+    """None if ``make <target>`` can run here, otherwise why not."""
+    if shutil.which("make") is None:
+        return "make is not installed"
+    if catalog.make_targets and target not in catalog.make_targets:
+        return f"no '{target}' target in the Makefile"
+    try:
+        dry_run = subprocess.run(
+            ["make", "-n", "-C", MAKE_DIR, target],
+            capture_output=True, text=True, timeout=PROBE_TIMEOUT
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return f"make -n failed: {e}"
+    if dry_run.returncode != 0:
+        return f"make -n exited with {dry_run.returncode}"
+    # The recipe's commands must exist too (e.g. validate needs uv)
+    for line in dry_run.stdout.splitlines():
+        words = line.split()
+        if not words or line.startswith("make"):
+            continue
+        if words[0] not in _SHELL_WORDS and shutil.which(words[0]) is None:
+            return f"'{words[0]}' used by the recipe is not installed"
+    return None
+
+
+def probe_tools() -> ToolCatalog:
+    """Detect the working execution strategies for every built-in non-AST tool."""
+    started = time.perf_counter()
+    catalog = ToolCatalog()
+    _load_registry(catalog)
+    defaults = direct_commands()
+
+    for tool_id, make_cmd in make_commands().items():
+        if tool_id.startswith("ast_"):
+            continue
+        available, unavailable = [], {}
+
+        module = WARM_MODULES.get(tool_id)
+        if module is not None:
+            if not WARM_ENABLED:
+                unavailable["warm"] = "warm runner disabled"
+            elif not os.path.exists(os.path.join(WORKSPACE_ROOT, *module.split(".")) + ".py"):
+                unavailable["warm"] = f"module {module} not found"
+            else:
+                available.append("warm")
+
+        reason = _probe_make(make_cmd[-1], catalog)
+        if reason is None:
+            available.append("make")
+        else:
+            unavailable["make"] = reason
+
+        if tool_id not in REGISTRY_NAMES:
+            available.append("fallback")  # not a script (e.g. status echoes)
+        else:
+            # Registry path, or the built-in one if the registry could not be loaded
+            script = catalog.script_for(tool_id) or defaults[tool_id][1]
+            if os.path.exists(os.path.join(WORKSPACE_ROOT, script)):
+                available.append("fallback")
+            else:
+                unavailable["fallback"] = f"script {script} not found"
+
+        catalog.strategies[tool_id] = available
+        catalog.unavailable[tool_id] = unavailable
+
+    catalog.probed_at = time.time()
+    catalog.probe_seconds = time.perf_counter() - started
+    return catalog
+
+
+_catalog: Optional[ToolCatalog] = None
+_probe_lock = threading.Lock()
+
+
+def get_catalog() -> Optional[ToolCatalog]:
+    """The last probe result, or None if no probe has run yet."""
+    return _catalog
+
+
+def reprobe() -> ToolCatalog:
+    """Run the probe and make its result current (one probe at a time)."""
+    global _catalog
+    with _probe_lock:
+        catalog = probe_tools()
+        _catalog = catalog
+    print("Tool probe: " + ", ".join(
+        f"{tool}={'/'.join(strategies) or 'none'}" for tool, strategies in catalog.strategies.items()
+    ))
+    return catalog
@@ -0,0 +1,544 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from services.observability.metrics import SUBPROCESS_DURATION, SUBPROCESS_SPAWNS, register_pool
+from services.tools import rusage
+from services.tools.cache import CacheLookup, get_tool_cache
+from services.tools.commands import WORKSPACE_ROOT, Attempt, is_script
+from services.tools.history import args_hash, get_tool_history
+from services.tools.output import OutputLog
+from services.tools.sandbox import describe_exit, spawn_options, terminate
+from services.tools.warm import WarmRunnerError, get_warm_runner
+
+# Finished runs kept for later retrieval (output limits are in services.tools.output)
+RUN_RETAIN = int(os.getenv("TOOL_RUN_RETAIN", "100"))
+# Seconds between SIGTERM and SIGKILL when a run is cancelled or times out
+KILL_GRACE_SECONDS = float(os.getenv("TOOL_KILL_GRACE_SECONDS", "5"))
+
+# Runs executing at once, and per-tool caps on top of that ("tool=n,tool=n")
+MAX_WORKERS = int(os.getenv("TOOL_WORKERS", "2"))
+TOOL_CONCURRENCY = os.getenv("TOOL_CONCURRENCY", "compliance=1,validate=1")
+
+# Lower runs first; interactive requests overtake queued background work
+PRIORITIES = {"interactive": 0, "background": 1}
+
+# Lines longer than this are split rather than failing the reader
+_READ_LIMIT = 1024 * 1024
+FINAL_STATES = ("completed", "failed", "cancelled", "timed_out", "error")
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """Parse "compliance=1,validate=2" into per-tool caps."""
+    caps = {}
+    for part in spec.split(","):
+        name, _, limit = part.partition("=")
+        if name.strip() and limit.strip():
+            caps[name.strip()] = max(int(limit), 1)
+    return caps
+
+
+def run_key(tool_id: str, args: Optional[dict]) -> str:
+    """Identity of a request for deduplication (argument order does not matter)."""
+    return tool_id + "\0" + json.dumps(args or {}, sort_keys=True, default=str)
+
+
+def _tool_label(tool_id: str) -> str:
+    # Script paths are arbitrary; keep the metric label set bounded
+    return "script" if is_script(tool_id) else tool_id
+
+
+class ToolRun:
+    """
+    One tool execution: its attempts, status and captured output.
+
+    Output is kept as numbered lines (``seq``) tagged with their stream
+    (``stdout``/``stderr``, or ``attempt`` when a new command starts), so a
+    follower can replay what it missed and continue live. Past the memory
+    cap lines are spilled to disk (see ``OutputLog``).
+    """
+
+    def __init__(self, tool_id: str, args: Optional[dict], attempts: List[Attempt], priority: str = "interactive"):
+        self.id = uuid.uuid4().hex[:12]
+        self.tool_id = tool_id
+        self.args = args or {}
+        self.attempts = attempts
+        self.priority = priority
+        self.key = run_key(tool_id, args)
+        self.queue_position: Optional[int] = None
+        self.status = "queued"
+        self.strategy: Optional[str] = None
+        self.exit_code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.log = OutputLog()
+        self.output_bytes = 0
+        self.peak_rss_kb: Optional[int] = None
+        self.cancel_requested = False
+        # Set when the result was served from the tool result cache
+        self.cached = False
+        self.cached_from: Optional[str] = None
+        self._attempt = 0
+        self._cache_lookup: Optional[CacheLookup] = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._task: Optional[asyncio.Task] = None
+        self._warm: Optional[asyncio.Future] = None
+        self._changed = asyncio.Event()
+        self._done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINAL_STATES
+
+    def add_line(self, stream: str, text: str) -> None:
+        if stream != "attempt":
+            self.output_bytes += len(text.encode("utf-8")) + 1
+        if self.log.append({"stream": stream, "text": text, "attempt": self._attempt}):
+            self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def observe_rss(self, kib: Optional[int]) -> None:
+        if kib is not None and kib > (self.peak_rss_kb or 0):
+            self.peak_rss_kb = kib
+
+    def finish(self, status: str, exit_code: Optional[int] = None, error: Optional[str] = None) -> None:
+        self.status = status
+        self.exit_code = exit_code
+        self.error = error
+        self.finished_at = time.time()
+        self._process = None
+        self._done.set()
+        self._notify()
+
+    async def wait(self) -> "ToolRun":
+        await self._done.wait()
+        return self
+
+    async def follow(self, after: int = -1, keepalive: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield output lines with ``seq > after`` as they are produced, until the
+        run finishes. Yields None after ``keepalive`` seconds without output.
+        """
+        index = max(after + 1, 0)
+        while True:
+            while index < self.log.count:
+                page = self.log.read(index, 500)
+                if not page:
+                    break
+                for line in page:
+                    yield line
+                index += len(page)
+            if self.finished:
+                return
+            changed = self._changed
+            try:
+                await asyncio.wait_for(changed.wait(), keepalive)
+            except asyncio.TimeoutError:
+                yield None
+
+    def output(self, stream: str) -> str:
+        """
+        Text written to ``stream`` by the final attempt, as far as it is held
+        in memory; spilled output is only available through ``log.read``.
+        """
+        text = "\n".join(
+            line["text"] for line in self.log.memory
+            if line["stream"] == stream and line["attempt"] == self._attempt
+        )
+        if self.log.spilled and stream == "stdout":
+            more = self.log.count - len(self.log.memory)
+            text += f"\n... [{more} more lines: GET /api/v1/tools/runs/{self.id}/output?offset={len(self.log.memory)}]"
+        return text
+
+    def to_dict(self, include_output: bool = False) -> Dict[str, Any]:
+        result = {
+            "run_id": self.id,
+            "tool_id": self.tool_id,
+            "args": self.args,
+            "status": self.status,
+            "priority": self.priority,
+            "queue_position": self.queue_position,
+            "strategy": self.strategy,
+            "strategies": [attempt.strategy for attempt in self.attempts],
+            "exit_code": self.exit_code,
+            "success": self.status == "completed",
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queued_s": round(self.started_at - self.created_at, 4) if self.started_at else None,
+            "duration_s": round(self.finished_at - self.started_at, 4) if self.finished_at and self.started_at else None,
+            "line_count": self.log.count,
+            "spilled_bytes": self.log.spilled_bytes,
+            "truncated": self.log.dropped > 0,
+            "output_bytes": self.output_bytes,
+            "peak_rss_kb": self.peak_rss_kb,
+            "cached": self.cached,
+            "cached_from": self.cached_from,
+        }
+        if include_output:
+            result["stdout"] = self.output("stdout")
+            result["stderr"] = self.output("stderr")
+        return result
+
+    def legacy_result(self) -> Dict[str, Any]:
+        """The response shape of the original blocking ``/api/v1/tools/exec``."""
+        if self.status == "timed_out":
+            return {"success": False, "error": "Tool execution timed out", "output": "", "run_id": self.id}
+        if self.status == "error":
+            return {"success": False, "error": self.error, "output": "", "run_id": self.id}
+        stderr = self.output("stderr")
+        return {
+            "success": self.status == "completed",
+            "output": self.output("stdout"),
+            "error": (stderr or self.error) if self.status != "completed" else None,
+            "return_code": self.exit_code,
+            "run_id": self.id,
+            "cached": self.cached,
+        }
+
+    def history_row(self) -> Dict[str, Any]:
+        """The row recorded in the tool history store."""
+        return {
+            "run_id": self.id,
+            "tool_id": self.tool_id,
+            "args_hash": args_hash(self.args),
+            "strategy": self.strategy,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "cached": int(self.cached),
+            "priority": self.priority,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queued_s": self.started_at - self.created_at if self.started_at else None,
+            "duration_s": self.finished_at - self.started_at if self.finished_at and self.started_at else None,
+            "output_bytes": self.output_bytes,
+            "peak_rss_kb": self.peak_rss_kb,
+        }
+
+    def cache_entry(self) -> Dict[str, Any]:
+        """What the result cache keeps of a finished run: outcome and final-attempt output."""
+        return {
+            "run_id": self.id,
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "strategy": self.strategy,
+            "finished_at": self.finished_at,
+            "lines": [
+                (line["stream"], line["text"]) for line in self.log.memory
+                if line["attempt"] == self._attempt and line["stream"] != "attempt"
+            ],
+        }
+
+    @classmethod
+    def from_cache(cls, tool_id: str, args: Optional[dict], attempts: List[Attempt], priority: str, entry: Dict[str, Any]) -> "ToolRun":
+        """A finished run replaying a cached result."""
+        run = cls(tool_id, args, attempts, priority)
+        run.cached = True
+        run.cached_from = entry["run_id"]
+        run.started_at = run.created_at
+        run.strategy = entry["strategy"]
+        run._attempt = next((index for index, attempt in enumerate(attempts) if attempt.strategy == entry["strategy"]), 0)
+        for stream, text in entry["lines"]:
+            run.add_line(stream, text)
+        run.finish(entry["status"], exit_code=entry["exit_code"])
+        return run
+
+
+class ToolRunManager:
+    """
+    Queues tool runs and executes them as asyncio subprocesses.
+
+    At most ``max_workers`` runs execute at once, and no tool exceeds its
+    cap in ``concurrency``; a tool at its cap does not hold up other tools
+    behind it. Queued runs start in priority order, then first come first
+    served. Submitting a request identical to one that is still queued
+    returns the queued run instead of adding another.
+
+    No thread is held while a tool runs; stdout and stderr are read line by
+    line into the run as they are produced.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        concurrency: Optional[Dict[str, int]] = None,
+        retain: int = RUN_RETAIN
+    ):
+        self.max_workers = max_workers
+        self.concurrency = parse_concurrency(TOOL_CONCURRENCY) if concurrency is None else concurrency
+        self.retain = retain
+        self.runs: "OrderedDict[str, ToolRun]" = OrderedDict()
+        self._queue: List[ToolRun] = []
+        self._running: Dict[str, int] = {}
+
+    def submit(
+        self,
+        tool_id: str,
+        args: Optional[dict],
+        attempts: List[Attempt],
+        priority: str = "interactive",
+        cache_lookup: Optional[CacheLookup] = None
+    ) -> Tuple[ToolRun, bool]:
+        """
+        Queue a run (or join an identical queued one). Returns the run and
+        whether it was newly created.
+
+        With a ``cache_lookup`` (see ``ToolResultCache.lookup``) a hit is
+        returned as an already finished run, and a miss stores the run's
+        result once it completes.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}'. Expected one of: {', '.join(PRIORITIES)}")
+
+        if cache_lookup is not None and cache_lookup.entry is not None:
+            run = ToolRun.from_cache(tool_id, args, attempts, priority, cache_lookup.entry)
+            self.runs[run.id] = run
+            self._prune()
+            get_tool_history().record(run.history_row())
+            return run, True
+
+        key = run_key(tool_id, args)
+        for queued in self._queue:
+            if queued.key == key:
+                # A more urgent duplicate promotes the queued run
+                if PRIORITIES[priority] < PRIORITIES[queued.priority]:
+                    queued.priority = priority
+                    self._dispatch()
+                return queued, False
+
+        run = ToolRun(tool_id, args, attempts, priority)
+        run._cache_lookup = cache_lookup
+        self.runs[run.id] = run
+        self._queue.append(run)
+        self._prune()
+        self._dispatch()
+        return run, True
+
+    def get(self, run_id: str) -> Optional[ToolRun]:
+        return self.runs.get(run_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [run.to_dict() for run in reversed(self.runs.values())]
+
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def queued(self) -> List[ToolRun]:
+        """Queued runs in the order they will start."""
+        return list(self._queue)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "concurrency": self.concurrency,
+            "running": sum(self._running.values()),
+            "running_by_tool": {tool: count for tool, count in self._running.items() if count},
+            "queued": len(self._queue),
+        }
+
+    async def cancel(self, run: ToolRun) -> None:
+        """Stop a run; a running process gets SIGTERM, then SIGKILL after the grace period."""
+        if run.finished:
+            return
+        run.cancel_requested = True
+        if run in self._queue:
+            self._queue.remove(run)
+            run.finish("cancelled", error="Cancelled before it started")
+            get_tool_history().record(run.history_row())
+            self._dispatch()
+        elif run._process is not None:
+            await terminate(run._process, KILL_GRACE_SECONDS)
+        elif run._warm is not None:
+            run._warm.cancel()
+
+    def _dispatch(self) -> None:
+        """Start queued runs while there is capacity, then renumber the queue."""
+        # Stable sort: FIFO within a priority
+        self._queue.sort(key=lambda queued: PRIORITIES[queued.priority])
+        loop = asyncio.get_running_loop()
+        for run in list(self._queue):
+            if sum(self._running.values()) >= self.max_workers:
+                break
+            if self._running.get(run.tool_id, 0) >= self.concurrency.get(run.tool_id, self.max_workers):
+                continue
+            self._queue.remove(run)
+            self._running[run.tool_id] = self._running.get(run.tool_id, 0) + 1
+            run.queue_position = None
+            run.status = "running"
+            run.started_at = time.time()
+            # Keep a reference: the loop only holds tasks weakly
+            run._task = loop.create_task(self._execute(run))
+
+        for position, run in enumerate(self._queue, 1):
+            run.queue_position = position
+
+    async def _execute(self, run: ToolRun) -> None:
+        try:
+            await self._execute_attempts(run)
+        finally:
+            self._running[run.tool_id] -= 1
+            if run.finished:
+                get_tool_history().record(run.history_row())
+            self._dispatch()
+
+    async def _execute_attempts(self, run: ToolRun) -> None:
+        exit_code = None
+        try:
+            for index, attempt in enumerate(run.attempts):
+                if run.cancel_requested:
+                    break
+                run._attempt = index
+                run.strategy = attempt.strategy
+                run.add_line("attempt", attempt.strategy)
+                try:
+                    exit_code = await self._run_attempt(run, attempt)
+                except WarmRunnerError as e:
+                    run.add_line("stderr", f"Warm runner unavailable: {e}")
+                    continue
+                # Later attempts are fallbacks; stop at the first success
+                if exit_code == 0 or not attempt.fallback_on_failure:
+                    break
+        except asyncio.TimeoutError:
+            run.finish("timed_out", exit_code=None, error="Tool execution timed out")
+            return
+        except Exception as e:
+            run.finish("error", error=str(e))
+            return
+
+        if run.cancel_requested:
+            run.finish("cancelled", exit_code=exit_code, error="Cancelled")
+            return
+        run.finish("completed" if exit_code == 0 else "failed", exit_code=exit_code)
+        # A failing exit is a result too (e.g. violations found); only runs
+        # that did not finish on their own are never cached
+        if run._cache_lookup is not None and not run.log.spilled and not run.log.dropped:
+            get_tool_cache().store(run._cache_lookup, run.cache_entry())
+
+    async def _run_attempt(self, run: ToolRun, attempt: Attempt) -> int:
+        tool, start = _tool_label(run.tool_id), time.perf_counter()
+        outcome = "error"
+        report_fd: Optional[int] = None
+        try:
+            if attempt.warm:
+                exit_code = await self._run_warm(run, attempt)
+                outcome = "ok" if exit_code == 0 else "failed"
+                return exit_code
+            cmd, extra = attempt.cmd, {}
+            if rusage.SUPPORTED:
+                # Measures this command's own peak RSS (see services.tools.rusage)
+                cmd, report_fd, write_fd = rusage.wrap(attempt.cmd)
+                extra = {"pass_fds": (write_fd,)}
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=WORKSPACE_ROOT,
+                    env=attempt.env,
+                    limit=_READ_LIMIT,
+                    **extra,
+                    **spawn_options(),
+                )
+            except FileNotFoundError:
+                # e.g. make is not installed: let the next attempt run
+                run.add_line("stderr", f"Command not found: {attempt.cmd[0]}")
+                outcome = "failed"
+                return 127
+            finally:
+                if report_fd is not None:
+                    os.close(write_fd)
+            run._process = process
+
+            pumps = asyncio.gather(
+                self._pump(run, process.stdout, "stdout"),
+                self._pump(run, process.stderr, "stderr"),
+            )
+            try:
+                await asyncio.wait_for(asyncio.shield(pumps), attempt.timeout)
+                exit_code = await process.wait()
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                await terminate(process, KILL_GRACE_SECONDS)
+                try:
+                    # A surviving grandchild may still hold the pipes open
+                    await asyncio.wait_for(pumps, KILL_GRACE_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                raise
+            if report_fd is not None:
+                report, report_fd = rusage.read_report(report_fd), None
+                if report.get("error") == "not_found":
+                    run.add_line("stderr", f"Command not found: {attempt.cmd[0]}")
+                    outcome = "failed"
+                    return 127
+                run.observe_rss(report.get("peak_rss_kb"))
+            outcome = "ok" if exit_code == 0 else "failed"
+            if not run.cancel_requested and describe_exit(exit_code):
+                run.add_line("stderr", describe_exit(exit_code))
+            return exit_code
+        finally:
+            if report_fd is not None:
+                os.close(report_fd)
+            run._process = None
+            SUBPROCESS_SPAWNS.inc(tool=tool, strategy=attempt.strategy, outcome=outcome)
+            SUBPROCESS_DURATION.observe(time.perf_counter() - start, tool=tool, strategy=attempt.strategy)
+
+    @staticmethod
+    async def _run_warm(run: ToolRun, attempt: Attempt) -> int:
+        runner = get_warm_runner()
+        run._warm = asyncio.ensure_future(runner.run(run.tool_id, attempt.cmd, WORKSPACE_ROOT, attempt.timeout))
+        try:
+            exit_code, stdout, stderr = await run._warm
+        except asyncio.CancelledError:
+            if run.cancel_requested:
+                return -15
+            raise
+        finally:
+            run._warm = None
+        # No peak RSS: a long-lived worker's high-water mark is not this run's
+        # Warm runs capture output in the worker; it arrives when the tool finishes
+        for stream, text in (("stdout", stdout), ("stderr", stderr)):
+            for line in text.splitlines():
+                run.add_line(stream, line)
+        return exit_code
+
+    @staticmethod
+    async def _pump(run: ToolRun, reader: asyncio.StreamReader, stream: str) -> None:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Over the read limit: take what is buffered as one line
+                line = await reader.read(_READ_LIMIT)
+            if not line:
+                return
+            run.add_line(stream, line.decode("utf-8", errors="replace").rstrip("\r\n"))
+
+    def _prune(self) -> None:
+        finished = [run_id for run_id, run in self.runs.items() if run.finished]
+        for run_id in finished[:max(len(self.runs) - self.retain, 0)]:
+            self.runs.pop(run_id).log.close()
+
+
+_manager: Optional[ToolRunManager] = None
+
+
+def get_run_manager() -> ToolRunManager:
+    global _manager
+    if _manager is None:
+        _manager = ToolRunManager()
+    return _manager
+
+
+register_pool("tool_runs", lambda: _manager.queue_depth() if _manager else 0)
@@ -0,0 +1,95 @@
+"""
+Peak memory of one tool subprocess.
+
+The server's own ``RUSAGE_CHILDREN`` covers every child it has ever reaped,
+and /proc sampling misses short peaks (and measures ``make`` rather than
+the tool it starts). Instead the command runs under this file as a tiny
+parent: once the command exits, its ``RUSAGE_CHILDREN`` is exactly the
+largest resident set among the command and everything it waited for, and
+is written as JSON to an inherited pipe.
+
+A spawned child starts out with the wrapper's memory, and Linux keeps that
+high-water mark across exec, so a peak at or below the wrapper's own (about
+10 MB) cannot be told apart from it and is reported as None.
+
+Run as a script: ``python -I -S rusage.py <fd> <cmd> [args...]``. It only
+imports what it needs, since everything it loads raises that floor.
+"""
+import json
+import os
+import signal
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SUPPORTED = resource is not None and os.name == "posix"
+
+
+def wrap(cmd: list[str]) -> tuple[list[str], int, int]:
+    """
+    ``cmd`` run under the measuring wrapper, plus the (read, write) ends of
+    the report pipe. Pass the write end to the child (``pass_fds``) and
+    close it in the parent once the child has started.
+    """
+    read_fd, write_fd = os.pipe()
+    return [sys.executable, "-I", "-S", os.path.abspath(__file__), str(write_fd), *cmd], read_fd, write_fd
+
+
+def read_report(read_fd: int) -> dict:
+    """The wrapper's report (empty if it was killed before writing one); closes ``read_fd``."""
+    chunks = []
+    try:
+        while True:
+            chunk = os.read(read_fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+    try:
+        return json.loads(b"".join(chunks) or b"{}")
+    except ValueError:
+        return {}
+
+
+def _maxrss_kb(who: int) -> int:
+    maxrss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS, KiB elsewhere
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+
+def _command_peak_kb() -> int | None:
+    children, own = _maxrss_kb(resource.RUSAGE_CHILDREN), _maxrss_kb(resource.RUSAGE_SELF)
+    return children if children > own else None
+
+
+def main(argv: list[str]) -> None:
+    report_fd, cmd = int(argv[0]), argv[1:]
+    report = {}
+    try:
+        pid = os.posix_spawnp(
+            cmd[0], cmd, os.environ,
+            file_actions=[(os.POSIX_SPAWN_CLOSE, report_fd)],
+            # Python ignores these at startup; the tool gets the defaults
+            setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+        )
+        exit_code = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+        report["peak_rss_kb"] = _command_peak_kb()
+    except FileNotFoundError:
+        exit_code = 127
+        report["error"] = "not_found"
+    with os.fdopen(report_fd, "w") as f:
+        json.dump(report, f)
+    if exit_code < 0:
+        # Die from the same signal so the caller sees the tool's real status
+        if -exit_code not in (signal.SIGKILL, signal.SIGSTOP):
+            signal.signal(-exit_code, signal.SIG_DFL)
+        os.kill(os.getpid(), -exit_code)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
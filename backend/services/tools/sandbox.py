@@ -0,0 +1,100 @@
+import asyncio
+import os
+import signal
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits or process groups
+    resource = None
+
+# Per-process limits for tool subprocesses (0 = no limit). The CPU limit is
+# a backstop behind the wall-clock timeout; SIGXCPU is sent at the limit and
+# SIGKILL a few seconds later.
+LIMIT_CPU_SECONDS = int(os.getenv("TOOL_LIMIT_CPU_SECONDS", "300"))
+LIMIT_MEMORY_MB = int(os.getenv("TOOL_LIMIT_MEMORY_MB", "2048"))
+LIMIT_OPEN_FILES = int(os.getenv("TOOL_LIMIT_OPEN_FILES", "1024"))
+
+SANDBOX_SUPPORTED = resource is not None and os.name == "posix"
+
+_CPU_HARD_MARGIN = 5
+
+
+def configured_limits() -> Dict[str, int]:
+    return {
+        "cpu_seconds": LIMIT_CPU_SECONDS,
+        "memory_mb": LIMIT_MEMORY_MB,
+        "open_files": LIMIT_OPEN_FILES,
+    }
+
+
+def apply_limits(cpu_seconds: int = 0, memory_mb: int = 0, open_files: int = 0) -> None:
+    """Lower this process's rlimits (never raises a limit above its current hard value)."""
+    if resource is None:
+        return
+    wanted = []
+    if cpu_seconds:
+        wanted.append((resource.RLIMIT_CPU, cpu_seconds, cpu_seconds + _CPU_HARD_MARGIN))
+    if memory_mb:
+        wanted.append((resource.RLIMIT_AS, memory_mb * 1024 * 1024, memory_mb * 1024 * 1024))
+    if open_files:
+        wanted.append((resource.RLIMIT_NOFILE, open_files, open_files))
+    for limit, soft, hard in wanted:
+        _, current_hard = resource.getrlimit(limit)
+        if current_hard != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current_hard), min(hard, current_hard)
+        resource.setrlimit(limit, (soft, hard))
+
+
+def _limit_child() -> None:
+    # Runs in the child between fork and exec: keep it to setrlimit calls
+    apply_limits(LIMIT_CPU_SECONDS, LIMIT_MEMORY_MB, LIMIT_OPEN_FILES)
+
+
+def spawn_options() -> Dict[str, Any]:
+    """
+    Extra ``create_subprocess_exec`` arguments that sandbox a tool: rlimits
+    applied before exec, and a new session so the tool and everything it
+    starts can be killed as one process group.
+    """
+    if not SANDBOX_SUPPORTED:
+        return {}
+    return {"preexec_fn": _limit_child, "start_new_session": True}
+
+
+def describe_exit(returncode: Optional[int]) -> Optional[str]:
+    """Explain exit statuses caused by the sandbox limits."""
+    if returncode is None or not SANDBOX_SUPPORTED:
+        return None
+    if returncode == -signal.SIGXCPU:
+        return f"Killed: CPU time limit of {LIMIT_CPU_SECONDS}s exceeded"
+    if returncode == -signal.SIGKILL and LIMIT_CPU_SECONDS:
+        return "Killed (SIGKILL): CPU time limit or out of memory"
+    return None
+
+
+def _signal_group(process: asyncio.subprocess.Process, sig: int, fallback: Callable[[], None]) -> None:
+    try:
+        if SANDBOX_SUPPORTED:
+            os.killpg(process.pid, sig)
+        else:
+            fallback()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def terminate(process: asyncio.subprocess.Process, grace: float) -> None:
+    """
+    Stop a tool and its process group: SIGTERM, then SIGKILL after ``grace``
+    seconds. The group is killed even if the tool itself already exited, so
+    children it left behind do not keep running (or hold its pipes open).
+    """
+    if process.returncode is None:
+        _signal_group(process, signal.SIGTERM, process.terminate)
+        try:
+            await asyncio.wait_for(process.wait(), grace)
+        except asyncio.TimeoutError:
+            _signal_group(process, signal.SIGKILL, process.kill)
+            await process.wait()
+    if SANDBOX_SUPPORTED:
+        _signal_group(process, signal.SIGKILL, lambda: None)
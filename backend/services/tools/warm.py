@@ -0,0 +1,241 @@
+import asyncio
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, List, Optional, Tuple
+
+from services.tools.sandbox import configured_limits
+
+# Warm workers replace "make, then the direct script" for the AgentQMS tools
+# below; set TOOL_WARM_RUNNER=false to always spawn a fresh interpreter.
+WARM_ENABLED = os.getenv("TOOL_WARM_RUNNER", "true").lower() == "true"
+WARM_WORKERS = int(os.getenv("TOOL_WARM_WORKERS", "2"))
+# Workers are replaced after this many runs so leaked module state cannot accumulate
+WARM_MAX_TASKS = int(os.getenv("TOOL_WARM_MAX_TASKS", "50"))
+
+# tool_id -> module whose main() implements it
+WARM_MODULES: Dict[str, str] = {
+    "validate": "AgentQMS.agent_tools.compliance.validate_artifacts",
+    "compliance": "AgentQMS.agent_tools.compliance.monitor_artifacts",
+    "boundary": "AgentQMS.agent_tools.compliance.validate_boundaries",
+    "discover": "AgentQMS.agent_tools.core.discover",
+    "ast_analyze": "AgentQMS.scripts.ast_analysis_cli",
+    "ast_generate_tests": "AgentQMS.scripts.ast_analysis_cli",
+    "ast_extract_docs": "AgentQMS.scripts.ast_analysis_cli",
+    "ast_check_quality": "AgentQMS.scripts.ast_analysis_cli",
+}
+
+# Heavy imports done once per worker instead of once per run
+_PRELOAD = sorted(set(WARM_MODULES.values())) + ["AgentQMS.agent_tools.core.plugins"]
+
+
+class WarmRunnerError(Exception):
+    """The warm pool could not run the tool (the caller should fall back to a subprocess)."""
+
+
+def _init_worker(workspace_root: str, limits: Dict[str, int]) -> None:
+    # CPU time accumulates over the worker's life, so only memory and files
+    # are limited here; the run timeout covers runaway CPU
+    from services.tools.sandbox import apply_limits
+    apply_limits(memory_mb=limits["memory_mb"], open_files=limits["open_files"])
+    if workspace_root not in sys.path:
+        sys.path.insert(0, workspace_root)
+    for module in _PRELOAD:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # Reported when a run actually needs the module
+            pass
+
+
+def _run_main(module_name: str, argv: List[str], cwd: str) -> Tuple[int, str, str]:
+    """
+    Worker side: call ``module.main()`` as if run as a script.
+
+    ``sys.argv``, the working directory and stdio are swapped for the call
+    and restored afterwards; the exit code comes from the return value or
+    ``SystemExit``.
+    """
+    module = importlib.import_module(module_name)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [module.__file__ or module_name] + list(argv)
+    exit_code = 0
+    try:
+        os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                result = module.main()
+                exit_code = result if isinstance(result, int) else 0
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def _noop() -> None:
+    return None
+
+
+class WarmRunner:
+    """
+    Long-lived worker processes with AgentQMS already imported.
+
+    Runs pay a pickle round-trip instead of interpreter startup plus
+    imports. Output is returned when the tool finishes rather than streamed.
+    Each worker is its own single-process pool and runs one tool at a time;
+    a worker cannot be interrupted mid-run, so a timeout or cancellation
+    replaces only that worker while runs on the others carry on.
+    """
+
+    def __init__(self, workspace_root: str, workers: int = WARM_WORKERS, max_tasks: int = WARM_MAX_TASKS):
+        self.workspace_root = workspace_root
+        self.workers = max(workers, 1)
+        self.max_tasks = max_tasks
+        self.runs = 0
+        self.recycles = 0
+        self._executors: List[Optional[ProcessPoolExecutor]] = [None] * self.workers
+        self._free = list(range(self.workers))
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._lock = threading.Lock()
+
+    def _executor(self, slot: int) -> ProcessPoolExecutor:
+        with self._lock:
+            executor = self._executors[slot]
+            if executor is None:
+                # spawn: forking a threaded server process is unsafe, and
+                # max_tasks_per_child requires a non-fork start method
+                executor = self._executors[slot] = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.workspace_root, configured_limits()),
+                    max_tasks_per_child=self.max_tasks,
+                )
+            return executor
+
+    def warm_up(self) -> None:
+        """Start the workers (and their imports) ahead of the first run."""
+        for slot in range(self.workers):
+            self._executor(slot).submit(_noop)
+
+    async def _acquire(self) -> int:
+        """Wait for an idle worker (the run manager usually leaves one free)."""
+        while True:
+            with self._lock:
+                if self._free:
+                    return self._free.pop()
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                    elif self._free and self._waiters:
+                        # Pass on a wake-up this waiter can no longer use
+                        self._wake(self._waiters.popleft())
+                raise
+
+    def _release(self, slot: int) -> None:
+        with self._lock:
+            self._free.append(slot)
+            if self._waiters:
+                self._wake(self._waiters.popleft())
+
+    @staticmethod
+    def _wake(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.get_loop().call_soon_threadsafe(lambda: waiter.done() or waiter.set_result(None))
+
+    async def run(self, tool_id: str, argv: List[str], cwd: str, timeout: float) -> Tuple[int, str, str]:
+        module = WARM_MODULES.get(tool_id)
+        if module is None:
+            raise WarmRunnerError(f"No warm entry point for {tool_id}")
+        slot = await self._acquire()
+        try:
+            try:
+                future = self._executor(slot).submit(_run_main, module, argv, cwd)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self.recycle(slot)
+                raise WarmRunnerError(str(e))
+
+            self.runs += 1
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except asyncio.CancelledError:
+                self.recycle(slot)
+                raise
+            except asyncio.TimeoutError:
+                self.recycle(slot)
+                raise
+            except BrokenProcessPool as e:
+                self.recycle(slot)
+                raise WarmRunnerError(f"Warm worker died: {e}")
+            except ImportError as e:
+                raise WarmRunnerError(f"Cannot import {module}: {e}")
+        finally:
+            self._release(slot)
+
+    def recycle(self, slot: Optional[int] = None) -> None:
+        """Kill one worker (or all of them); it is restarted on its next run."""
+        slots = range(self.workers) if slot is None else [slot]
+        with self._lock:
+            executors = [self._executors[s] for s in slots]
+            for s in slots:
+                self._executors[s] = None
+        for executor in executors:
+            if executor is None:
+                continue
+            self.recycles += 1
+            processes = list((getattr(executor, "_processes", None) or {}).values())
+            executor.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                if process.is_alive():
+                    process.kill()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            started = sum(executor is not None for executor in self._executors)
+            busy = self.workers - len(self._free)
+        return {
+            "enabled": WARM_ENABLED,
+            "workers": self.workers,
+            "workers_started": started,
+            "workers_busy": busy,
+            "max_tasks_per_worker": self.max_tasks,
+            "runs": self.runs,
+            "recycles": self.recycles,
+            "pool_started": started > 0,
+        }
+
+
+_runner: Optional[WarmRunner] = None
+
+
+def get_warm_runner() -> WarmRunner:
+    global _runner
+    if _runner is None:
+        from services.tools.commands import WORKSPACE_ROOT
+        _runner = WarmRunner(WORKSPACE_ROOT)
+    return _runner
@@ -0,0 +1,316 @@
+"""
+Seeded demo data for the tracking endpoints.
+
+Self-contained on purpose: demo images ship without AgentQMS/, so the schema
+and the status/listing queries below mirror AgentQMS' tracking ``db`` and
+``query`` modules (same text and page shapes) without importing them.
+"""
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Shared in-memory database: every connection opened on this URI sees the
+# same data, and it lives as long as one connection stays open
+DEMO_DB_URI = "file:agentqms-tracking-demo?mode=memory&cache=shared"
+
+_PLANS = [
+    # key, title, status, owner, started_at, updated_at, tasks (title, status)
+    ("demo-plan-001", "Compliance engine rollout", "in_progress", "platform",
+     "2025-12-10T09:00:00+00:00", "2025-12-14T17:30:00+00:00",
+     [("Rule loader", "completed"), ("Cross-artifact rules", "in_progress"),
+      ("Remediation hints", "pending"), ("Dashboard wiring", "pending")]),
+    ("demo-plan-002", "Artifact naming migration", "completed", "docs",
+     "2025-11-28T10:00:00+00:00", "2025-12-02T16:00:00+00:00",
+     [("Rename bug reports", "completed"), ("Update templates", "completed")]),
+]
+
+_EXPERIMENTS = [
+    # key, title, objective, owner, status, created_at, updated_at, runs (params, metrics, outcome)
+    ("exp-ocr-tuning", "OCR preprocessing tuning", "Raise field accuracy above 95%", "ml",
+     "completed", "2025-12-01T08:00:00+00:00", "2025-12-05T12:00:00+00:00",
+     [({"dpi": 200}, {"accuracy": 0.912}, "fail"),
+      ({"dpi": 300}, {"accuracy": 0.948}, "inconclusive"),
+      ({"dpi": 300, "deskew": True}, {"accuracy": 0.963}, "pass")]),
+    ("exp-prompt-optimization", "Prompt optimization", "Cut validation retries in half", "agents",
+     "in_progress", "2025-12-08T09:30:00+00:00", "2025-12-13T15:45:00+00:00",
+     [({"variant": "baseline"}, {"retries": 2.4}, "inconclusive"),
+      ({"variant": "structured"}, {"retries": 1.3}, "pass")]),
+]
+
+_DEBUG_SESSIONS = [
+    # key, title, status, hypothesis, scope, started_at, updated_at, notes
+    ("debug-cors-issue", "CORS errors from the dashboard", "completed",
+     "Origin list misses the dev server port", "backend/server.py",
+     "2025-12-03T11:00:00+00:00", "2025-12-03T14:20:00+00:00",
+     ["Reproduced with vite on :3000", "Added origin; verified preflight"]),
+    ("debug-api-timeout", "Validation endpoint timeouts", "in_progress",
+     "Full rescans on every request", "backend/routes/compliance.py",
+     "2025-12-12T10:15:00+00:00", "2025-12-13T09:40:00+00:00",
+     ["p95 at 8s on 5k artifacts"]),
+]
+
+_REFACTORS = [
+    # key, title, status, notes, started_at, updated_at
+    ("refactor-toolkit-migration", "Move scripts into agent_tools", "completed",
+     "Old toolkit paths kept as shims", "2025-11-20T09:00:00+00:00", "2025-11-26T18:00:00+00:00"),
+    ("refactor-schema-update", "Frontmatter schema v2", "in_progress",
+     None, "2025-12-09T13:00:00+00:00", "2025-12-12T11:00:00+00:00"),
+]
+
+
+def seed(conn: sqlite3.Connection) -> None:
+    """Fill an empty tracking schema with the demo plans, experiments, sessions and refactors."""
+    with conn:
+        for key, title, status, owner, started, updated, tasks in _PLANS:
+            plan_id = conn.execute(
+                "INSERT INTO feature_plans(key,title,status,owner,started_at,updated_at) VALUES (?,?,?,?,?,?)",
+                (key, title, status, owner, started, updated),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO plan_tasks(plan_id,title,status,notes,created_at,updated_at) VALUES (?,?,?,?,?,?)",
+                [(plan_id, task, task_status, None, started, updated) for task, task_status in tasks],
+            )
+        for key, title, objective, owner, status, created, updated, runs in _EXPERIMENTS:
+            experiment_id = conn.execute(
+                "INSERT INTO experiments(key,title,objective,owner,status,created_at,updated_at) VALUES (?,?,?,?,?,?,?)",
+                (key, title, objective, owner, status, created, updated),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO experiment_runs(experiment_id,run_no,params_json,metrics_json,outcome,created_at) VALUES (?,?,?,?,?,?)",
+                [
+                    (experiment_id, run_no, json.dumps(params), json.dumps(metrics), outcome, updated)
+                    for run_no, (params, metrics, outcome) in enumerate(runs, start=1)
+                ],
+            )
+        for key, title, status, hypothesis, scope, started, updated, notes in _DEBUG_SESSIONS:
+            session_id = conn.execute(
+                "INSERT INTO debug_sessions(key,title,status,hypothesis,scope,started_at,updated_at) VALUES (?,?,?,?,?,?,?)",
+                (key, title, status, hypothesis, scope, started, updated),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO debug_notes(session_id,note,created_at) VALUES (?,?,?)",
+                [(session_id, note, updated) for note in notes],
+            )
+        conn.executemany(
+            "INSERT INTO refactors(key,title,status,notes,started_at,updated_at) VALUES (?,?,?,?,?,?)",
+            _REFACTORS,
+        )
+
+
+# Tables read by the demo queries (subset of AgentQMS' tracking schema)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feature_plans (
+    id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, title TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending', owner TEXT, started_at TEXT, updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS plan_tasks (
+    id INTEGER PRIMARY KEY, plan_id INTEGER NOT NULL, title TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending', notes TEXT, created_at TEXT NOT NULL, updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS refactors (
+    id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, title TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending', notes TEXT, started_at TEXT, updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS debug_sessions (
+    id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, title TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'in_progress', hypothesis TEXT, scope TEXT,
+    started_at TEXT NOT NULL, updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS debug_notes (
+    id INTEGER PRIMARY KEY, session_id INTEGER NOT NULL, note TEXT NOT NULL, created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS experiments (
+    id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, title TEXT NOT NULL, objective TEXT,
+    owner TEXT, status TEXT NOT NULL DEFAULT 'in_progress', created_at TEXT NOT NULL, updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS experiment_runs (
+    id INTEGER PRIMARY KEY, experiment_id INTEGER NOT NULL, run_no INTEGER NOT NULL,
+    params_json TEXT NOT NULL, metrics_json TEXT, outcome TEXT NOT NULL, created_at TEXT NOT NULL,
+    UNIQUE(experiment_id, run_no)
+);
+"""
+
+
+_anchor: Optional[sqlite3.Connection] = None
+_seed_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_demo_connection() -> sqlite3.Connection:
+    """
+    Read-only connection to the seeded demo tracking database for this thread.
+
+    The database is created and seeded on first use; sqlite3 connections
+    cannot be shared across threads, so each thread gets its own.
+    """
+    global _anchor
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+    with _seed_lock:
+        if _anchor is None:
+            anchor = sqlite3.connect(DEMO_DB_URI, uri=True, check_same_thread=False)
+            anchor.executescript(_SCHEMA)
+            seed(anchor)
+            _anchor = anchor
+    conn = sqlite3.connect(DEMO_DB_URI, uri=True)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only = ON")
+    _local.conn = conn
+    return conn
+
+
+# Status text, as AgentQMS' query.get_status renders it
+def get_status(kind: str) -> str:
+    """One-line tracking status of the demo data for ``kind`` (plan, experiment, debug, refactor or all)."""
+    conn = get_demo_connection()
+    kind = kind.lower()
+    if kind == "plan":
+        rows = conn.execute(
+            """
+            SELECT p.key, p.status,
+                (SELECT COUNT(*) FROM plan_tasks t
+                 WHERE t.plan_id = p.id AND t.status != 'completed') AS open_tasks
+            FROM feature_plans p ORDER BY p.updated_at DESC
+            """
+        ).fetchall()
+        return " | ".join(f"{r['key']}:{r['status']} open={r['open_tasks']}" for r in rows) or "No plans found."
+    if kind == "experiment":
+        rows = conn.execute("SELECT key,status FROM experiments ORDER BY updated_at DESC").fetchall()
+        return " | ".join(f"{r['key']}:{r['status']}" for r in rows) or "No experiments found."
+    if kind == "debug":
+        rows = conn.execute("SELECT key,status FROM debug_sessions ORDER BY started_at DESC").fetchall()
+        return " | ".join(f"{r['key']}:{r['status']}" for r in rows) or "No debug sessions."
+    if kind == "refactor":
+        rows = conn.execute("SELECT key,status FROM refactors ORDER BY updated_at DESC").fetchall()
+        return " | ".join(f"{r['key']}:{r['status']}" for r in rows) or "No refactors."
+    if kind == "all":
+        parts = [
+            "plans: " + get_status("plan"),
+            "experiments: " + get_status("experiment"),
+            "debug: " + get_status("debug"),
+            "refactors: " + get_status("refactor"),
+        ]
+        return "; ".join(parts)[:280]
+    return f"Unknown kind: {kind}"
+
+
+# Structured listings, with the same filters and page shape as AgentQMS' query.list_*
+MAX_PAGE_SIZE = 500
+_STATUSES = {"pending", "in_progress", "paused", "completed", "cancelled"}
+
+
+def _filters(alias: str, status: Optional[str], search: Optional[str],
+             owner: Optional[str] = None) -> Tuple[List[str], List[Any]]:
+    where: List[str] = []
+    params: List[Any] = []
+    if status:
+        if status not in _STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+        where.append(f"{alias}.status = ?")
+        params.append(status)
+    if owner:
+        where.append(f"{alias}.owner = ?")
+        params.append(owner)
+    if search:
+        pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where.append(f"({alias}.key LIKE ? ESCAPE '\\' OR {alias}.title LIKE ? ESCAPE '\\')")
+        params += [pattern, pattern]
+    return where, params
+
+
+def _page(select: str, table: str, filters: Tuple[List[str], List[Any]],
+          order: str, limit: int, offset: int) -> Dict[str, Any]:
+    conn = get_demo_connection()
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    offset = max(offset, 0)
+    where, params = filters
+    clause = f" WHERE {' AND '.join(where)}" if where else ""
+    total = conn.execute(f"SELECT COUNT(*) FROM {table}{clause}", params).fetchone()[0]
+    rows = conn.execute(
+        f"{select} FROM {table}{clause} ORDER BY {order} LIMIT ? OFFSET ?",
+        [*params, limit, offset],
+    ).fetchall()
+    return {"items": [dict(r) for r in rows], "total": int(total), "limit": limit, "offset": offset}
+
+
+def list_plans(*, status: Optional[str] = None, owner: Optional[str] = None,
+               search: Optional[str] = None, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    """Demo feature plans with open/total task counts, most recently updated first."""
+    return _page(
+        """
+        SELECT p.key, p.title, p.status, p.owner, p.started_at, p.updated_at,
+            (SELECT COUNT(*) FROM plan_tasks t
+             WHERE t.plan_id = p.id AND t.status != 'completed') AS open_tasks,
+            (SELECT COUNT(*) FROM plan_tasks t WHERE t.plan_id = p.id) AS total_tasks
+        """,
+        "feature_plans p",
+        _filters("p", status, search, owner),
+        "p.updated_at DESC, p.id DESC",
+        limit,
+        offset,
+    )
+
+
+def list_experiments(*, status: Optional[str] = None, owner: Optional[str] = None,
+                     search: Optional[str] = None, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    """Demo experiments with their run count and latest run, most recently updated first."""
+    page = _page(
+        """
+        SELECT e.key, e.title, e.objective, e.owner, e.status, e.created_at, e.updated_at,
+            (SELECT COUNT(*) FROM experiment_runs c WHERE c.experiment_id = e.id) AS run_count,
+            r.run_no AS latest_run_no, r.outcome AS latest_outcome,
+            r.metrics_json AS latest_metrics_json, r.created_at AS latest_run_at
+        """,
+        """experiments e
+        LEFT JOIN experiment_runs r ON r.id = (
+            SELECT l.id FROM experiment_runs l
+            WHERE l.experiment_id = e.id ORDER BY l.run_no DESC LIMIT 1
+        )""",
+        _filters("e", status, search, owner),
+        "e.updated_at DESC, e.id DESC",
+        limit,
+        offset,
+    )
+    for item in page["items"]:
+        run_no = item.pop("latest_run_no")
+        outcome = item.pop("latest_outcome")
+        metrics = item.pop("latest_metrics_json")
+        created_at = item.pop("latest_run_at")
+        item["latest_run"] = None if run_no is None else {
+            "run_no": run_no,
+            "outcome": outcome,
+            "metrics": json.loads(metrics) if metrics else {},
+            "created_at": created_at,
+        }
+    return page
+
+
+def list_debug_sessions(*, status: Optional[str] = None, search: Optional[str] = None,
+                        limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    """Demo debug sessions with their note count, most recently started first."""
+    return _page(
+        """
+        SELECT d.key, d.title, d.status, d.hypothesis, d.scope, d.started_at, d.updated_at,
+            (SELECT COUNT(*) FROM debug_notes n WHERE n.session_id = d.id) AS note_count
+        """,
+        "debug_sessions d",
+        _filters("d", status, search),
+        "d.started_at DESC, d.id DESC",
+        limit,
+        offset,
+    )
+
+
+def list_refactors(*, status: Optional[str] = None, search: Optional[str] = None,
+                   limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    """Demo refactors, most recently updated first."""
+    return _page(
+        "SELECT r.key, r.title, r.status, r.notes, r.started_at, r.updated_at",
+        "refactors r",
+        _filters("r", status, search),
+        "r.updated_at DESC, r.id DESC",
+        limit,
+        offset,
+    )
@@ -0,0 +1,215 @@
+import os
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from services.corpus.index import on_invalidate
+from services.observability.metrics import callback_metric
+
+# Background recomputation can be turned off (views are then computed on
+# first read and refreshed by later reads once over budget)
+SCHEDULER_ENABLED = os.getenv("VIEW_SCHEDULER", "true").lower() == "true"
+# How often the scheduler checks for views that are due
+TICK_SECONDS = float(os.getenv("VIEW_SCHEDULER_TICK", "1.0"))
+
+
+class View:
+    """
+    A derived value that is materialized off the request path.
+
+    ``max_staleness`` is the budget: the scheduler recomputes the view early
+    enough (allowing for how long the last computation took) that the served
+    value stays younger than the budget. ``interval`` forces more frequent
+    refreshes; ``events`` name the change events (see ``ViewScheduler.notify``)
+    that mark the view for recomputation on the next tick.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        max_staleness: float,
+        interval: Optional[float] = None,
+        events: Iterable[str] = ()
+    ):
+        self.name = name
+        self.compute = compute
+        self.max_staleness = max_staleness
+        self.interval = interval
+        self.events = tuple(events)
+        self.value: Any = None
+        self.computed_at: Optional[float] = None
+        self.compute_seconds = 0.0
+        self.computations = 0
+        self.error: Optional[str] = None
+        # Consecutive failed computations (reset by the next success)
+        self.failures = 0
+        self.dirty = True
+        self._computed_mono: Optional[float] = None
+        self._failed_mono: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def age(self) -> Optional[float]:
+        if self._computed_mono is None:
+            return None
+        return time.monotonic() - self._computed_mono
+
+    def due(self) -> bool:
+        if self._failed_mono is not None and time.monotonic() - self._failed_mono < min(self.max_staleness, 30.0):
+            # Back off after a failure instead of retrying every tick
+            return False
+        age = self.age()
+        if age is None or self.dirty:
+            return True
+        if self.interval is not None and age >= self.interval:
+            return True
+        # Start early enough that the new value lands within the budget
+        return age + self.compute_seconds >= self.max_staleness
+
+    def refresh(self) -> None:
+        """Recompute now (one computation at a time; a failure keeps the previous value)."""
+        with self._lock:
+            self._refresh_locked()
+
+    def ensure(self) -> None:
+        """Compute the view unless a value exists (waits for a computation already running)."""
+        with self._lock:
+            if self.computed_at is None:
+                self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        # Cleared first so an event arriving mid-computation schedules another pass
+        self.dirty = False
+        started = time.perf_counter()
+        try:
+            value = self.compute()
+        except Exception as e:
+            self.error = str(e)
+            self._failed_mono = time.monotonic()
+            self.failures += 1
+            # A persistent failure (e.g. git missing) repeats every backoff
+            # cycle; report it once per streak
+            if self.failures == 1:
+                print(f"View '{self.name}' failed to refresh: {e}")
+                traceback.print_exc()
+            return
+        finally:
+            self.compute_seconds = time.perf_counter() - started
+            self.computations += 1
+        if self.failures:
+            print(f"View '{self.name}' refreshed again after {self.failures} failed attempts")
+        self.value = value
+        self.error = None
+        self.failures = 0
+        self._failed_mono = None
+        self.computed_at = time.time()
+        self._computed_mono = time.monotonic()
+
+    def snapshot(self, include_value: bool = True) -> Dict[str, Any]:
+        age = self.age()
+        snapshot = {
+            "view": self.name,
+            "computed_at": self.computed_at,
+            "age_seconds": round(age, 3) if age is not None else None,
+            "max_staleness_seconds": self.max_staleness,
+            "stale": age is None or age > self.max_staleness,
+            "refresh_pending": self.dirty,
+            "compute_seconds": round(self.compute_seconds, 4),
+            "computations": self.computations,
+            "error": self.error,
+            "failures": self.failures,
+        }
+        if include_value:
+            snapshot["value"] = self.value
+        return snapshot
+
+
+class ViewScheduler:
+    """Recomputes registered views on a background thread."""
+
+    def __init__(self, tick: float = TICK_SECONDS, enabled: bool = SCHEDULER_ENABLED):
+        self.tick = tick
+        self.enabled = enabled
+        self.views: Dict[str, View] = {}
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def register(self, view: View) -> View:
+        # Modules may be re-imported; keep the first registration
+        return self.views.setdefault(view.name, view)
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="view-scheduler", daemon=True)
+                self._thread.start()
+
+    def notify(self, event: str) -> None:
+        """Mark every view subscribed to ``event`` for recomputation."""
+        woke = False
+        for view in list(self.views.values()):
+            if event in view.events:
+                view.dirty = True
+                woke = True
+        if woke:
+            self._wake.set()
+
+    def request_refresh(self, name: str) -> None:
+        """Recompute one view on the next tick (immediately on the next read if disabled)."""
+        self.views[name].dirty = True
+        self.start()
+        self._wake.set()
+
+    def get(self, name: str) -> View:
+        return self.views[name]
+
+    def read(self, name: str, include_value: bool = True) -> Dict[str, Any]:
+        """
+        Latest materialized value of a view with its age.
+
+        Only the very first read computes in the request path; afterwards the
+        value may be older than its budget if the scheduler is behind (or
+        disabled), which the snapshot reports as ``stale``.
+        """
+        view = self.get(name)
+        self.start()
+        if view.computed_at is None:
+            view.ensure()
+        elif not self.enabled and view.due():
+            view.refresh()
+        return view.snapshot(include_value)
+
+    def peek(self, name: str) -> Any:
+        """Current value of a view, or None if it has not been computed yet (never blocks)."""
+        self.start()
+        view = self.views.get(name)
+        return view.value if view is not None else None
+
+    def _run(self) -> None:
+        while True:
+            for view in list(self.views.values()):
+                if view.due():
+                    view.refresh()
+            self._wake.wait(self.tick)
+            self._wake.clear()
+
+
+SCHEDULER = ViewScheduler()
+
+# Writes through the API invalidate the corpus; views built from it follow
+on_invalidate(lambda: SCHEDULER.notify("corpus"))
+
+callback_metric(
+    "agentqms_view_age_seconds",
+    "Age of the materialized value, by view.",
+    lambda: [({"view": name}, view.age()) for name, view in list(SCHEDULER.views.items()) if view.age() is not None]
+)
+callback_metric(
+    "agentqms_view_compute_seconds",
+    "Duration of the last computation, by view.",
+    lambda: [({"view": name}, view.compute_seconds) for name, view in list(SCHEDULER.views.items()) if view.computations]
+)
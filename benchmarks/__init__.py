@@ -0,0 +1 @@
+"""Performance benchmarks for the AgentQMS validators and dashboard backend."""
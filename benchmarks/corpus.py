@@ -0,0 +1,276 @@
+"""Synthetic artifact corpus generator for benchmarks.
+
+Produces N artifacts laid out like ``docs/artifacts`` (one directory per
+type), with a configurable type mix, body size range and violation rate.
+Generation is deterministic for a given set of parameters, and a generated
+corpus is reused when its manifest matches, so repeat benchmark runs do not
+pay for regeneration.
+
+Usage:
+    python -m benchmarks.corpus --count 10000 --violation-rate 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Generated corpora live inside the project (ArtifactValidator refuses paths
+# outside it) but under a gitignored directory.
+DEFAULT_CORPUS_DIR = PROJECT_ROOT / ".benchmarks" / "corpus"
+
+# type -> (directory, filename prefix, extra required fields, allowed statuses)
+TYPE_SPECS: dict[str, tuple[str, str, tuple[str, ...], tuple[str, ...]]] = {
+    "implementation_plan": (
+        "implementation_plans",
+        "implementation_plan_",
+        ("category", "tags", "date"),
+        ("draft", "review_needed", "approved", "completed"),
+    ),
+    "assessment": (
+        "assessments",
+        "assessment-",
+        ("category", "date"),
+        ("review_needed", "approved", "archived"),
+    ),
+    "audit": ("audits", "audit-", ("category", "date"), ("draft", "completed")),
+    "bug_report": ("bug_reports", "BUG_", ("date",), ("active", "completed")),
+    "design": ("design_documents", "design-", ("category", "date"), ("draft", "approved")),
+}
+
+DEFAULT_TYPE_MIX = {
+    "implementation_plan": 0.35,
+    "assessment": 0.2,
+    "audit": 0.1,
+    "bug_report": 0.2,
+    "design": 0.15,
+}
+
+# Kinds of injected violations, applied round-robin to violating artifacts
+VIOLATIONS = ("missing_field", "invalid_status", "bad_filename", "wrong_directory", "broken_link")
+
+WORDS = (
+    "artifact validation pipeline schema frontmatter compliance dashboard index "
+    "latency throughput cache worker queue metric budget review baseline regression "
+    "corpus template handoff assessment design audit remediation tracking session"
+).split()
+
+BASE_TIME = datetime(2025, 1, 1, 9, 0)
+RECENT_LINK_TARGETS = 1024
+
+
+def parse_type_mix(spec: str | None) -> dict[str, float]:
+    """Parse ``type=weight,...`` into a normalized mix (unlisted types are dropped)."""
+    if not spec:
+        return dict(DEFAULT_TYPE_MIX)
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in TYPE_SPECS:
+            raise ValueError(f"Unknown artifact type '{name}'. Known: {', '.join(TYPE_SPECS)}")
+        mix[name] = float(weight or 1)
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError("Type mix weights must sum to a positive number")
+    return {name: weight / total for name, weight in mix.items()}
+
+
+def corpus_params(
+    count: int,
+    type_mix: dict[str, float] | None = None,
+    body_bytes: tuple[int, int] = (800, 4000),
+    violation_rate: float = 0.1,
+    links_per_doc: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Canonical parameter dict; its hash names the corpus directory."""
+    return {
+        "count": count,
+        "type_mix": dict(sorted((type_mix or DEFAULT_TYPE_MIX).items())),
+        "body_bytes": list(body_bytes),
+        "violation_rate": violation_rate,
+        "links_per_doc": links_per_doc,
+        "seed": seed,
+    }
+
+
+def corpus_key(params: dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def _body(rng: random.Random, size: int, links: list[str]) -> str:
+    """Markdown body of roughly ``size`` bytes with the given links sprinkled in."""
+    parts = []
+    written = 0
+    section = 0
+    while written < size:
+        if written == 0 or rng.random() < 0.15:
+            section += 1
+            heading = f"\n## Section {section}\n\n"
+            parts.append(heading)
+            written += len(heading)
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + ".\n"
+        parts.append(sentence)
+        written += len(sentence)
+    for link in links:
+        parts.insert(rng.randrange(1, len(parts) + 1), f"\nSee [{link}]({link}).\n")
+    return "".join(parts)
+
+
+def _frontmatter(fields: dict[str, Any]) -> str:
+    lines = ["---"]
+    for key, value in fields.items():
+        if isinstance(value, list):
+            lines.append(f"{key}: [{', '.join(value)}]")
+        else:
+            lines.append(f"{key}: {json.dumps(value) if key == 'title' else value}")
+    lines.append("---\n")
+    return "\n".join(lines)
+
+
+def iter_artifacts(params: dict[str, Any]):
+    """Yield ``(relative_path, content)`` for every artifact in the corpus."""
+    rng = random.Random(params["seed"])
+    types = list(params["type_mix"])
+    weights = [params["type_mix"][t] for t in types]
+    low, high = params["body_bytes"]
+    # Ring of recent paths to link to; bounded so 1M-file corpora stay cheap
+    recent: list[str] = []
+    violation_index = 0
+
+    for i in range(params["count"]):
+        artifact_type = rng.choices(types, weights)[0]
+        directory, prefix, required, statuses = TYPE_SPECS[artifact_type]
+        when = BASE_TIME + timedelta(minutes=i)
+        slug = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i:07d}"
+        if artifact_type == "bug_report":
+            name = f"{when:%Y-%m-%d_%H%M}_{prefix}{i + 1:03d}_{slug}.md"
+        else:
+            name = f"{when:%Y-%m-%d_%H%M}_{prefix}{slug}.md"
+
+        fields: dict[str, Any] = {
+            "title": f"{artifact_type.replace('_', ' ').title()} {i}",
+            "type": artifact_type,
+            "status": rng.choice(statuses),
+        }
+        if "category" in required:
+            fields["category"] = "development"
+        if "tags" in required:
+            fields["tags"] = [rng.choice(WORDS), rng.choice(WORDS)]
+        if "date" in required:
+            fields["date"] = f"{when:%Y-%m-%d %H:%M} (KST)"
+
+        broken_link = None
+        if rng.random() < params["violation_rate"]:
+            kind = VIOLATIONS[violation_index % len(VIOLATIONS)]
+            violation_index += 1
+            if kind == "missing_field":
+                fields.pop("status")
+            elif kind == "invalid_status":
+                fields["status"] = "bogus"
+            elif kind == "bad_filename":
+                name = f"{slug.upper()}.md"
+            elif kind == "wrong_directory":
+                directory = TYPE_SPECS[rng.choice([t for t in TYPE_SPECS if t != artifact_type])][0]
+            else:
+                broken_link = f"../missing/{slug}.md"
+
+        # Links point at earlier artifacts so they resolve unless injected
+        links = [
+            os.path.relpath(rng.choice(recent), directory)
+            for _ in range(params["links_per_doc"])
+            if recent
+        ]
+        if broken_link:
+            links.append(broken_link)
+
+        rel_path = f"{directory}/{name}"
+        if len(recent) < RECENT_LINK_TARGETS:
+            recent.append(rel_path)
+        else:
+            recent[i % RECENT_LINK_TARGETS] = rel_path
+        size = rng.randint(low, high)
+        yield rel_path, _frontmatter(fields) + _body(rng, size, links)
+
+
+def generate_corpus(
+    count: int,
+    type_mix: dict[str, float] | None = None,
+    body_bytes: tuple[int, int] = (800, 4000),
+    violation_rate: float = 0.1,
+    links_per_doc: int = 3,
+    seed: int = 0,
+    base_dir: Path = DEFAULT_CORPUS_DIR,
+    force: bool = False,
+) -> Path:
+    """Generate (or reuse) a corpus and return its artifacts root."""
+    params = corpus_params(count, type_mix, body_bytes, violation_rate, links_per_doc, seed)
+    root = Path(base_dir) / f"n{count}-{corpus_key(params)}"
+    manifest_path = root / "manifest.json"
+
+    if not force and manifest_path.exists():
+        try:
+            if json.loads(manifest_path.read_text(encoding="utf-8")).get("params") == params:
+                return root / "artifacts"
+        except (OSError, ValueError):
+            pass
+
+    if root.exists():
+        shutil.rmtree(root)
+    artifacts_root = root / "artifacts"
+    made_dirs: set[str] = set()
+    total_bytes = 0
+    for rel_path, content in iter_artifacts(params):
+        directory = rel_path.rsplit("/", 1)[0]
+        if directory not in made_dirs:
+            (artifacts_root / directory).mkdir(parents=True, exist_ok=True)
+            made_dirs.add(directory)
+        data = content.encode("utf-8")
+        total_bytes += len(data)
+        with open(artifacts_root / rel_path, "wb") as f:
+            f.write(data)
+
+    # Written last: a corpus without a manifest is treated as incomplete
+    manifest_path.write_text(
+        json.dumps({"params": params, "files": count, "bytes": total_bytes}, indent=2),
+        encoding="utf-8",
+    )
+    return artifacts_root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic artifact corpus")
+    parser.add_argument("--count", type=int, default=1000, help="Number of artifacts")
+    parser.add_argument("--type-mix", help="Weights, e.g. 'implementation_plan=3,bug_report=1'")
+    parser.add_argument("--min-body", type=int, default=800, help="Minimum body size in bytes")
+    parser.add_argument("--max-body", type=int, default=4000, help="Maximum body size in bytes")
+    parser.add_argument("--violation-rate", type=float, default=0.1, help="Fraction of artifacts with a violation")
+    parser.add_argument("--links", type=int, default=3, help="Markdown links per artifact")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--force", action="store_true", help="Regenerate even if a matching corpus exists")
+    args = parser.parse_args()
+
+    root = generate_corpus(
+        args.count,
+        type_mix=parse_type_mix(args.type_mix),
+        body_bytes=(args.min_body, args.max_body),
+        violation_rate=args.violation_rate,
+        links_per_doc=args.links,
+        seed=args.seed,
+        force=args.force,
+    )
+    print(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""HTTP load generator for the dashboard backend.
+
+Replays a weighted mix of the requests the dashboard makes (artifact list and
+detail, stats, compliance metrics, tracking status, tool exec) from N
+concurrent keep-alive connections and reports p50/p95/p99 latency,
+throughput and error rate per route. Uses a minimal asyncio HTTP/1.1 client
+so no extra dependency is needed.
+
+Usage:
+    cd backend && DEMO_MODE=true uvicorn server:app --port 8000
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000 --concurrency 32 --duration 30
+
+    # or let the harness start (and stop) uvicorn itself
+    python -m benchmarks.loadtest --start-server --concurrency 16 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = PROJECT_ROOT / "backend"
+
+# name -> (method, path, JSON body); "{id}" is replaced with a known artifact ID
+ROUTES: dict[str, tuple[str, str, dict[str, Any] | None]] = {
+    "artifacts_list": ("GET", "/api/v1/artifacts?limit=50", None),
+    "artifact_detail": ("GET", "/api/v1/artifacts/{id}", None),
+    "stats": ("GET", "/api/v1/stats", None),
+    "compliance_metrics": ("GET", "/api/v1/compliance/metrics", None),
+    "tracking_status": ("GET", "/api/v1/tracking/status?kind=all", None),
+    "tool_exec": ("POST", "/api/v1/tools/exec", {"tool_id": "status", "args": {}}),
+    "dashboard_summary": ("GET", "/api/v1/dashboard/summary", None),
+}
+
+DEFAULT_MIX = {
+    "artifacts_list": 30,
+    "artifact_detail": 25,
+    "stats": 15,
+    "compliance_metrics": 15,
+    "tracking_status": 10,
+    "tool_exec": 5,
+}
+
+
+class HTTPError(Exception):
+    pass
+
+
+class Connection:
+    """A single keep-alive HTTP/1.1 connection (reconnects on demand)."""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, body: bytes | None = None) -> tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            "Accept: application/json",
+        ]
+        if body is not None:
+            headers += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+        self.writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        try:
+            return await asyncio.wait_for(self._read_response(), self.timeout)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def _read_response(self) -> tuple[int, bytes]:
+        assert self.reader is not None
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise HTTPError("Connection closed by server")
+        status = int(status_line.split()[1])
+
+        headers: dict[str, str] = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            payload = b"".join(chunks)
+        else:
+            payload = await self.reader.readexactly(int(headers.get("content-length", "0")))
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, payload
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+        self.reader = self.writer = None
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, latency: float, status: str, ok: bool) -> None:
+        self.latencies.append(latency)
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if not ok:
+            self.errors += 1
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def parse_mix(spec: str | None) -> dict[str, float]:
+    if not spec:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ROUTES:
+            raise ValueError(f"Unknown route '{name}'. Known: {', '.join(ROUTES)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def fetch_artifact_ids(host: str, port: int, timeout: float) -> list[str]:
+    conn = Connection(host, port, timeout)
+    try:
+        status, payload = await conn.request("GET", "/api/v1/artifacts?limit=500")
+        if status != 200:
+            return []
+        return [item["id"] for item in json.loads(payload).get("items", [])]
+    except Exception:
+        return []
+    finally:
+        await conn.close()
+
+
+async def run_load(
+    url: str,
+    mix: dict[str, float],
+    concurrency: int = 16,
+    duration: float = 10.0,
+    total_requests: int | None = None,
+    timeout: float = 30.0,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Drive load until ``duration`` elapses (or ``total_requests`` are sent)."""
+    parts = urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+
+    ids = await fetch_artifact_ids(host, port, timeout)
+    if not ids:
+        mix = {name: weight for name, weight in mix.items() if name != "artifact_detail"}
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    stats = {name: RouteStats() for name in names}
+    rng = random.Random(seed)
+    remaining = [total_requests]
+
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def worker() -> None:
+        conn = Connection(host, port, timeout)
+        try:
+            while time.perf_counter() < deadline or total_requests:
+                if total_requests:
+                    if remaining[0] <= 0:
+                        break
+                    remaining[0] -= 1
+                name = rng.choices(names, weights)[0]
+                method, path, body = ROUTES[name]
+                if "{id}" in path:
+                    path = path.replace("{id}", rng.choice(ids))
+                payload = json.dumps(body).encode("utf-8") if body is not None else None
+
+                sent = time.perf_counter()
+                try:
+                    status, _ = await conn.request(method, path, payload)
+                    stats[name].add(time.perf_counter() - sent, str(status), status < 400)
+                except Exception as e:
+                    stats[name].add(time.perf_counter() - sent, type(e).__name__, False)
+        finally:
+            await conn.close()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    routes = {}
+    all_latencies: list[float] = []
+    total_errors = 0
+    for name, route in stats.items():
+        latencies = sorted(route.latencies)
+        all_latencies.extend(latencies)
+        total_errors += route.errors
+        routes[name] = _summary(latencies, route.errors, elapsed, route.status_counts)
+    all_latencies.sort()
+
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "mix": mix,
+        "routes": routes,
+        "total": _summary(all_latencies, total_errors, elapsed),
+    }
+
+
+def _summary(latencies: list[float], errors: int, elapsed: float, status_counts=None) -> dict[str, Any]:
+    count = len(latencies)
+    summary = {
+        "requests": count,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+        "throughput_rps": count / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+    }
+    if status_counts is not None:
+        summary["status_counts"] = status_counts
+    return summary
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [
+        f"{report['url']}  concurrency={report['concurrency']}  duration={report['duration_s']:.1f}s",
+        f"{'Route':<20} {'Reqs':>7} {'RPS':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Errors':>8}",
+    ]
+    rows = list(report["routes"].items()) + [("TOTAL", report["total"])]
+    for name, row in rows:
+        lines.append(
+            f"{name:<20} {row['requests']:>7} {row['throughput_rps']:>8.1f} {row['p50_ms']:>8.1f} "
+            f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['error_rate']:>7.1%}"
+        )
+    return "\n".join(lines)
+
+
+def start_server(port: int, demo_mode: bool = True) -> subprocess.Popen:
+    """Start the backend under uvicorn and wait until /api/v1/health answers."""
+    env = {**os.environ, "DEMO_MODE": "true" if demo_mode else "false"}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+    async def wait_ready() -> bool:
+        for _ in range(100):
+            if process.poll() is not None:
+                return False
+            conn = Connection("127.0.0.1", port, 1.0)
+            try:
+                status, _ = await conn.request("GET", "/api/v1/health")
+                if status == 200:
+                    return True
+            except Exception:
+                await asyncio.sleep(0.1)
+            finally:
+                await conn.close()
+        return False
+
+    if not asyncio.run(wait_ready()):
+        process.terminate()
+        raise RuntimeError("Backend did not become ready")
+    return process
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the dashboard backend")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Backend base URL")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--requests", type=int, help="Stop after this many requests instead of --duration")
+    parser.add_argument("--mix", help="Route weights, e.g. 'artifacts_list=5,stats=1'")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start-server", action="store_true", help="Start uvicorn on the --url port for the run")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.start_server:
+        server = start_server(urlsplit(args.url).port or 8000)
+    try:
+        report = asyncio.run(run_load(
+            args.url,
+            parse_mix(args.mix),
+            concurrency=args.concurrency,
+            duration=args.duration,
+            total_requests=args.requests,
+            timeout=args.timeout,
+            seed=args.seed,
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
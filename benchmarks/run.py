@@ -0,0 +1,216 @@
+"""Validator and API benchmark suite.
+
+Runs each benchmark against synthetic corpora of one or more sizes and emits
+JSON (one result per benchmark and size, with raw samples) so runs can be
+compared over time. A summary table is printed to stderr.
+
+Usage:
+    python -m benchmarks.run --sizes 1000 10000 --repeat 5 --output results.json
+    python -m benchmarks.run --only backend_validator check_links --sizes 100000
+    python -m benchmarks.run --record --label "before index change"
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.corpus import generate_corpus, parse_type_mix
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = PROJECT_ROOT / "backend"
+
+for _path in (PROJECT_ROOT, BACKEND_DIR):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+# Each setup takes the artifacts root and returns the callable to time.
+# Imports happen inside setup so a missing optional dependency only skips
+# the benchmarks that need it.
+
+def _setup_agentqms_validate_all(root: Path) -> Callable[[], Any]:
+    from AgentQMS.agent_tools.compliance.validate_artifacts import ArtifactValidator
+
+    return lambda: ArtifactValidator(root).validate_all()
+
+
+def _setup_backend_validator(root: Path) -> Callable[[], Any]:
+    from services.compliance.validator import Validator
+
+    return lambda: Validator().validate_directory(str(root))
+
+
+def _setup_check_links(root: Path) -> Callable[[], Any]:
+    from AgentQMS.agent_tools.documentation.check_links import check_links_in_directory
+
+    return lambda: check_links_in_directory(root, PROJECT_ROOT)
+
+
+def _setup_scan_directory_tree(root: Path) -> Callable[[], Any]:
+    from routes.system import scan_directory_tree
+
+    return lambda: scan_directory_tree(str(root), max_depth=5)
+
+
+def _setup_list_artifacts(root: Path) -> Callable[[], Any]:
+    from routes import artifacts
+
+    # The route resolves its root from DEMO_MODE; point it at the corpus
+    artifacts.get_artifacts_root = lambda: str(root)
+    return lambda: asyncio.run(artifacts.list_artifacts(type=None, status=None, limit=50))
+
+
+BENCHMARKS: dict[str, Callable[[Path], Callable[[], Any]]] = {
+    "agentqms_validate_all": _setup_agentqms_validate_all,
+    "backend_validator": _setup_backend_validator,
+    "check_links": _setup_check_links,
+    "scan_directory_tree": _setup_scan_directory_tree,
+    "list_artifacts": _setup_list_artifacts,
+}
+
+
+def time_call(func: Callable[[], Any], repeat: int, warmup: int) -> list[float]:
+    """Run ``func`` warmup + repeat times and return the timed samples in seconds."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples: list[float], files: int) -> dict[str, Any]:
+    median = statistics.median(samples)
+    return {
+        "median_s": median,
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "mean_s": statistics.fmean(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "files_per_s": files / median if median > 0 else None,
+    }
+
+
+def run_suite(
+    sizes: list[int],
+    names: list[str],
+    repeat: int = 5,
+    warmup: int = 1,
+    corpus_options: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Run the selected benchmarks for every corpus size and return the result document."""
+    corpus_options = corpus_options or {}
+    results = []
+    for size in sizes:
+        start = time.perf_counter()
+        root = generate_corpus(size, **corpus_options)
+        print(f"corpus n={size}: {root} ({time.perf_counter() - start:.1f}s)", file=sys.stderr)
+
+        for name in names:
+            entry: dict[str, Any] = {"name": name, "size": size, "repeat": repeat}
+            try:
+                func = BENCHMARKS[name](root)
+            except ImportError as e:
+                entry.update(status="skipped", reason=str(e))
+                results.append(entry)
+                continue
+            try:
+                samples = time_call(func, repeat, warmup)
+            except Exception as e:
+                entry.update(status="error", reason=f"{type(e).__name__}: {e}")
+                results.append(entry)
+                continue
+            entry.update(status="ok", samples=samples, **summarize(samples, size))
+            results.append(entry)
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus": {key: value for key, value in corpus_options.items()},
+        },
+        "results": results,
+    }
+
+
+def format_table(document: dict[str, Any]) -> str:
+    lines = [f"{'Benchmark':<24} {'Size':>9} {'Median s':>10} {'Min s':>10} {'Files/s':>11}"]
+    for entry in document["results"]:
+        if entry["status"] != "ok":
+            lines.append(f"{entry['name']:<24} {entry['size']:>9} {entry['status']}: {entry['reason']}")
+            continue
+        rate = entry["files_per_s"]
+        lines.append(
+            f"{entry['name']:<24} {entry['size']:>9} {entry['median_s']:>10.4f} "
+            f"{entry['min_s']:>10.4f} {rate:>11.0f}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run validator and API benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000], help="Corpus sizes to benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before timing")
+    parser.add_argument("--type-mix", help="Corpus type weights, e.g. 'implementation_plan=3,bug_report=1'")
+    parser.add_argument("--min-body", type=int, default=800, help="Minimum body size in bytes")
+    parser.add_argument("--max-body", type=int, default=4000, help="Maximum body size in bytes")
+    parser.add_argument("--violation-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    parser.add_argument("--record", action="store_true", help="Also record the run in the benchmark result store")
+    parser.add_argument("--label", help="Label for the recorded run")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    corpus_options = {
+        "type_mix": parse_type_mix(args.type_mix),
+        "body_bytes": (args.min_body, args.max_body),
+        "violation_rate": args.violation_rate,
+        "seed": args.seed,
+    }
+    document = run_suite(
+        args.sizes,
+        args.only or list(BENCHMARKS),
+        repeat=args.repeat,
+        warmup=args.warmup,
+        corpus_options=corpus_options,
+    )
+    print(format_table(document), file=sys.stderr)
+
+    output = json.dumps(document, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.record:
+        from benchmarks.store import connect, record
+
+        conn = connect()
+        try:
+            run_id = record(conn, document, label=args.label)
+        finally:
+            conn.close()
+        print(f"Recorded run {run_id}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
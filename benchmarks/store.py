@@ -0,0 +1,328 @@
+"""Benchmark result store and regression detection.
+
+Results from ``benchmarks.run`` are recorded in SQLite together with the git
+commit, a machine fingerprint and the Python version. ``compare`` checks a
+candidate run against a baseline with a bootstrap confidence interval on the
+ratio of medians and exits non-zero on a significant regression, so it can
+gate merges.
+
+Usage:
+    python -m benchmarks.store record .benchmarks/results.json
+    python -m benchmarks.store list
+    python -m benchmarks.store compare --baseline <run id or commit> [--candidate latest]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / ".benchmarks" / "results.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER NOT NULL DEFAULT 0,
+    machine TEXT NOT NULL,
+    python TEXT NOT NULL,
+    label TEXT,
+    meta TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    median_s REAL NOT NULL,
+    samples TEXT NOT NULL,
+    PRIMARY KEY (run_id, name, size)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_commit ON runs(git_commit);
+"""
+
+
+def connect(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def git_state() -> tuple[str | None, bool]:
+    """Return (HEAD commit, whether tracked files have uncommitted changes)."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "diff", "--quiet", "HEAD", "--"], cwd=PROJECT_ROOT, capture_output=True
+        ).returncode != 0
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+
+def machine_fingerprint() -> str:
+    """Short hash of the hardware/OS facts that affect timings."""
+    try:
+        memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        memory = 0
+    facts = [
+        platform.system(),
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count()),
+        str(memory),
+    ]
+    return hashlib.sha1("|".join(facts).encode("utf-8")).hexdigest()[:12]
+
+
+def record(conn: sqlite3.Connection, document: dict[str, Any], label: str | None = None) -> int:
+    """Store a ``benchmarks.run`` result document; returns the new run id."""
+    commit, dirty = git_state()
+    meta = document.get("meta", {})
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO runs (created_at, git_commit, git_dirty, machine, python, label, meta) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                meta.get("created_at") or datetime.now().isoformat(timespec="seconds"),
+                commit,
+                int(dirty),
+                machine_fingerprint(),
+                meta.get("python") or platform.python_version(),
+                label,
+                json.dumps(meta),
+            ),
+        )
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO results (run_id, name, size, median_s, samples) VALUES (?, ?, ?, ?, ?)",
+            [
+                (run_id, entry["name"], entry["size"], entry["median_s"], json.dumps(entry["samples"]))
+                for entry in document.get("results", [])
+                if entry.get("status") == "ok"
+            ],
+        )
+    return run_id
+
+
+def resolve_commit(ref: str) -> str | None:
+    """Full SHA of a git ref (branch, tag, short SHA), or None if git cannot resolve it."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def resolve_run(conn: sqlite3.Connection, ref: str) -> sqlite3.Row:
+    """
+    Find a run by id, 'latest', or git ref (most recent run of that commit).
+
+    Branches and tags are resolved with ``git rev-parse``, since runs store
+    full SHAs; an all-digit ref is tried as a run id first and then as a
+    short SHA. Refs git does not know are matched as a commit prefix.
+    """
+    if ref == "latest":
+        return _one_run(conn, "SELECT * FROM runs ORDER BY id DESC LIMIT 1", (), ref)
+    if ref.isdigit():
+        row = conn.execute("SELECT * FROM runs WHERE id = ?", (int(ref),)).fetchone()
+        if row is not None:
+            return row
+    commit = resolve_commit(ref)
+    if commit:
+        row = conn.execute(
+            "SELECT * FROM runs WHERE git_commit = ? ORDER BY id DESC LIMIT 1", (commit,)
+        ).fetchone()
+        if row is not None:
+            return row
+    return _one_run(
+        conn, "SELECT * FROM runs WHERE git_commit LIKE ? ORDER BY id DESC LIMIT 1", (ref + "%",), ref
+    )
+
+
+def _one_run(conn: sqlite3.Connection, sql: str, params: tuple[Any, ...], ref: str) -> sqlite3.Row:
+    row = conn.execute(sql, params).fetchone()
+    if row is None:
+        raise LookupError(f"No benchmark run matches '{ref}'")
+    return row
+
+
+def load_samples(conn: sqlite3.Connection, run_id: int) -> dict[tuple[str, int], list[float]]:
+    rows = conn.execute("SELECT name, size, samples FROM results WHERE run_id = ?", (run_id,))
+    return {(row["name"], row["size"]): json.loads(row["samples"]) for row in rows}
+
+
+def bootstrap_ratio_ci(
+    baseline: list[float],
+    candidate: list[float],
+    confidence: float = 0.95,
+    iterations: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float, float]:
+    """Ratio of medians (candidate / baseline) with a percentile bootstrap CI."""
+    rng = random.Random(seed)
+    point = statistics.median(candidate) / statistics.median(baseline)
+    ratios = []
+    for _ in range(iterations):
+        b = statistics.median(rng.choices(baseline, k=len(baseline)))
+        c = statistics.median(rng.choices(candidate, k=len(candidate)))
+        ratios.append(c / b if b > 0 else float("inf"))
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (iterations - 1))]
+    high = ratios[int((1 - tail) * (iterations - 1))]
+    return point, low, high
+
+
+def compare_runs(
+    conn: sqlite3.Connection,
+    baseline_ref: str,
+    candidate_ref: str = "latest",
+    threshold: float = 0.05,
+    confidence: float = 0.95,
+) -> dict[str, Any]:
+    """
+    Compare every benchmark present in both runs.
+
+    A benchmark is a regression when the whole confidence interval for the
+    median ratio lies above ``1 + threshold``, and an improvement when it
+    lies below ``1 - threshold``; anything else is reported as unchanged.
+    """
+    baseline = resolve_run(conn, baseline_ref)
+    candidate = resolve_run(conn, candidate_ref)
+    base_samples = load_samples(conn, baseline["id"])
+    cand_samples = load_samples(conn, candidate["id"])
+
+    rows = []
+    for key in sorted(base_samples.keys() & cand_samples.keys()):
+        ratio, low, high = bootstrap_ratio_ci(base_samples[key], cand_samples[key], confidence)
+        if low > 1 + threshold:
+            verdict = "regression"
+        elif high < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        rows.append({
+            "name": key[0],
+            "size": key[1],
+            "baseline_median_s": statistics.median(base_samples[key]),
+            "candidate_median_s": statistics.median(cand_samples[key]),
+            "ratio": ratio,
+            "ci": [low, high],
+            "verdict": verdict,
+        })
+
+    warnings = []
+    if baseline["machine"] != candidate["machine"]:
+        warnings.append("Runs were recorded on different machines; timings may not be comparable")
+    if baseline["python"] != candidate["python"]:
+        warnings.append(f"Python versions differ ({baseline['python']} vs {candidate['python']})")
+    if candidate["git_dirty"]:
+        warnings.append("Candidate run was recorded with uncommitted changes")
+
+    return {
+        "baseline": {"id": baseline["id"], "git_commit": baseline["git_commit"]},
+        "candidate": {"id": candidate["id"], "git_commit": candidate["git_commit"]},
+        "confidence": confidence,
+        "threshold": threshold,
+        "comparisons": rows,
+        "regressions": sum(1 for row in rows if row["verdict"] == "regression"),
+        "warnings": warnings,
+    }
+
+
+def format_comparison(report: dict[str, Any]) -> str:
+    lines = [
+        f"Baseline run {report['baseline']['id']} ({(report['baseline']['git_commit'] or '?')[:10]}) "
+        f"vs candidate run {report['candidate']['id']} ({(report['candidate']['git_commit'] or '?')[:10]})",
+        f"{'Benchmark':<24} {'Size':>9} {'Base s':>9} {'Cand s':>9} {'Ratio':>7} {'CI':>17}  Verdict",
+    ]
+    for row in report["comparisons"]:
+        lines.append(
+            f"{row['name']:<24} {row['size']:>9} {row['baseline_median_s']:>9.4f} "
+            f"{row['candidate_median_s']:>9.4f} {row['ratio']:>7.3f} "
+            f"[{row['ci'][0]:>6.3f}, {row['ci'][1]:>6.3f}]  {row['verdict']}"
+        )
+    for warning in report["warnings"]:
+        lines.append(f"⚠️  {warning}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Store and compare benchmark results")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Results database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_record = sub.add_parser("record", help="Record a benchmarks.run JSON result file")
+    p_record.add_argument("path", help="Result file ('-' for stdin)")
+    p_record.add_argument("--label", help="Free-form label for the run")
+
+    p_list = sub.add_parser("list", help="List recorded runs")
+    p_list.add_argument("--limit", type=int, default=20)
+
+    p_compare = sub.add_parser("compare", help="Compare a candidate run against a baseline")
+    p_compare.add_argument("--baseline", required=True, help="Run id, git commit prefix, or 'latest'")
+    p_compare.add_argument("--candidate", default="latest", help="Run id, git commit prefix, or 'latest'")
+    p_compare.add_argument("--threshold", type=float, default=0.05, help="Ignore changes smaller than this fraction")
+    p_compare.add_argument("--confidence", type=float, default=0.95)
+    p_compare.add_argument("--json", action="store_true", help="Output the comparison as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    conn = connect(Path(args.db))
+    try:
+        if args.command == "record":
+            text = sys.stdin.read() if args.path == "-" else Path(args.path).read_text(encoding="utf-8")
+            run_id = record(conn, json.loads(text), label=args.label)
+            print(f"Recorded run {run_id}")
+            return 0
+
+        if args.command == "list":
+            rows = conn.execute(
+                "SELECT r.*, COUNT(x.name) AS benchmarks FROM runs r "
+                "LEFT JOIN results x ON x.run_id = r.id GROUP BY r.id ORDER BY r.id DESC LIMIT ?",
+                (args.limit,),
+            )
+            for row in rows:
+                commit = (row["git_commit"] or "?")[:10] + ("+" if row["git_dirty"] else "")
+                print(
+                    f"{row['id']:>5}  {row['created_at']}  {commit:<11}  py{row['python']:<8} "
+                    f"{row['machine']}  {row['benchmarks']} result(s)  {row['label'] or ''}"
+                )
+            return 0
+
+        try:
+            report = compare_runs(conn, args.baseline, args.candidate, args.threshold, args.confidence)
+        except LookupError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 2
+        print(json.dumps(report, indent=2) if args.json else format_comparison(report))
+        return 1 if report["regressions"] else 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -54,6 +54,47 @@ export interface TrackingStatus {
   error?: string;
 }
 
+export type TrackingKind = 'plans' | 'experiments' | 'debug' | 'refactors';
+
+export interface TrackingPage<T = Record<string, any>> {
+  items: T[];
+  total: number;
+  limit: number;
+  offset: number;
+  source: 'database' | 'demo';
+}
+
+export interface TrackingQuery {
+  status?: string;
+  owner?: string; // plans and experiments only
+  q?: string;
+  limit?: number;
+  offset?: number;
+}
+
+export interface DashboardSummary {
+  status?: BridgeStatus;
+  stats?: Record<string, any>;
+  compliance?: Record<string, number>;
+  tracking?: TrackingStatus;
+  git_branch?: { branch: string; error?: string };
+  demo_mode?: Record<string, any>;
+  generated_in_ms: number;
+}
+
+export interface ToolRun {
+  run_id: string;
+  tool_id: string;
+  status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled' | 'timed_out' | 'error';
+  strategy?: string | null;
+  exit_code?: number | null;
+  success: boolean;
+  error?: string | null;
+  stdout?: string;
+  stderr?: string;
+  cached?: boolean;
+}
+
 export interface ArtifactListResponse {
   items: Artifact[];
   total: number;
@@ -225,5 +266,68 @@ export const bridgeService = {
   getTrackingStatus: async (kind: string = 'all'): Promise<TrackingStatus> => {
     const params = new URLSearchParams({ kind });
     return fetchJson<TrackingStatus>(`/v1/tracking/status?${params.toString()}`);
+  },
+
+  /**
+   * List tracking rows (plans, experiments, debug sessions or refactors) a page at a time.
+   */
+  listTracking: async <T = Record<string, any>>(kind: TrackingKind, query: TrackingQuery = {}): Promise<TrackingPage<T>> => {
+    const params = new URLSearchParams();
+    Object.entries(query).forEach(([name, value]) => {
+      if (value !== undefined && value !== '') params.set(name, String(value));
+    });
+    return fetchJson<TrackingPage<T>>(`/v1/tracking/${kind}?${params.toString()}`);
+  },
+
+  /**
+   * Start a tool run without waiting for it to finish.
+   */
+  startToolRun: async (tool_id: string, args: Record<string, any>): Promise<ToolRun> => {
+    return fetchJson<ToolRun>('/v1/tools/runs', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ tool_id, args }),
+    });
+  },
+
+  /**
+   * Follow a tool run's output as it is produced (Server-Sent Events).
+   * Returns a function that stops following; the run itself keeps going.
+   */
+  streamToolRun: (
+    runId: string,
+    onLine: (stream: 'stdout' | 'stderr', text: string) => void,
+    onEnd: (run: ToolRun) => void
+  ): (() => void) => {
+    const source = new EventSource(`${API_URL}/v1/tools/runs/${runId}/stream`);
+    const handle = (stream: 'stdout' | 'stderr') => (event: MessageEvent) => {
+      onLine(stream, JSON.parse(event.data).text);
+    };
+    source.addEventListener('stdout', handle('stdout'));
+    source.addEventListener('stderr', handle('stderr'));
+    source.addEventListener('end', (event: MessageEvent) => {
+      source.close();
+      onEnd(JSON.parse(event.data));
+    });
+    return () => source.close();
+  },
+
+  /**
+   * Cancel a running tool.
+   */
+  cancelToolRun: async (runId: string): Promise<ToolRun> => {
+    return fetchJson<ToolRun>(`/v1/tools/runs/${runId}/cancel`, { method: 'POST' });
+  },
+
+  /**
+   * Get everything the dashboard needs on load in one request.
+   * Pass a subset of sections to skip the ones a view does not use.
+   */
+  getDashboardSummary: async (fields?: string[], trackingKind: string = 'all'): Promise<DashboardSummary> => {
+    const params = new URLSearchParams({ tracking_kind: trackingKind });
+    if (fields && fields.length) {
+      params.set('fields', fields.join(','));
+    }
+    return fetchJson<DashboardSummary>(`/v1/dashboard/summary?${params.toString()}`);
   }
 };